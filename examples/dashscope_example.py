@@ -8,8 +8,10 @@
 包括 function calling (工具调用) 功能。
 """
 
+import asyncio
 import os
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 
 # 添加项目路径
@@ -17,12 +19,34 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
 from work_agent.config import load_config
-from work_agent.container import build_container, set_global_container
+from work_agent.container import build_batch_submitter, build_container, set_global_container
 from work_agent.logging import configure_logging
 
+DASHSCOPE_API_BASE = "https://dashscope.aliyuncs.com/compatible-mode/v1"
 
-def setup_dashscope_config():
-    """配置 DashScope 环境变量"""
+MULTI_TURN_QUERIES = [
+    "我想了解一下北京的情况",
+    "现在几点了？",
+    "帮我查一下北京的天气",
+]
+
+
+@dataclass(frozen=True)
+class DashscopeEnv:
+    """示例脚本用到的环境变量快照（只读取一次）"""
+
+    api_key: str
+    model: str
+    weather_key: str
+    log_level: str
+
+
+def setup_dashscope_config() -> DashscopeEnv:
+    """配置 DashScope 环境变量
+
+    Returns:
+        DashscopeEnv: 环境变量快照，供后续测试函数复用
+    """
 
     # DashScope API 配置
     # 从环境变量读取，或使用默认值
@@ -38,24 +62,34 @@ def setup_dashscope_config():
         print("  https://dashscope.console.aliyun.com/apiKey")
         sys.exit(1)
 
-    # 设置 OpenAI 兼容配置
-    # DashScope 提供 OpenAI 兼容的 API 端点
-    os.environ["OPENAI_API_KEY"] = dashscope_key
-    os.environ["OPENAI_API_BASE"] = "https://dashscope.aliyuncs.com/compatible-mode/v1"
-
     # 选择模型 (支持 function calling 的模型)
     # qwen-plus: 通用场景，性能强（推荐）
     # qwen-turbo: 快速响应
     # qwen-max: 复杂任务，最强性能
     # qwen-long: 长文本处理
-    model = os.getenv("AGENT_MODEL", "qwen-plus")
-    os.environ["AGENT_MODEL"] = model
+    env = DashscopeEnv(
+        api_key=dashscope_key,
+        model=os.getenv("AGENT_MODEL", "qwen-plus"),
+        weather_key=os.getenv("WEATHER_API_KEY", ""),
+        log_level=os.getenv("LOG_LEVEL", "INFO"),
+    )
+
+    # 设置 OpenAI 兼容配置（一次性写入）
+    # DashScope 提供 OpenAI 兼容的 API 端点
+    os.environ.update(
+        {
+            "OPENAI_API_KEY": env.api_key,
+            "OPENAI_API_BASE": DASHSCOPE_API_BASE,
+            "AGENT_MODEL": env.model,
+        }
+    )
 
     print("🔧 DashScope 配置:")
-    print(f"  API Base: https://dashscope.aliyuncs.com/compatible-mode/v1")
-    print(f"  模型: {model}")
-    print(f"  API Key: {dashscope_key[:10]}...{dashscope_key[-4:]}")
+    print(f"  API Base: {DASHSCOPE_API_BASE}")
+    print(f"  模型: {env.model}")
+    print(f"  API Key: {env.api_key[:10]}...{env.api_key[-4:]}")
     print()
+    return env
 
 
 def test_basic_conversation(container):
@@ -73,7 +107,7 @@ def test_basic_conversation(container):
     print()
 
 
-def test_tool_calling(container):
+def test_tool_calling(container, env: DashscopeEnv):
     """测试工具调用功能"""
     print("=" * 60)
     print("测试 2: 工具调用 (Function Calling)")
@@ -89,8 +123,7 @@ def test_tool_calling(container):
     print()
 
     # 测试天气工具（需要配置 WEATHER_API_KEY）
-    weather_key = os.getenv("WEATHER_API_KEY", "")
-    if weather_key:
+    if env.weather_key:
         query2 = "查询北京的天气"
         print(f"查询 2: {query2}")
         print()
@@ -113,13 +146,7 @@ def test_multi_turn_conversation(container):
     # 注意: run_once 不保存对话历史
     # 如需多轮对话，使用 repl 模式或自行管理 session
 
-    queries = [
-        "我想了解一下北京的情况",
-        "现在几点了？",
-        "帮我查一下北京的天气",
-    ]
-
-    for i, query in enumerate(queries, 1):
+    for i, query in enumerate(MULTI_TURN_QUERIES, 1):
         print(f"\n第 {i} 轮:")
         print(f"查询: {query}")
         print()
@@ -129,17 +156,34 @@ def test_multi_turn_conversation(container):
         print()
 
 
+def submit_batch(config) -> None:
+    """通过 Batch API 提交示例问题（离线处理，成本更低）"""
+    print("=" * 60)
+    print("Batch 模式: 异步提交示例问题")
+    print("=" * 60)
+
+    submitter = build_batch_submitter(config)
+
+    async def _submit() -> str:
+        try:
+            return await submitter.submit(MULTI_TURN_QUERIES)
+        finally:
+            await submitter.aclose()
+
+    batch_id = asyncio.run(_submit())
+    print(f"✅ 已提交 {len(MULTI_TURN_QUERIES)} 个请求, batch id: {batch_id}")
+    print()
+
+
 def list_available_tools(container):
     """列出可用的工具"""
     print("=" * 60)
     print("可用的工具列表")
     print("=" * 60)
 
-    tools = container.tools
-    print(f"\n共 {len(tools)} 个工具:\n")
+    print(f"\n共 {container.tool_count} 个工具:\n")
 
-    for tool in tools:
-        name = getattr(tool, "name", "unknown")
+    for name, tool in zip(container.tool_names, container.tools, strict=True):
         description = getattr(tool, "description", "No description")
         print(f"  • {name}")
         print(f"    {description}")
@@ -152,18 +196,26 @@ def main():
     print()
 
     # 1. 配置 DashScope
-    setup_dashscope_config()
+    env = setup_dashscope_config()
 
     # 2. 配置日志
-    log_level = os.getenv("LOG_LEVEL", "INFO")
-    configure_logging(log_level)
+    configure_logging(env.log_level)
+
+    config = load_config()
+
+    # Batch 模式：仅提交批量任务，不运行交互式测试
+    if "--batch" in sys.argv[1:]:
+        submit_batch(config)
+        return
 
     # 3. 构建容器
     print("正在构建 Agent 容器...")
-    config = load_config()
     container = build_container(config)
     set_global_container(container)
-    print(f"✅ 容器构建成功，加载了 {len(container.tools)} 个工具")
+
+    # 预热 SDK 客户端连接（DNS/TLS），降低首次查询延迟
+    container.agent_service.warmup()
+    print(f"✅ 容器构建成功，加载了 {container.tool_count} 个工具")
     print()
 
     # 4. 列出可用工具
@@ -175,7 +227,7 @@ def main():
         test_basic_conversation(container)
 
         # 工具调用
-        test_tool_calling(container)
+        test_tool_calling(container, env)
 
         # 多轮对话
         test_multi_turn_conversation(container)
@@ -193,6 +245,7 @@ def main():
     except Exception as e:
         print(f"❌ 错误: {e}")
         import traceback
+
         traceback.print_exc()
         sys.exit(1)
 
@@ -63,36 +63,33 @@ def test_vllm_agent(
     """
     logger = logging.getLogger(__name__)
 
-    # 1. 设置环境变量（OpenAI SDK 会读取这些）
-    os.environ["OPENAI_API_KEY"] = api_key
-    os.environ["OPENAI_API_BASE"] = base_url
-    os.environ["AGENT_MODEL"] = model
+    # 1. 设置环境变量（OpenAI SDK 会读取这些，一次性写入）
+    # vLLM 不校验 key，使用占位值通过配置校验
+    os.environ.update(
+        {
+            "OPENAI_API_KEY": "sk-vllm-placeholder-key" if api_key == "EMPTY" else api_key,
+            "OPENAI_API_BASE": base_url,
+            "AGENT_MODEL": model,
+        }
+    )
 
     logger.info("=" * 60)
     logger.info("vLLM Agent 测试")
     logger.info("=" * 60)
-    logger.info(f"Base URL: {base_url}")
-    logger.info(f"Model: {model}")
-    logger.info(f"Query: {query}")
+    logger.info("Base URL: %s", base_url)
+    logger.info("Model: %s", model)
+    logger.info("Query: %s", query)
     logger.info("=" * 60)
 
     # 2. 加载配置
     try:
-        # 临时修改环境变量绕过 API key 校验
-        original_key_check = os.environ.get("OPENAI_API_KEY")
-        if api_key == "EMPTY":
-            # 设置一个占位值来通过校验
-            os.environ["OPENAI_API_KEY"] = "sk-vllm-placeholder-key"
-
         # 重新加载配置以应用 base_url
         from work_agent.config import Config
-        config = Config()  # type: ignore
 
-        # 恢复原始设置
-        os.environ["OPENAI_API_KEY"] = api_key
+        config = Config()  # type: ignore
 
     except Exception as e:
-        logger.error(f"配置加载失败: {e}")
+        logger.error("配置加载失败: %s", e)
         logger.info("\n请确保设置了 WEATHER_API_KEY 环境变量")
         return
 
@@ -101,21 +98,23 @@ def test_vllm_agent(
         logger.info("\n正在构建依赖容器...")
         container = build_container(config)
         set_global_container(container)
-        logger.info(f"✅ 成功加载 {len(container.tools)} 个工具")
+
+        # 预热 SDK 客户端连接（DNS/TLS），降低首次查询延迟
+        container.agent_service.warmup()
+        logger.info("✅ 成功加载 %d 个工具", container.tool_count)
 
         # 列出可用工具
         logger.info("\n可用的工具:")
-        for tool in container.tools:
-            name = getattr(tool, "name", "unknown")
-            logger.info(f"  • {name}")
+        for name in container.tool_names:
+            logger.info("  • %s", name)
 
     except Exception as e:
-        logger.error(f"容器构建失败: {e}", exc_info=True)
+        logger.error("容器构建失败: %s", e, exc_info=True)
         return
 
     # 4. 运行查询
     try:
-        logger.info(f"\n正在执行查询: {query}")
+        logger.info("\n正在执行查询: %s", query)
         logger.info("-" * 60)
 
         result = container.agent_service.run_once(query)
@@ -127,7 +126,7 @@ def test_vllm_agent(
         logger.info("=" * 60)
 
     except Exception as e:
-        logger.error(f"查询执行失败: {e}", exc_info=True)
+        logger.error("查询执行失败: %s", e, exc_info=True)
         logger.info("\n可能的原因:")
         logger.info("  1. vLLM 服务未启动或无法访问")
         logger.info("  2. 模型不支持 function calling")
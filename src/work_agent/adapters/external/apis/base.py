@@ -2,14 +2,18 @@
 
 提供统一的 API 客户端接口，所有 API 客户端应继承此基类。
 """
+
 import logging
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, TypeVar
 
 from work_agent.utils.api_client import ApiClient
 
 logger = logging.getLogger(__name__)
 
+# 子类在 async with 中得到自身类型（Python 3.10 无 typing.Self）
+_ClientT = TypeVar("_ClientT", bound="BaseApiClient")
+
 
 class BaseApiClient(ABC):
     """API 客户端基类
@@ -18,6 +22,7 @@ class BaseApiClient(ABC):
     - 提供统一的初始化接口
     - 封装通用的认证逻辑
     - 提供统一的错误处理模式
+    - 管理底层连接池的生命周期（``aclose()`` / ``async with``）
     """
 
     def __init__(
@@ -45,7 +50,7 @@ class BaseApiClient(ABC):
             retry_delay=retry_delay,
             verify_ssl=verify_ssl,
         )
-        logger.info(f"Initialized {self.__class__.__name__} with base_url={base_url}")
+        logger.info("Initialized %s with base_url=%s", self.__class__.__name__, base_url)
 
     def set_auth_token(self, token: str) -> None:
         """设置 Bearer Token 认证
@@ -54,7 +59,7 @@ class BaseApiClient(ABC):
             token: 认证 token
         """
         self.client.set_bearer_token(token)
-        logger.debug(f"Set auth token for {self.__class__.__name__}")
+        logger.debug("Set auth token for %s", self.__class__.__name__)
 
     def set_api_key(self, key_name: str, api_key: str) -> None:
         """设置 API Key（通过请求头）
@@ -64,7 +69,18 @@ class BaseApiClient(ABC):
             api_key: API Key 值
         """
         self.client.set_header(key_name, api_key)
-        logger.debug(f"Set API key '{key_name}' for {self.__class__.__name__}")
+        logger.debug("Set API key '%s' for %s", key_name, self.__class__.__name__)
+
+    async def aclose(self) -> None:
+        """关闭底层 HTTP 连接池"""
+        await self.client.aclose()
+        logger.debug("Closed %s", self.__class__.__name__)
+
+    async def __aenter__(self: _ClientT) -> _ClientT:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
 
     @abstractmethod
     async def health_check(self) -> bool:
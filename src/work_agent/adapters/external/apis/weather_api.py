@@ -1,12 +1,79 @@
 """## Weather API 客户端"""
+
+import asyncio
 import logging
-from typing import Any
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from http import HTTPStatus
+from typing import Generic, TypeVar
 
 from work_agent.adapters.external.apis.base import BaseApiClient
-from work_agent.utils.api_client import ApiResponse
+from work_agent.adapters.external.models.weather import WeatherFields
+from work_agent.utils.api_client import ApiClientError, ApiResponse
 
 logger = logging.getLogger(__name__)
 
+# 中文城市名的 "市" 后缀（"北京市" 与 "北京" 是同一城市），归一化时去除。
+# 不去除英文 "city"："Mexico City" / "Mexico"、"Kuwait City" / "Kuwait" 是不同地点
+_CITY_SUFFIX_RE = re.compile(r"\s*市$")
+
+
+def _normalize_city(city: str) -> str:
+    """归一化城市名，用作缓存 / 并发合并的 key
+
+    Args:
+        city: 原始城市名
+
+    Returns:
+        去除首尾空白、统一小写并去掉 "市" 后缀的城市名
+    """
+    normalized = _CITY_SUFFIX_RE.sub("", city.strip().lower())
+    return normalized or city.strip().lower()
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class _TTLCache(Generic[K, V]):
+    """LRU + TTL 响应缓存
+
+    超过 ttl 的条目在读取时失效，条目数超过 maxsize 时淘汰最久未使用的条目。
+    非线程安全：仅应在单个事件循环内使用。
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """读取未过期的缓存值，不存在或已过期时返回 None"""
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """写入缓存值"""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """清空缓存"""
+        self._data.clear()
+
 
 class WeatherApiClient(BaseApiClient):
     """## Weather API 客户端封装
@@ -15,6 +82,8 @@ class WeatherApiClient(BaseApiClient):
     - 封装 Weather API 调用细节
     - 处理认证
     - 返回结构化数据
+    - 缓存近期查询结果（天气数据约 10 分钟内不变）
+    - 合并并发的相同查询（single-flight），同一时刻只发出一个 HTTP 请求
     """
 
     def __init__(
@@ -23,7 +92,19 @@ class WeatherApiClient(BaseApiClient):
         api_key: str = "",
         timeout: float = 30.0,
         retry_count: int = 2,
+        cache_ttl: float = 600.0,
+        cache_maxsize: int = 256,
     ) -> None:
+        """初始化 Weather API 客户端
+
+        Args:
+            base_url: API 基础 URL
+            api_key: OpenWeatherMap API Key
+            timeout: 请求超时时间（秒）
+            retry_count: 失败重试次数
+            cache_ttl: 响应缓存有效期（秒），<= 0 时禁用缓存
+            cache_maxsize: 响应缓存最大条目数
+        """
         super().__init__(
             base_url=base_url,
             timeout=timeout,
@@ -33,37 +114,69 @@ class WeatherApiClient(BaseApiClient):
         # OpenWeatherMap API 使用 appid 参数进行认证
         self.api_key = api_key
 
+        self._cache: _TTLCache[tuple[str, str], WeatherFields] | None = (
+            _TTLCache(maxsize=cache_maxsize, ttl=cache_ttl) if cache_ttl > 0 else None
+        )
+        self._inflight: dict[tuple[str, str], asyncio.Task[WeatherFields]] = {}
+
     async def health_check(self) -> bool:
         """健康检查
 
+        使用 HEAD 请求探测服务，不下载/解析响应体；同时预热连接池中的
+        keep-alive 连接，随后的真实查询可跳过 TCP/TLS 握手。
+
         Returns:
-            服务是否可用
+            服务是否可用（2xx/3xx 视为可用；405 表示服务端不支持 HEAD，同样视为可用）
         """
         try:
-            # 使用一个简单的查询来检查 API 是否可用
-            response = await self.client.get(
+            response = await self.client.head(
                 "/weather",
                 params={"q": "London", "appid": self.api_key},
             )
-            return response.ok
+            status_code = response.status_code
+            return 200 <= status_code < 400 or status_code == HTTPStatus.METHOD_NOT_ALLOWED
         except Exception as e:
-            logger.error(f"Health check failed: {e}")
+            logger.error("Health check failed: %s", e)
             return False
 
-    async def get_weather(self, city: str, units: str = "metric") -> dict[str, Any]:
+    async def get_weather(self, city: str, units: str = "metric") -> WeatherFields:
         """获取城市天气信息
 
+        响应解析后只保留摘要所需字段，缓存中也只存放这一紧凑结构。
+
         Args:
             city: 城市名称（中文或英文，如 "北京", "Beijing", "New York"）
             units: 单位系统（metric=摄氏度, imperial=华氏度, standard=开尔文）
 
         Returns:
-            API 响应数据，包含天气详情
+            WeatherFields 天气字段
 
         Raises:
-            ApiClientError: API 调用失败
+            ApiClientError: API 调用失败或响应缺少必要字段
         """
-        logger.info(f"Fetching weather for city={city}, units={units}")
+        # key 使用归一化城市名，请求 API 时仍使用原始输入
+        key = (_normalize_city(city), units)
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                logger.debug("Weather cache hit for city=%s, units=%s", city, units)
+                return cached
+
+        # 合并并发的相同查询：后到的调用者复用进行中的请求
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._fetch_weather(key, city, units))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._discard_inflight(key, done))
+        else:
+            logger.debug("Joining in-flight weather request for city=%s, units=%s", city, units)
+
+        # shield: 单个调用者被取消时不影响其他等待同一请求的调用者
+        return await asyncio.shield(task)
+
+    async def _fetch_weather(self, key: tuple[str, str], city: str, units: str) -> WeatherFields:
+        """发起天气查询 HTTP 请求，解析为 WeatherFields 并写入缓存"""
+        logger.info("Fetching weather for city=%s, units=%s", city, units)
 
         response = await self.client.get(
             "/weather",
@@ -71,4 +184,16 @@ class WeatherApiClient(BaseApiClient):
             raise_for_status=True,
         )
 
-        return response.body
+        try:
+            fields = WeatherFields.from_payload(response.body)
+        except (KeyError, IndexError, TypeError) as e:
+            raise ApiClientError(f"Unexpected weather payload for {city}: {e!r}") from e
+
+        if self._cache is not None:
+            self._cache.set(key, fields)
+        return fields
+
+    def _discard_inflight(self, key: tuple[str, str], task: "asyncio.Task[WeatherFields]") -> None:
+        """请求结束后移除 in-flight 记录（仅当记录仍指向该请求时）"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
@@ -0,0 +1,39 @@
+"""Weather API 响应模型"""
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True, frozen=True)
+class WeatherFields:
+    """天气摘要所需的字段（从完整响应中裁剪，slots 紧凑存储）"""
+
+    temp: float
+    feels_like: float
+    humidity: int
+    pressure: int
+    description: str
+    wind_speed: float
+
+    @classmethod
+    def from_payload(cls, data: dict[str, Any]) -> "WeatherFields":
+        """从 Weather API 响应数据中提取字段
+
+        Args:
+            data: Weather API 响应数据
+
+        Returns:
+            WeatherFields 实例
+
+        Raises:
+            KeyError: 响应缺少必要字段
+        """
+        main = data["main"]
+        return cls(
+            temp=main["temp"],
+            feels_like=main["feels_like"],
+            humidity=main["humidity"],
+            pressure=main["pressure"],
+            description=data["weather"][0]["description"],
+            wind_speed=data["wind"]["speed"],
+        )
@@ -1,8 +1,10 @@
 """## Weather 业务服务层"""
+
+import asyncio
 import logging
-from typing import Any
 
 from work_agent.adapters.external.apis.weather_api import WeatherApiClient
+from work_agent.adapters.external.models.weather import WeatherFields
 from work_agent.domain.errors import DomainError
 from work_agent.utils.api_client import ApiClientError
 
@@ -11,6 +13,7 @@ logger = logging.getLogger(__name__)
 
 class WeatherServiceError(DomainError):
     """## Weather 服务异常"""
+
     pass
 
 
@@ -39,33 +42,78 @@ class WeatherService:
             WeatherServiceError: 操作失败
         """
         try:
-            logger.info(f"Fetching weather summary for city={city}")
+            logger.info("Fetching weather summary for city=%s", city)
 
             # 调用 API
-            data = await self.api.get_weather(city)
-
-            # 提取数据
-            temp = data["main"]["temp"]
-            feels_like = data["main"]["feels_like"]
-            humidity = data["main"]["humidity"]
-            pressure = data["main"]["pressure"]
-            desc = data["weather"][0]["description"]
-            wind_speed = data["wind"]["speed"]
-
-            # 格式化输出
-            result = f"🌤️ {city} 天气情况:\n\n"
-            result += f"温度: {temp}°C (体感: {feels_like}°C)\n"
-            result += f"天气: {desc}\n"
-            result += f"湿度: {humidity}%\n"
-            result += f"气压: {pressure} hPa\n"
-            result += f"风速: {wind_speed} m/s\n"
-
-            return result
+            fields = await self.api.get_weather(city)
+
+            return self._format(city, fields)
 
         except ApiClientError as e:
-            logger.error(f"Failed to fetch weather: {e}", exc_info=True)
+            logger.error("Failed to fetch weather: %s", e, exc_info=True)
             raise WeatherServiceError(f"获取天气失败: {e}") from e
 
+    async def get_weather_summaries_bulk(
+        self, cities: list[str], max_concurrency: int = 4
+    ) -> list[str]:
+        """批量获取天气摘要（并发请求）
+
+        所有城市的请求通过 asyncio.gather 并发发出，总耗时约为最慢的单次请求，
+        而不是所有请求耗时之和。单个城市失败不影响其他城市。
+        同时进行的请求数受 max_concurrency 限制，避免触发上游限流。
+
+        Args:
+            cities: 城市名称列表
+            max_concurrency: 最大并发请求数
+
+        Returns:
+            与 cities 顺序一致的天气摘要列表；失败的城市返回错误描述
+        """
+        logger.info("Fetching weather summaries for %s cities", len(cities))
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(city: str) -> WeatherFields:
+            async with semaphore:
+                return await self.api.get_weather(city)
+
+        results = await asyncio.gather(
+            *(fetch(city) for city in cities),
+            return_exceptions=True,
+        )
+
+        summaries: list[str] = []
+        for city, result in zip(cities, results, strict=True):
+            if isinstance(result, ApiClientError):
+                logger.error("Failed to fetch weather for city=%s: %s", city, result)
+                summaries.append(f"❌ {city}: 获取天气失败: {result}")
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                summaries.append(self._format(city, result))
+
+        return summaries
+
+    @staticmethod
+    def _format(city: str, fields: WeatherFields) -> str:
+        """格式化天气数据
+
+        Args:
+            city: 城市名称
+            fields: 天气摘要字段
+
+        Returns:
+            格式化的天气信息字符串
+        """
+        return (
+            f"🌤️ {city} 天气情况:\n\n"
+            f"温度: {fields.temp}°C (体感: {fields.feels_like}°C)\n"
+            f"天气: {fields.description}\n"
+            f"湿度: {fields.humidity}%\n"
+            f"气压: {fields.pressure} hPa\n"
+            f"风速: {fields.wind_speed} m/s\n"
+        )
+
 
 async def main() -> None:
     """测试 Weather 服务
@@ -73,7 +121,6 @@ async def main() -> None:
     使用方法:
         python -m work_agent.adapters.external.services.weather_service
     """
-    import asyncio
     import os
 
     # 配置日志
@@ -84,9 +131,7 @@ async def main() -> None:
 
     # 从环境变量读取配置
     api_key = os.getenv("WEATHER_API_KEY", "")
-    base_url = os.getenv(
-        "WEATHER_API_BASE_URL", "https://api.openweathermap.org/data/2.5"
-    )
+    base_url = os.getenv("WEATHER_API_BASE_URL", "https://api.openweathermap.org/data/2.5")
 
     if not api_key:
         print("❌ 错误: 未设置 WEATHER_API_KEY 环境变量")
@@ -99,57 +144,52 @@ async def main() -> None:
     print(f"  API Base URL: {base_url}")
     print(f"  API Key: {api_key[:10]}...{api_key[-4:]}\n")
 
-    # 创建 API 客户端
-    api_client = WeatherApiClient(
+    # 创建 API 客户端（退出时自动关闭连接池）
+    async with WeatherApiClient(
         base_url=base_url,
         api_key=api_key,
         timeout=10.0,
-    )
+    ) as api_client:
+        # 创建服务
+        service = WeatherService(api_client)
 
-    # 创建服务
-    service = WeatherService(api_client)
-
-    # 测试健康检查
-    print("=== 健康检查 ===")
-    try:
-        is_healthy = await api_client.health_check()
-        if is_healthy:
-            print("✅ API 服务正常\n")
-        else:
-            print("❌ API 服务异常\n")
+        # 测试健康检查
+        print("=== 健康检查 ===")
+        try:
+            is_healthy = await api_client.health_check()
+            if is_healthy:
+                print("✅ API 服务正常\n")
+            else:
+                print("❌ API 服务异常\n")
+                return
+        except Exception as e:
+            print(f"❌ 健康检查失败: {e}\n")
             return
-    except Exception as e:
-        print(f"❌ 健康检查失败: {e}\n")
-        return
 
-    # 测试查询多个城市
-    print("=== 天气查询测试 ===\n")
-    test_cities = [
-        "Beijing",
-        "Shanghai",
-        "Tokyo",
-        "New York",
-        "London",
-        "Paris",
-    ]
-
-    for city in test_cities:
+        # 测试查询多个城市
+        print("=== 天气查询测试 ===\n")
+        test_cities = [
+            "Beijing",
+            "Shanghai",
+            "Tokyo",
+            "New York",
+            "London",
+            "Paris",
+        ]
+
+        print(f"并发查询 {len(test_cities)} 个城市...\n")
         try:
-            print(f"查询 {city}...")
-            result = await service.get_weather_summary(city)
-            print(result)
-            print("-" * 50)
-            # 避免请求过快
-            await asyncio.sleep(0.5)
-        except WeatherServiceError as e:
-            print(f"❌ 查询 {city} 失败: {e}\n")
+            results = await service.get_weather_summaries_bulk(test_cities)
         except Exception as e:
             print(f"❌ 未知错误: {e}\n")
+            return
 
-    print("\n✅ 测试完成")
+        for result in results:
+            print(result)
+            print("-" * 50)
 
+        print("\n✅ 测试完成")
 
-if __name__ == "__main__":
-    import asyncio
 
+if __name__ == "__main__":
     asyncio.run(main())
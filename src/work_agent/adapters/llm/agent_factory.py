@@ -1,17 +1,19 @@
 """Agent 工厂 - 根据配置构建不同的 Agent 后端"""
 
 import logging
+import sys
+from collections.abc import Sequence
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 from work_agent.adapters.llm.base_agent import BaseAgent
-from work_agent.adapters.llm.openai_agent_adapter import OpenAIAgentAdapter
-from work_agent.adapters.llm.qwen_agent_adapter import QwenAgentAdapter
 from work_agent.config import Config
 
 logger = logging.getLogger(__name__)
 
-# Agent 默认指令
-DEFAULT_INSTRUCTIONS = """你是一个日常工作助理 Agent。
+# Agent 默认指令（intern 后所有 Agent 实例共享同一字符串对象）
+DEFAULT_INSTRUCTIONS = sys.intern("""你是一个日常工作助理 Agent。
 
 你的职责：
 1. 理解用户的需求和问题
@@ -26,48 +28,109 @@ DEFAULT_INSTRUCTIONS = """你是一个日常工作助理 Agent。
 - 遇到错误时，解释原因并提供建议
 
 请始终保持专业、友好、高效。
-"""
+""")
 
 
-def build_agent(config: Config, tools: list[Any]) -> BaseAgent:
+@lru_cache(maxsize=8)
+def _load_instructions(path: str) -> str:
+    """从文件加载指令（每个路径只读取一次）
+
+    Args:
+        path: 指令文件路径
+
+    Returns:
+        指令内容
+
+    Raises:
+        OSError: 文件无法读取
+    """
+    return sys.intern(Path(path).read_text(encoding="utf-8"))
+
+
+@lru_cache(maxsize=32)
+def _build_instructions(base: str, extra: str) -> str:
+    """在基础指令后追加额外指令（相同输入复用同一字符串）
+
+    Args:
+        base: 基础指令
+        extra: 追加的指令内容
+
+    Returns:
+        完整指令
+    """
+    return sys.intern(f"{base}\n{extra}")
+
+
+def build_agent(
+    config: Config,
+    tools: Sequence[Any],
+    instructions_extra: str | None = None,
+    openai_client: Any = None,
+    runner: Any = None,
+    loop: Any = None,
+) -> BaseAgent:
     """
     根据配置构建 Agent 实例
 
     Args:
         config: 配置对象
         tools: 工具列表
+        instructions_extra: 追加到默认指令之后的额外指令（可选）
+        openai_client: 共享的 AsyncOpenAI 客户端（openai 后端使用，可选）
+        runner: 共享的 Runner 实例（openai 后端使用，可选）
+        loop: 常驻事件循环（qwen 后端执行异步工具使用，可选）
 
     Returns:
         BaseAgent: Agent 实例（OpenAI 或 Qwen 后端）
     """
     # 获取后端类型（默认为 openai）
-    backend = getattr(config, 'agent_backend', 'openai')
+    backend = getattr(config, "agent_backend", "openai")
 
-    logger.info(f"Building agent with backend: {backend}")
-    logger.info(f"Agent model: {config.agent_model}")
-    logger.info(f"Agent tools count: {len(tools)}")
+    logger.info("Building agent with backend: %s", backend)
+    logger.info("Agent model: %s", config.agent_model)
+    logger.info("Agent tools count: %s", len(tools))
+
+    if config.agent_instructions_file:
+        base_instructions = _load_instructions(config.agent_instructions_file)
+        logger.info("Agent instructions loaded from: %s", config.agent_instructions_file)
+    else:
+        base_instructions = DEFAULT_INSTRUCTIONS
+    instructions = (
+        _build_instructions(base_instructions, instructions_extra)
+        if instructions_extra
+        else base_instructions
+    )
 
     # 根据后端类型创建对应的 Agent
+    # 后端适配器按需导入：只加载所选后端的 SDK（qwen_agent 等较重且可能未安装）
     if backend == "openai":
+        from work_agent.adapters.llm.openai_agent_adapter import OpenAIAgentAdapter
+
         agent = OpenAIAgentAdapter(
             model=config.agent_model,
-            instructions=DEFAULT_INSTRUCTIONS,
+            instructions=instructions,
             api_key=config.openai_api_key,
             api_base=config.openai_api_base,
             timeout=config.agent_timeout,
+            client=openai_client,
+            runner=runner,
         )
     elif backend == "qwen":
+        from work_agent.adapters.llm.qwen_agent_adapter import QwenAgentAdapter
+
         agent = QwenAgentAdapter(
             model=config.agent_model,
-            instructions=DEFAULT_INSTRUCTIONS,
+            instructions=instructions,
             api_key=config.dashscope_api_key,
+            loop=loop,
         )
     else:
         raise ValueError(f"Unsupported agent backend: {backend}")
 
     # 添加工具
-    for tool in tools:
-        agent.add_tool(tool)
+    agent.add_tools(tools)
+    agent.finalize()
+    agent.set_max_concurrency(config.agent_max_concurrency)
 
-    logger.info(f"Agent built successfully with {len(tools)} tools")
+    logger.info("Agent built successfully with %s tools", len(tools))
     return agent
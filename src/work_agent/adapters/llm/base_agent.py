@@ -1,6 +1,9 @@
 """Agent 抽象基类 - 定义统一的 Agent 接口"""
 
+import asyncio
+import contextlib
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
 from typing import Any
 
 
@@ -11,6 +14,9 @@ class BaseAgent(ABC):
     支持多种 Agent 后端：OpenAI Agents SDK、Qwen-Agent 等。
     """
 
+    # 并发闸门（None 表示不限制），由 set_max_concurrency 设置
+    _semaphore: asyncio.Semaphore | None = None
+
     @abstractmethod
     async def run(self, user_input: str, **kwargs) -> str:
         """运行 Agent
@@ -24,6 +30,34 @@ class BaseAgent(ABC):
         """
         pass
 
+    async def run_batch(self, inputs: Sequence[str], max_concurrency: int = 8) -> list[str]:
+        """并发运行多个输入，结果顺序与输入一致
+
+        max_concurrency 是本批次独立的信号量，与 set_max_concurrency 设置的并发闸门
+        叠加生效：批次信号量在 run 之外获取、闸门在 run 内部获取，获取顺序固定，
+        不会死锁；实际并发取两者中较小的一个。
+
+        Args:
+            inputs: 用户输入列表
+            max_concurrency: 本批次的并发上限；小于等于 0 表示不额外限制
+
+        Returns:
+            各输入对应的 Agent 响应内容
+
+        Raises:
+            Exception: 任一输入执行失败时抛出其异常
+        """
+        if max_concurrency <= 0:
+            return list(await asyncio.gather(*(self.run(x) for x in inputs)))
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _one(user_input: str) -> str:
+            async with semaphore:
+                return await self.run(user_input)
+
+        return list(await asyncio.gather(*(_one(x) for x in inputs)))
+
     @abstractmethod
     def add_tool(self, tool: Any) -> None:
         """添加工具
@@ -32,3 +66,39 @@ class BaseAgent(ABC):
             tool: 工具对象（格式取决于具体实现）
         """
         pass
+
+    def add_tools(self, tools: Iterable[Any]) -> None:
+        """批量添加工具，默认逐个调用 add_tool
+
+        Args:
+            tools: 工具对象列表
+        """
+        for tool in tools:
+            self.add_tool(tool)
+
+    def set_max_concurrency(self, limit: int) -> None:
+        """限制同时进行的 LLM 调用数，避免突发请求触发限流（429）
+
+        Args:
+            limit: 最大并发数；小于等于 0 表示不限制
+        """
+        self._semaphore = asyncio.Semaphore(limit) if limit > 0 else None
+
+    def _concurrency_gate(self) -> contextlib.AbstractAsyncContextManager[Any]:
+        """返回包裹 LLM 调用的并发闸门（未设置限制时为空上下文）"""
+        return self._semaphore or contextlib.nullcontext()
+
+    def finalize(self) -> None:
+        """工具注册完成后的一次性初始化，默认无操作"""
+        return None
+
+    async def warmup(self) -> None:
+        """预热（建立连接、初始化客户端），默认无操作
+
+        实现方应吞掉并记录异常，预热失败不应影响启动。
+        """
+        return None
+
+    async def aclose(self) -> None:
+        """释放底层资源（连接池等），默认无操作"""
+        return None
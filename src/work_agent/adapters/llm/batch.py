@@ -0,0 +1,138 @@
+"""Batch API 适配器 - 离线批量提交 LLM 请求
+
+适用于不要求实时响应的场景（离线分析、报告生成等）：
+请求写入 JSONL 后一次性提交，由服务端在 completion_window 内异步处理，
+成本约为实时调用的一半。兼容 OpenAI 及 DashScope 的 OpenAI 兼容模式。
+"""
+
+import json
+import logging
+from typing import Any, Literal
+
+from openai import AsyncOpenAI
+
+logger = logging.getLogger(__name__)
+
+# 请求行按 chat completions 格式构建，目标端点只能是对应的 chat completions 端点
+BatchEndpoint = Literal["/v1/chat/completions"]
+# SDK 目前只接受 24h 完成窗口
+CompletionWindow = Literal["24h"]
+
+BATCH_ENDPOINT: BatchEndpoint = "/v1/chat/completions"
+
+
+def build_batch_requests(
+    prompts: list[str],
+    model: str,
+    instructions: str,
+    endpoint: BatchEndpoint = BATCH_ENDPOINT,
+) -> list[dict[str, Any]]:
+    """构建 Batch API 请求行
+
+    Args:
+        prompts: 用户输入列表
+        model: 模型名称
+        instructions: 系统指令
+        endpoint: 批处理目标端点
+
+    Returns:
+        每个元素对应 JSONL 中的一行；custom_id 为输入序号
+    """
+    return [
+        {
+            "custom_id": f"request-{i}",
+            "method": "POST",
+            "url": endpoint,
+            "body": {
+                "model": model,
+                "messages": [
+                    {"role": "system", "content": instructions},
+                    {"role": "user", "content": prompt},
+                ],
+            },
+        }
+        for i, prompt in enumerate(prompts)
+    ]
+
+
+class BatchSubmitter:
+    """Batch 任务提交器
+
+    职责：
+    - 将请求序列化为 JSONL 并上传
+    - 创建 batch 任务并返回任务 ID
+    - 查询任务状态
+    """
+
+    def __init__(
+        self,
+        model: str,
+        instructions: str,
+        api_key: str,
+        api_base: str | None = None,
+        timeout: float = 60.0,
+        completion_window: CompletionWindow = "24h",
+        endpoint: BatchEndpoint = BATCH_ENDPOINT,
+    ) -> None:
+        """初始化 Batch 提交器
+
+        Args:
+            model: 模型名称
+            instructions: 系统指令
+            api_key: API Key
+            api_base: API 基础 URL（可选，如 DashScope 兼容模式地址）
+            timeout: 请求超时时间（秒）
+            completion_window: 任务完成时间窗口
+            endpoint: 批处理目标端点（请求行的 url 与创建任务时使用同一个值）
+        """
+        self.model = model
+        self.instructions = instructions
+        self.completion_window = completion_window
+        self.endpoint = endpoint
+        self.client = AsyncOpenAI(api_key=api_key, base_url=api_base or None, timeout=timeout)
+
+    async def submit(self, prompts: list[str]) -> str:
+        """提交批量任务
+
+        Args:
+            prompts: 用户输入列表
+
+        Returns:
+            batch 任务 ID
+
+        Raises:
+            ValueError: 输入为空
+        """
+        if not prompts:
+            raise ValueError("prompts must not be empty")
+
+        lines = build_batch_requests(prompts, self.model, self.instructions, self.endpoint)
+        payload = "\n".join(json.dumps(line, ensure_ascii=False) for line in lines).encode()
+
+        input_file = await self.client.files.create(
+            file=("batch_input.jsonl", payload), purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=self.endpoint,
+            completion_window=self.completion_window,
+        )
+
+        logger.info("Batch submitted: id=%s, requests=%s", batch.id, len(lines))
+        return batch.id
+
+    async def status(self, batch_id: str) -> str:
+        """查询批量任务状态
+
+        Args:
+            batch_id: batch 任务 ID
+
+        Returns:
+            任务状态（validating / in_progress / completed / failed 等）
+        """
+        batch = await self.client.batches.retrieve(batch_id)
+        return batch.status
+
+    async def aclose(self) -> None:
+        """关闭底层 HTTP 客户端"""
+        await self.client.close()
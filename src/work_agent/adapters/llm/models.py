@@ -13,7 +13,7 @@ class ModelProvider(str, Enum):
     CUSTOM = "custom"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelConfig:
     """模型配置"""
 
@@ -1,10 +1,11 @@
 """OpenAI Agents SDK 适配器"""
 
 import logging
-import os
+from collections.abc import Iterable
 from typing import Any
 
-from agents import Agent, Runner
+from agents import Agent, OpenAIProvider, RunConfig, Runner, set_tracing_export_api_key
+from openai import AsyncOpenAI
 
 from work_agent.adapters.llm.base_agent import BaseAgent
 
@@ -18,7 +19,16 @@ class OpenAIAgentAdapter(BaseAgent):
     支持 OpenAI API 和兼容的服务。
     """
 
-    def __init__(self, model: str, instructions: str, api_key: str, api_base: str = None, timeout: float = 60.0):
+    def __init__(
+        self,
+        model: str,
+        instructions: str,
+        api_key: str,
+        api_base: str = None,
+        timeout: float = 60.0,
+        client: AsyncOpenAI | None = None,
+        runner: Runner | None = None,
+    ):
         """初始化 OpenAI Agent
 
         Args:
@@ -27,19 +37,26 @@ class OpenAIAgentAdapter(BaseAgent):
             api_key: OpenAI API Key
             api_base: API 基础 URL（可选）
             timeout: 请求超时时间（秒）
+            client: 共享的 AsyncOpenAI 客户端（注入，可选）；未提供时自行创建
+            runner: 共享的 Runner 实例（注入，可选）；未提供时自行创建
         """
         self.model = model
         self.instructions = instructions
 
-        # 配置环境变量（OpenAI Agents SDK 会读取）
-        os.environ["OPENAI_API_KEY"] = api_key
-
+        # 凭据直接交给 SDK 客户端，不再写入进程级环境变量
         if api_base:
-            os.environ["OPENAI_BASE_URL"] = api_base
-            logger.info(f"Using custom API base: {api_base}")
+            logger.info("Using custom API base: %s", api_base)
+        logger.info("OpenAI client timeout: %ss", timeout)
+
+        # SDK 的 trace 导出器不使用模型客户端，需单独设置 key
+        set_tracing_export_api_key(api_key)
 
-        os.environ["OPENAI_TIMEOUT"] = str(timeout)
-        logger.info(f"OpenAI client timeout: {timeout}s")
+        # OpenAI 客户端：优先使用注入的共享客户端，否则创建专属客户端
+        self._owns_client = client is None
+        self.client = client or AsyncOpenAI(
+            api_key=api_key, base_url=api_base or None, timeout=timeout
+        )
+        self.run_config = RunConfig(model_provider=OpenAIProvider(openai_client=self.client))
 
         # 创建 Agent 实例
         self.agent = Agent(
@@ -49,10 +66,10 @@ class OpenAIAgentAdapter(BaseAgent):
             tools=[],
         )
 
-        # 创建 Runner
-        self.runner = Runner()
+        # Runner 无状态，优先复用容器注入的实例
+        self.runner = runner if runner is not None else Runner()
 
-        logger.info(f"OpenAIAgentAdapter initialized with model: {model}")
+        logger.info("OpenAIAgentAdapter initialized with model: %s", model)
 
     async def run(self, user_input: str, **kwargs) -> str:
         """运行 Agent
@@ -64,17 +81,35 @@ class OpenAIAgentAdapter(BaseAgent):
         Returns:
             Agent 响应内容
         """
-        logger.info(f"Running OpenAI Agent with input: {user_input[:50]}...")
+        logger.info("Running OpenAI Agent with input: %.50s...", user_input)
 
         # 调用 Agent（runner.run 是 async 方法）
-        response = await self.runner.run(self.agent, user_input)
+        async with self._concurrency_gate():
+            response = await self.runner.run(self.agent, user_input, run_config=self.run_config)
 
         # 提取响应内容
         content = self._extract_response(response)
 
-        logger.info(f"OpenAI Agent completed, response length: {len(content)}")
+        logger.info("OpenAI Agent completed, response length: %s", len(content))
         return content
 
+    async def warmup(self) -> None:
+        """预热 OpenAI 客户端
+
+        发送一次轻量的 models.list 请求，提前完成 DNS 解析、TCP/TLS 握手，
+        使首个用户请求直接复用已建立的连接。失败只记录日志。
+        """
+        try:
+            await self.client.models.list()
+            logger.info("OpenAI client warmed up")
+        except Exception as e:
+            logger.warning("OpenAI client warmup failed: %s", e)
+
+    async def aclose(self) -> None:
+        """关闭自行创建的 OpenAI 客户端连接池（注入的客户端由其持有者关闭）"""
+        if self._owns_client:
+            await self.client.close()
+
     def add_tool(self, tool: Any) -> None:
         """添加工具
 
@@ -82,7 +117,16 @@ class OpenAIAgentAdapter(BaseAgent):
             tool: 工具对象（OpenAI 格式）
         """
         self.agent.tools.append(tool)
-        logger.info(f"Tool added to OpenAI Agent, total tools: {len(self.agent.tools)}")
+        logger.info("Tool added to OpenAI Agent, total tools: %s", len(self.agent.tools))
+
+    def add_tools(self, tools: Iterable[Any]) -> None:
+        """批量添加工具
+
+        Args:
+            tools: 工具对象列表（OpenAI 格式）
+        """
+        self.agent.tools.extend(tools)
+        logger.info("Tools added to OpenAI Agent, total tools: %s", len(self.agent.tools))
 
     def _extract_response(self, response: Any) -> str:
         """提取响应内容
@@ -1,13 +1,16 @@
 """Qwen-Agent 适配器 - 用于 DashScope / Qwen 模型"""
 
+import asyncio
 import logging
 import os
+from collections.abc import Iterable
 from typing import Any
 
 from qwen_agent.agents import Assistant
 
 from work_agent.adapters.llm.base_agent import BaseAgent
 from work_agent.adapters.llm.tool_converter import OpenAIToolWrapper
+from work_agent.utils.event_loop import BackgroundEventLoop
 
 logger = logging.getLogger(__name__)
 
@@ -19,30 +22,35 @@ class QwenAgentAdapter(BaseAgent):
     支持 DashScope API 和 Qwen 系列模型。
     """
 
-    def __init__(self, model: str, instructions: str, api_key: str):
+    def __init__(
+        self,
+        model: str,
+        instructions: str,
+        api_key: str,
+        loop: BackgroundEventLoop | None = None,
+    ):
         """初始化 Qwen-Agent
 
         Args:
             model: 模型名称（如 qwen-plus, qwen-turbo）
             instructions: 系统指令
             api_key: DashScope API Key
+            loop: 执行异步工具的常驻事件循环（注入，可选）
         """
         self.model = model
         self.instructions = instructions
+        self.loop = loop
         self.function_list = []
 
         # 配置环境变量（Qwen-Agent 会读取 DASHSCOPE_API_KEY）
         os.environ["DASHSCOPE_API_KEY"] = api_key
         logger.info("DashScope API key configured")
 
-        # 创建 Assistant 实例
-        self.agent = Assistant(
-            llm={'model': model},
-            system_message=instructions,
-            function_list=self.function_list,
-        )
+        # Assistant 延迟构建：工具全部注册后（finalize 或首次 run）才创建一次
+        self._agent: Assistant | None = None
+        self._dirty = True
 
-        logger.info(f"QwenAgentAdapter initialized with model: {model}")
+        logger.info("QwenAgentAdapter initialized with model: %s", model)
 
     async def run(self, user_input: str, **kwargs) -> str:
         """运行 Agent
@@ -54,27 +62,37 @@ class QwenAgentAdapter(BaseAgent):
         Returns:
             Agent 响应内容
         """
-        logger.info(f"Running Qwen-Agent with input: {user_input[:50]}...")
+        logger.info("Running Qwen-Agent with input: %.50s...", user_input)
 
         # 构造消息格式
-        messages = [{'role': 'user', 'content': user_input}]
+        messages = [{"role": "user", "content": user_input}]
 
-        # 调用 Agent（Qwen-Agent 的 run 是同步方法）
-        responses = []
-        for response in self.agent.run(messages):
-            responses.append(response)
-            logger.debug(f"Received response chunk: {response}")
+        agent = self._ensure_agent()
+
+        def _drain() -> Any:
+            # 流式结果中每个 chunk 都是累积后的完整响应，只需保留最后一个
+            # 级别判断提到循环外：长流式响应中避免逐 chunk 创建日志记录
+            debug = logger.isEnabledFor(logging.DEBUG)
+            last = None
+            for chunk in agent.run(messages):
+                last = chunk
+                if debug:
+                    logger.debug("Received response chunk: %s", chunk)
+            return last
+
+        # Qwen-Agent 的 run 是同步生成器，放到工作线程中执行，避免阻塞事件循环
+        async with self._concurrency_gate():
+            last_response = await asyncio.to_thread(_drain)
 
         # 提取最后的响应内容
-        if responses:
-            last_response = responses[-1]
+        if last_response is not None:
             # 响应格式可能是字典或字符串
             if isinstance(last_response, dict):
-                content = last_response.get('content', '')
+                content = last_response.get("content", "")
             else:
                 content = str(last_response)
 
-            logger.info(f"Qwen-Agent completed, response length: {len(content)}")
+            logger.info("Qwen-Agent completed, response length: %s", len(content))
             return content
         else:
             logger.warning("No response received from Qwen-Agent")
@@ -87,14 +105,39 @@ class QwenAgentAdapter(BaseAgent):
             tool: 工具对象（OpenAI FunctionTool 格式）
         """
         # 将 OpenAI 工具转换为 Qwen-Agent 兼容格式
-        wrapped_tool = OpenAIToolWrapper(tool)
+        wrapped_tool = OpenAIToolWrapper(tool, loop=self.loop)
         self.function_list.append(wrapped_tool)
+        self._dirty = True
+
+        logger.info("Tool added to Qwen-Agent (wrapped), total tools: %s", len(self.function_list))
 
-        # 重新创建 Agent 实例以更新工具列表
-        self.agent = Assistant(
-            llm={'model': self.model},
-            system_message=self.instructions,
-            function_list=self.function_list,
-        )
+    def add_tools(self, tools: Iterable[Any]) -> None:
+        """批量添加工具（一次 extend，Assistant 仍只构建一次）
+
+        Args:
+            tools: 工具对象列表（OpenAI FunctionTool 格式）
+        """
+        self.function_list.extend(OpenAIToolWrapper(tool, loop=self.loop) for tool in tools)
+        self._dirty = True
 
-        logger.info(f"Tool added to Qwen-Agent (wrapped), total tools: {len(self.function_list)}")
+        logger.info("Tools added to Qwen-Agent (wrapped), total tools: %s", len(self.function_list))
+
+    def finalize(self) -> None:
+        """立即构建 Assistant（工具注册完成后调用）"""
+        self._ensure_agent()
+
+    def _ensure_agent(self) -> Assistant:
+        """按需构建 Assistant：仅在工具列表变化后重建
+
+        Returns:
+            Assistant 实例
+        """
+        if self._dirty or self._agent is None:
+            self._agent = Assistant(
+                llm={"model": self.model},
+                system_message=self.instructions,
+                function_list=self.function_list,
+            )
+            self._dirty = False
+            logger.info("Qwen Assistant built with %s tools", len(self.function_list))
+        return self._agent
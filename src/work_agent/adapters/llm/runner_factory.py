@@ -4,12 +4,48 @@ import logging
 from typing import Any
 
 from agents import Runner
+from openai import DEFAULT_CONNECTION_LIMITS, AsyncOpenAI, DefaultAsyncHttpxClient
 
 from work_agent.config import Config
 
 logger = logging.getLogger(__name__)
 
 
+def build_openai_client(config: Config) -> AsyncOpenAI:
+    """
+    构建进程内共享的 AsyncOpenAI 客户端（连接池按配置调优）
+
+    由容器持有并注入 Agent，所有请求复用同一连接池，避免重复 TCP/TLS 握手。
+
+    Args:
+        config: 配置对象
+
+    Returns:
+        AsyncOpenAI 客户端
+    """
+    # Limits 取自 openai 实际使用的 HTTP 库（不同版本可能是 httpx 或其分支），避免类型不匹配
+    limits_cls = type(DEFAULT_CONNECTION_LIMITS)
+    http_client = DefaultAsyncHttpxClient(
+        limits=limits_cls(
+            max_connections=config.agent_max_connections,
+            max_keepalive_connections=config.agent_max_keepalive_connections,
+        ),
+        timeout=config.agent_timeout,
+    )
+
+    logger.info(
+        "Building OpenAI client: max_connections=%s, max_keepalive_connections=%s",
+        config.agent_max_connections,
+        config.agent_max_keepalive_connections,
+    )
+    return AsyncOpenAI(
+        api_key=config.openai_api_key,
+        base_url=config.openai_api_base or None,
+        timeout=config.agent_timeout,
+        http_client=http_client,
+    )
+
+
 def build_runner(config: Config) -> Any:
     """
     构建 Runner 实例
@@ -20,7 +56,7 @@ def build_runner(config: Config) -> Any:
     Returns:
         Runner 实例或封装对象
     """
-    logger.info(f"Building runner with backend: {config.session_backend}")
+    logger.info("Building runner with backend: %s", config.session_backend)
 
     # 创建 Runner（不需要 client 参数）
     runner = Runner()
@@ -2,66 +2,132 @@
 
 import asyncio
 import inspect
-import json
 import logging
-from typing import Any, Callable
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 from qwen_agent.tools.base import BaseTool, register_tool
 
+from work_agent.utils import fast_json
+from work_agent.utils.event_loop import BackgroundEventLoop
+
 logger = logging.getLogger(__name__)
 
 
+ToolInfo = tuple[Callable[..., Any], str, str]
+
+
+def _closure_impl(invoke_func: Callable[..., Any]) -> Callable[..., Any] | None:
+    """从 on_invoke_tool 的闭包中取出原始实现函数
+
+    闭包的第一个元素通常是 _on_invoke_tool_impl（真正的实现）。
+
+    Args:
+        invoke_func: FunctionTool.on_invoke_tool
+
+    Returns:
+        实现函数；闭包中没有可调用对象时返回 None
+    """
+    closure = getattr(invoke_func, "__closure__", None)
+    if not closure:
+        return None
+    try:
+        cell_content = closure[0].cell_contents
+    except (AttributeError, ValueError, IndexError) as e:
+        logger.warning("Failed to extract function from closure: %s", e)
+        return None
+    if not callable(cell_content):
+        return None
+    impl: Callable[..., Any] = cell_content
+    logger.info(
+        "Found implementation function in closure: %s",
+        getattr(impl, "__name__", "unknown"),
+    )
+    return impl
+
+
+def _from_function_tool(tool: Any) -> ToolInfo:
+    """OpenAI Agents SDK FunctionTool 格式"""
+    invoke_func = tool.on_invoke_tool
+    return _closure_impl(invoke_func) or invoke_func, tool.name, tool.description
+
+
+def _from_plain_func(func: Callable[..., Any]) -> ToolInfo:
+    """普通函数：名称和描述取自函数本身"""
+    name = getattr(func, "__name__", "unknown_tool")
+    return func, name, getattr(func, "__doc__", "") or f"Tool: {name}"
+
+
+async def _await(awaitable: Awaitable[Any]) -> Any:
+    """将任意 awaitable（如 Future）包装为协程，供 asyncio.run / BackgroundEventLoop.run 执行"""
+    return await awaitable
+
+
+# (判断条件, 提取器) 有序分派表，按顺序匹配第一个满足条件的格式
+_EXTRACTORS: tuple[tuple[Callable[[Any], bool], Callable[[Any], ToolInfo]], ...] = (
+    (lambda tool: hasattr(tool, "on_invoke_tool"), _from_function_tool),
+    (lambda tool: hasattr(tool, "func"), lambda tool: _from_plain_func(tool.func)),
+    (callable, _from_plain_func),
+)
+
+
 class OpenAIToolWrapper(BaseTool):
     """OpenAI 工具包装器 - 将 OpenAI FunctionTool 转换为 Qwen-Agent BaseTool"""
 
-    def __init__(self, openai_tool: Any):
+    def __init__(self, openai_tool: Any, loop: BackgroundEventLoop | None = None):
         """初始化工具包装器
 
         Args:
             openai_tool: OpenAI FunctionTool 对象
+            loop: 执行异步工具的常驻事件循环（注入，可选）；未提供时使用 asyncio.run
         """
         self.openai_tool = openai_tool
+        self.loop = loop
         self._extract_tool_info()
 
     def _extract_tool_info(self):
-        """从 OpenAI FunctionTool 提取工具信息"""
-        # 获取工具函数
-        if hasattr(self.openai_tool, 'on_invoke_tool'):
-            # OpenAI Agents SDK FunctionTool 格式
-            invoke_func = self.openai_tool.on_invoke_tool
-
-            # 从闭包中提取原始实现函数
-            # 闭包的第一个元素通常是 _on_invoke_tool_impl（真正的实现）
-            original_func = None
-            if hasattr(invoke_func, '__closure__') and invoke_func.__closure__:
-                try:
-                    # 获取第一个闭包变量（通常是实现函数）
-                    first_cell = invoke_func.__closure__[0]
-                    cell_content = first_cell.cell_contents
-                    if callable(cell_content):
-                        original_func = cell_content
-                        logger.info(f"Found implementation function in closure: {getattr(cell_content, '__name__', 'unknown')}")
-                except (AttributeError, ValueError, IndexError) as e:
-                    logger.warning(f"Failed to extract function from closure: {e}")
-
-            self.func = original_func if original_func else invoke_func
-            self.name = self.openai_tool.name
-            self.description = self.openai_tool.description
-        elif hasattr(self.openai_tool, 'func'):
-            self.func = self.openai_tool.func
-            self.name = getattr(self.func, '__name__', 'unknown_tool')
-            self.description = getattr(self.func, '__doc__', '') or f"Tool: {self.name}"
-        elif callable(self.openai_tool):
-            self.func = self.openai_tool
-            self.name = getattr(self.func, '__name__', 'unknown_tool')
-            self.description = getattr(self.func, '__doc__', '') or f"Tool: {self.name}"
+        """从 OpenAI FunctionTool 提取工具信息
+
+        结果保存在包装器实例上（self.func / name / description / parameters），
+        每个包装器只解析一次，且随包装器一起释放，不保留模块级缓存。
+        """
+        # 按 _EXTRACTORS 顺序匹配第一个适用的提取器
+        for predicate, extractor in _EXTRACTORS:
+            if predicate(self.openai_tool):
+                self.func, self.name, self.description = extractor(self.openai_tool)
+                break
         else:
             raise ValueError(f"Cannot extract function from tool: {self.openai_tool}")
 
-        # 设置参数（Qwen-Agent 格式）
-        self.parameters = []
+        # 设置参数（Qwen-Agent 格式），构建时一次性从 JSON schema 转换
+        schema = getattr(self.openai_tool, "params_json_schema", None) or {}
+        self.parameters = self._schema_to_parameters(schema)
 
-        logger.info(f"Wrapped OpenAI tool: {self.name}")
+        # 预先判断是否为协程函数；装饰器 / partial 包装的异步工具在 call() 中按返回值兜底判断
+        self._is_coroutine_fn = inspect.iscoroutinefunction(self.func)
+
+        logger.info("Wrapped OpenAI tool: %s", self.name)
+
+    @staticmethod
+    def _schema_to_parameters(schema: dict[str, Any]) -> list[dict[str, Any]]:
+        """将 JSON schema 转换为 Qwen-Agent 参数列表
+
+        Args:
+            schema: OpenAI FunctionTool 的 params_json_schema
+
+        Returns:
+            Qwen-Agent 格式的参数列表
+        """
+        required = set(schema.get("required", ()))
+        return [
+            {
+                "name": name,
+                "type": prop.get("type", "string"),
+                "description": prop.get("description", ""),
+                "required": name in required,
+            }
+            for name, prop in schema.get("properties", {}).items()
+        ]
 
     def call(self, params: str, **kwargs) -> str:
         """调用工具
@@ -74,20 +140,23 @@ class OpenAIToolWrapper(BaseTool):
             工具执行结果
         """
         try:
-            # 解析参数
-            if params:
-                args_dict = json.loads(params) if isinstance(params, str) else params
-            else:
+            # 解析参数（已是 dict 时直接使用）
+            if not params:
                 args_dict = {}
+            elif isinstance(params, str):
+                args_dict = fast_json.loads(params)
+            else:
+                args_dict = params
 
-            logger.info(f"Calling tool {self.name} with params: {args_dict}")
+            logger.info("Calling tool %s with params: %s", self.name, args_dict)
 
             # 调用原始函数
             result = self.func(**args_dict)
 
-            # 处理异步函数
-            if inspect.iscoroutine(result):
-                result = asyncio.run(result)
+            # 处理异步函数：提交到常驻循环，避免每次调用新建/销毁事件循环
+            if self._is_coroutine_fn or inspect.isawaitable(result):
+                coro = result if inspect.iscoroutine(result) else _await(result)
+                result = self.loop.run(coro) if self.loop is not None else asyncio.run(coro)
 
             return str(result)
 
@@ -1,20 +1,30 @@
 """上下文管理 - trace_id/request_id 生成与传递"""
 
-import uuid
-from contextvars import ContextVar
+import os
+from contextvars import ContextVar, Token
 
 # 使用 contextvars 存储 trace_id（线程安全）
 _trace_id_var: ContextVar[str | None] = ContextVar("trace_id", default=None)
 
 
+def generate_trace_id() -> str:
+    """
+    生成新的 trace_id（不写入上下文）
+
+    Returns:
+        str: trace_id（格式：req_<16 位十六进制>）
+    """
+    return f"req_{os.urandom(8).hex()}"
+
+
 def new_trace_id() -> str:
     """
-    生成新的 trace_id
+    生成新的 trace_id 并写入当前上下文
 
     Returns:
-        str: trace_id（格式：req_<uuid>）
+        str: trace_id（格式：req_<16 位十六进制>）
     """
-    trace_id = f"req_{uuid.uuid4().hex[:16]}"
+    trace_id = generate_trace_id()
     _trace_id_var.set(trace_id)
     return trace_id
 
@@ -29,14 +39,27 @@ def get_trace_id() -> str | None:
     return _trace_id_var.get()
 
 
-def set_trace_id(trace_id: str) -> None:
+def set_trace_id(trace_id: str) -> Token[str | None]:
     """
     设置当前上下文的 trace_id
 
     Args:
         trace_id: trace_id 字符串
+
+    Returns:
+        Token: 用于 reset_trace_id 恢复之前的值
     """
-    _trace_id_var.set(trace_id)
+    return _trace_id_var.set(trace_id)
+
+
+def reset_trace_id(token: Token[str | None]) -> None:
+    """
+    恢复 set_trace_id 之前的 trace_id
+
+    Args:
+        token: set_trace_id 返回的 token
+    """
+    _trace_id_var.reset(token)
 
 
 def clear_trace_id() -> None:
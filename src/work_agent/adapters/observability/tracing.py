@@ -53,7 +53,8 @@ def trace_event(event_name: str, metadata: dict | None = None) -> None:
         return
 
     logger.info(
-        f"Trace event: {event_name}",
+        "Trace event: %s",
+        event_name,
         extra={
             "event_name": event_name,
             "metadata": metadata or {},
@@ -3,17 +3,34 @@
 import importlib
 import logging
 import pkgutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# 标记模块缺少 get_tool()
+_MISSING = object()
+
+
+@dataclass(slots=True)
+class ToolEntry:
+    """已注册的 tool 及其元信息"""
+
+    tool: Any
+    module: str
+    name: str
+    description: str
+
 
 class ToolRegistry:
     """Tool 注册表（自动发现）"""
 
     def __init__(self) -> None:
-        self.tools: dict[str, Any] = {}
+        self.tools: dict[str, ToolEntry] = {}
+        self._tool_list: list[Any] = []
+        self._tool_infos: list[dict[str, str]] | None = None
 
     def load_tools(self) -> list[Any]:
         """
@@ -28,62 +45,93 @@ class ToolRegistry:
         tools_dir = Path(__file__).parent
         package_name = "work_agent.adapters.tools"
 
-        logger.info(f"Scanning tools directory: {tools_dir}")
+        logger.info("Scanning tools directory: %s", tools_dir)
 
-        # 扫描所有 .py 文件
-        for module_info in pkgutil.iter_modules([str(tools_dir)]):
-            module_name = module_info.name
+        # 扫描所有 .py 文件（跳过私有模块和 __init__）
+        module_names = [
+            module_info.name
+            for module_info in pkgutil.iter_modules([str(tools_dir)])
+            if not module_info.name.startswith("_") and module_info.name != "__init__"
+        ]
 
-            # 跳过私有模块和 __init__
-            if module_name.startswith("_") or module_name == "__init__":
-                continue
-
-            full_module_name = f"{package_name}.{module_name}"
+        # 并行导入模块（重叠磁盘读取与 .pyc 加载），注册仍按扫描顺序串行进行
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(module_names)))) as executor:
+            results = list(
+                executor.map(self._import_tool, (f"{package_name}.{n}" for n in module_names))
+            )
 
+        for module_name, (tool, error) in zip(module_names, results, strict=True):
             try:
-                # 动态导入
-                module = importlib.import_module(full_module_name)
+                if error is not None:
+                    raise error
 
                 # 查找 get_tool() 函数
-                if not hasattr(module, "get_tool"):
+                if tool is _MISSING:
                     logger.warning(
-                        f"Tool module '{module_name}' missing get_tool() function, skipped"
+                        "Tool module '%s' missing get_tool() function, skipped", module_name
                     )
                     continue
 
-                # 获取 tool
-                tool = module.get_tool()
-
                 # 检查 name 冲突
                 tool_name = getattr(tool, "name", module_name)
                 if tool_name in self.tools:
                     logger.error(
-                        f"Tool name conflict detected: '{tool_name}' "
-                        f"(from {module_name} and {self.tools[tool_name]['module']})"
+                        "Tool name conflict detected: '%s' (from %s and %s)",
+                        tool_name,
+                        module_name,
+                        self.tools[tool_name].module,
                     )
                     raise RuntimeError(f"Tool name conflict: {tool_name}")
 
                 # 注册
-                self.tools[tool_name] = {
-                    "tool": tool,
-                    "module": module_name,
-                }
+                self.tools[tool_name] = ToolEntry(
+                    tool=tool,
+                    module=module_name,
+                    name=tool_name,
+                    description=getattr(tool, "description", "No description"),
+                )
+                self._tool_list.append(tool)
 
-                logger.info(f"Loaded tool: {tool_name} (from {module_name})")
+                logger.info("Loaded tool: %s (from %s)", tool_name, module_name)
 
             except Exception as e:
                 logger.error(
-                    f"Failed to load tool from '{module_name}': {e}",
+                    "Failed to load tool from '%s': %s",
+                    module_name,
+                    e,
                     exc_info=True,
                     extra={"tool_module": module_name},
                 )
                 # 继续加载其他 tools（可选：改为 fail-fast）
                 continue
 
-        logger.info(f"Total tools loaded: {len(self.tools)}")
+        logger.info("Total tools loaded: %s", len(self.tools))
+
+        # 元信息缓存随注册表变化失效
+        self._tool_infos = None
 
         # 返回 tool 对象列表
-        return [item["tool"] for item in self.tools.values()]
+        return self._tool_list
+
+    @staticmethod
+    def _import_tool(full_module_name: str) -> tuple[Any, Exception | None]:
+        """导入 tool 模块并调用 get_tool()（在工作线程中执行）
+
+        Args:
+            full_module_name: 模块完整路径
+
+        Returns:
+            (tool, None)；模块缺少 get_tool() 时 tool 为 _MISSING；失败时为 (None, 异常)
+        """
+        try:
+            # 动态导入
+            module = importlib.import_module(full_module_name)
+            get_tool = getattr(module, "get_tool", None)
+            if get_tool is None:
+                return _MISSING, None
+            return get_tool(), None
+        except Exception as e:
+            return None, e
 
     def get_tool(self, name: str) -> Any | None:
         """
@@ -95,25 +143,19 @@ class ToolRegistry:
         Returns:
             Tool 对象或 None
         """
-        item = self.tools.get(name)
-        return item["tool"] if item else None
+        entry = self.tools.get(name)
+        return entry.tool if entry else None
 
     def list_tools(self) -> list[dict[str, str]]:
         """
         列出所有 tools 的元信息
 
         Returns:
-            list[dict]: [{name, description, module}, ...]
+            list[dict]: [{name, description, module}, ...]（缓存结果，调用方不应修改）
         """
-        result = []
-        for name, item in self.tools.items():
-            tool = item["tool"]
-            description = getattr(tool, "description", "No description")
-            result.append(
-                {
-                    "name": name,
-                    "description": description,
-                    "module": item["module"],
-                }
-            )
-        return result
+        if self._tool_infos is None:
+            self._tool_infos = [
+                {"name": entry.name, "description": entry.description, "module": entry.module}
+                for entry in self.tools.values()
+            ]
+        return self._tool_infos
@@ -4,6 +4,9 @@ from typing import Any
 
 from agents import function_tool
 
+# 禁止的特殊字符（模块级不可变常量，避免每次调用重建）
+_DANGEROUS_CHARS = frozenset(";&|`$()<>")
+
 
 @function_tool
 def shell_echo(text: str) -> str:
@@ -17,8 +20,7 @@ def shell_echo(text: str) -> str:
         回显的文本（带前缀）
     """
     # 安全检查：禁止特殊字符
-    dangerous_chars = [";", "&", "|", "`", "$", "(", ")", "<", ">"]
-    if any(char in text for char in dangerous_chars):
+    if not _DANGEROUS_CHARS.isdisjoint(text):
         return "Error: Input contains dangerous characters. Echo aborted."
 
     return f"[ECHO] {text}"
@@ -1,12 +1,13 @@
 """数据传输对象（DTO）- 与 domain 解耦"""
 
-
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class RunRequest(BaseModel):
     """运行 Agent 请求"""
 
+    model_config = ConfigDict(frozen=True)
+
     user_input: str = Field(..., min_length=1, description="用户输入")
     trace_id: str | None = Field(None, description="可选的 trace_id")
 
@@ -14,6 +15,8 @@ class RunRequest(BaseModel):
 class RunResponse(BaseModel):
     """运行 Agent 响应"""
 
+    model_config = ConfigDict(frozen=True)
+
     content: str = Field(..., description="Agent 响应内容")
     trace_id: str = Field(..., description="trace_id")
     success: bool = Field(default=True, description="是否成功")
@@ -23,6 +26,8 @@ class RunResponse(BaseModel):
 class ToolInfo(BaseModel):
     """Tool 信息"""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     module: str
@@ -31,5 +36,7 @@ class ToolInfo(BaseModel):
 class HealthResponse(BaseModel):
     """健康检查响应"""
 
+    model_config = ConfigDict(frozen=True)
+
     status: str = "ok"
     version: str = "0.1.0"
@@ -4,7 +4,11 @@ import logging
 
 from fastapi import APIRouter, HTTPException
 
-from work_agent.adapters.observability.context import new_trace_id
+from work_agent.adapters.observability.context import (
+    generate_trace_id,
+    reset_trace_id,
+    set_trace_id,
+)
 from work_agent.api.dto import HealthResponse, RunRequest, RunResponse, ToolInfo
 from work_agent.container import Container
 from work_agent.domain.errors import AgentExecutionError
@@ -24,6 +28,11 @@ def create_router(container: Container) -> APIRouter:
     """
     router = APIRouter()
 
+    # 容器组成在构建后固定：创建路由时解析一次（同时触发惰性依赖的构建，
+    # 首个请求无需承担初始化开销），请求中直接读取闭包变量
+    tool_registry = container.tool_registry
+    agent_service = container.agent_service
+
     @router.get("/health", response_model=HealthResponse)
     def health_check() -> HealthResponse:
         """健康检查"""
@@ -32,11 +41,11 @@ def create_router(container: Container) -> APIRouter:
     @router.get("/tools", response_model=list[ToolInfo])
     def list_tools() -> list[ToolInfo]:
         """列出所有 tools"""
-        tool_list = container.tool_registry.list_tools()
+        tool_list = tool_registry.list_tools()
         return [ToolInfo(**tool) for tool in tool_list]
 
     @router.post("/run", response_model=RunResponse)
-    def run_agent(request: RunRequest) -> RunResponse:
+    async def run_agent(request: RunRequest) -> RunResponse:
         """
         运行 Agent
 
@@ -49,16 +58,15 @@ def create_router(container: Container) -> APIRouter:
         Raises:
             HTTPException: 执行失败
         """
-        trace_id = request.trace_id or new_trace_id()
+        trace_id = request.trace_id or generate_trace_id()
+        # 写入上下文供日志过滤器读取；请求结束时恢复，避免泄漏到后续请求
+        token = set_trace_id(trace_id)
 
-        logger.info(
-            f"API /run called: {request.user_input[:50]}...",
-            extra={"trace_id": trace_id},
-        )
+        logger.info("API /run called: %.50s...", request.user_input)
 
         try:
-            # 调用 service
-            result = container.agent_service.run_once(
+            # 调用 service（异步等待，不占用线程池）
+            result = await agent_service.arun_once(
                 user_input=request.user_input,
                 trace_id=trace_id,
             )
@@ -71,13 +79,16 @@ def create_router(container: Container) -> APIRouter:
             )
 
         except AgentExecutionError as e:
-            logger.error(f"Agent execution failed: {e}", exc_info=True)
+            logger.error("Agent execution failed: %s", e, exc_info=True)
             raise HTTPException(status_code=500, detail=str(e)) from e
 
         except Exception as e:
-            logger.error(f"Unexpected error: {e}", exc_info=True)
+            logger.error("Unexpected error: %s", e, exc_info=True)
             raise HTTPException(status_code=500, detail="Internal server error") from e
 
+        finally:
+            reset_trace_id(token)
+
     # 预留端点（未实现）
     @router.put("/config/instructions")
     def update_instructions() -> dict:
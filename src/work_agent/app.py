@@ -1,13 +1,17 @@
 """应用组装与 CLI 入口"""
 
+import asyncio
 import sys
+from pathlib import Path
 
 import typer
 
 from work_agent.config import load_config
-from work_agent.container import build_container, set_global_container, shutdown_container
 from work_agent.logging import configure_logging
 
+# 注意：work_agent.container 会加载 LLM SDK 等重依赖，各命令内按需导入，
+# 使 --help 等不需要容器的调用保持快速启动
+
 app = typer.Typer(
     name="work-agent",
     help="工程化 AI Agent - 日常工作助理",
@@ -23,13 +27,15 @@ def run(user_input: str) -> None:
     Args:
         user_input: 用户输入的问题或指令
     """
+    from work_agent.container import build_container, set_global_container, shutdown_container
+
     container = None
     try:
         # 1. 加载配置
         config = load_config()
 
         # 2. 配置日志
-        configure_logging(config.log_level)
+        configure_logging(config.log_level, config.log_format)
 
         # 3. 构建容器
         container = build_container(config)
@@ -54,13 +60,15 @@ def repl() -> None:
     """
     交互式 REPL 模式
     """
+    from work_agent.container import build_container, set_global_container, shutdown_container
+
     container = None
     try:
         # 1. 加载配置
         config = load_config()
 
         # 2. 配置日志
-        configure_logging(config.log_level)
+        configure_logging(config.log_level, config.log_format)
 
         # 3. 构建容器
         container = build_container(config)
@@ -87,6 +95,8 @@ def list_tools() -> None:
     """
     列出所有可用的 tools
     """
+    from work_agent.container import build_container, set_global_container, shutdown_container
+
     container = None
     try:
         # 1. 加载配置
@@ -101,13 +111,11 @@ def list_tools() -> None:
 
         # 4. 列出 tools
         typer.echo("\n=== Available Tools ===\n")
-        tools = container.tools
-        if not tools:
+        if not container.tool_count:
             typer.echo("No tools found.")
             return
 
-        for tool in tools:
-            name = getattr(tool, "name", "unknown")
+        for name, tool in zip(container.tool_names, container.tools, strict=True):
             description = getattr(tool, "description", "No description")
             typer.echo(f"  • {name}")
             typer.echo(f"    {description}\n")
@@ -120,6 +128,45 @@ def list_tools() -> None:
             shutdown_container(container)
 
 
+@app.command()
+def batch(input_file: Path) -> None:
+    """
+    通过 Batch API 异步提交批量问题（适合离线任务，成本更低）
+
+    Args:
+        input_file: 输入文件路径（每行一个问题）
+    """
+    from work_agent.container import build_batch_submitter
+
+    try:
+        # 1. 加载配置
+        config = load_config()
+
+        # 2. 配置日志
+        configure_logging(config.log_level, config.log_format)
+
+        # 3. 读取问题
+        prompts = [line.strip() for line in input_file.read_text(encoding="utf-8").splitlines()]
+        prompts = [prompt for prompt in prompts if prompt]
+
+        # 4. 提交任务
+        submitter = build_batch_submitter(config)
+
+        async def _submit() -> str:
+            try:
+                return await submitter.submit(prompts)
+            finally:
+                await submitter.aclose()
+
+        batch_id = asyncio.run(_submit())
+
+        typer.echo(f"Batch submitted: {batch_id} ({len(prompts)} requests)")
+
+    except Exception as e:
+        typer.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
 @app.command()
 def serve(
     host: str = typer.Option("0.0.0.0", help="API host"),
@@ -128,6 +175,8 @@ def serve(
     """
     启动 API 服务（需要安装 api 依赖）
     """
+    from work_agent.container import build_container, set_global_container
+
     try:
         from work_agent.api.app import create_api_app
     except ImportError:
@@ -142,7 +191,7 @@ def serve(
         config = load_config()
 
         # 2. 配置日志
-        configure_logging(config.log_level)
+        configure_logging(config.log_level, config.log_format)
 
         # 3. 构建容器
         container = build_container(config)
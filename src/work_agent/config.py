@@ -1,9 +1,9 @@
 """配置管理 - 唯一读取环境变量的位置"""
 
 import sys
-from typing import Literal
+from typing import Literal, NoReturn
 
-from pydantic import Field
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -20,8 +20,7 @@ class Config(BaseSettings):
     # OpenAI 配置
     openai_api_key: str = Field(default="", description="OpenAI API Key")
     openai_api_base: str = Field(
-        default="",
-        description="OpenAI API Base URL (用于 vLLM 等兼容服务)"
+        default="", description="OpenAI API Base URL (用于 vLLM 等兼容服务)"
     )
 
     # DashScope 配置
@@ -30,13 +29,29 @@ class Config(BaseSettings):
     # Agent ���置
     agent_backend: Literal["openai", "qwen"] = Field(
         default="openai",
-        description="Agent 后端类型：openai（OpenAI Agents SDK）、qwen（Qwen-Agent）"
+        description="Agent 后端类型：openai（OpenAI Agents SDK）、qwen（Qwen-Agent）",
     )
     agent_model: str = Field(default="gpt-4o", description="Agent 模型名称")
     agent_timeout: float = Field(default=60.0, description="Agent API 请求超时时间（秒）")
+    agent_instructions_file: str = Field(
+        default="", description="自定义 Agent 指令文件路径（为空时使用内置默认指令）"
+    )
+    agent_max_connections: int = Field(default=100, description="Agent LLM 客户端最大连接数")
+    agent_max_keepalive_connections: int = Field(
+        default=50, description="Agent LLM 客户端最大 keep-alive 连接数"
+    )
+    agent_max_concurrency: int = Field(
+        default=8, description="Agent 同时进行的 LLM 调用上限（<=0 表示不限制）"
+    )
+    use_uvloop: bool = Field(
+        default=False, description="后台事件循环是否使用 uvloop（需安装 speedups 可选依赖）"
+    )
 
     # 日志配置
     log_level: str = Field(default="INFO", description="日志级别")
+    log_format: Literal["text", "json"] = Field(
+        default="text", description="日志格式（text / json）"
+    )
 
     # 可观测性
     enable_tracing: bool = Field(default=False, description="是否启用 tracing")
@@ -54,10 +69,33 @@ class Config(BaseSettings):
     # Weather API 配置
     weather_api_key: str = Field(default="", description="Weather API Key")
     weather_api_base_url: str = Field(
-        default="https://api.openweathermap.org/data/2.5",
-        description="Weather API Base URL"
+        default="https://api.openweathermap.org/data/2.5", description="Weather API Base URL"
     )
     weather_api_timeout: float = Field(default=10.0, description="Weather API 超时时间")
+    weather_cache_ttl: float = Field(
+        default=600.0, description="Weather 响应缓存有效期（秒），0 表示禁用缓存"
+    )
+    weather_cache_maxsize: int = Field(default=256, description="Weather 响应缓存最大条目数")
+
+    @field_validator("agent_backend", "agent_model", "log_level", "log_format", "session_backend")
+    @classmethod
+    def _intern(cls, value: str) -> str:
+        """驻留分支判断用到的字符串字段：与源码中的字面量比较时命中 is 快速路径"""
+        return sys.intern(value)
+
+
+def _fail(message: str) -> NoReturn:
+    """一次性写出完整错误信息并退出
+
+    Args:
+        message: 错误信息（含换行）
+
+    Raises:
+        SystemExit: 总是退出（状态码 1）
+    """
+    sys.stderr.write(message)
+    sys.stderr.flush()
+    sys.exit(1)
 
 
 def load_config() -> Config:
@@ -73,22 +111,25 @@ def load_config() -> Config:
     try:
         config = Config()  # type: ignore[call-arg]
     except Exception as e:
-        print(f"Configuration error: {e}", file=sys.stderr)
-        print("\nPlease check your .env file or environment variables.", file=sys.stderr)
-        print("Required: OPENAI_API_KEY", file=sys.stderr)
-        sys.exit(1)
+        _fail(
+            f"Configuration error: {e}\n"
+            "\nPlease check your .env file or environment variables.\n"
+            "Required: OPENAI_API_KEY\n"
+        )
 
     # 根据 agent_backend 进行校验
     if config.agent_backend == "openai":
         if not config.openai_api_key or config.openai_api_key == "sk-your-api-key-here":
-            print("Error: OPENAI_API_KEY not found or using placeholder value", file=sys.stderr)
-            print("Please set a valid API key in .env file or environment", file=sys.stderr)
-            sys.exit(1)
+            _fail(
+                "Error: OPENAI_API_KEY not found or using placeholder value\n"
+                "Please set a valid API key in .env file or environment\n"
+            )
     elif config.agent_backend == "qwen":
         if not config.dashscope_api_key:
-            print("Error: DASHSCOPE_API_KEY not found", file=sys.stderr)
-            print("Please set a valid API key in .env file or environment", file=sys.stderr)
-            print("Required for Qwen agent backend", file=sys.stderr)
-            sys.exit(1)
+            _fail(
+                "Error: DASHSCOPE_API_KEY not found\n"
+                "Please set a valid API key in .env file or environment\n"
+                "Required for Qwen agent backend\n"
+            )
 
     return config
@@ -1,122 +1,245 @@
 """依赖注入容器 - 唯一允许组装依赖的位置"""
 
+import inspect
 import logging
-from dataclasses import dataclass
-from typing import Any
+import threading
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar, overload
 
 from work_agent.adapters.external.apis.weather_api import WeatherApiClient
 from work_agent.adapters.external.services.weather_service import WeatherService
-from work_agent.adapters.llm.agent_factory import build_agent
-from work_agent.adapters.llm.runner_factory import build_runner
-from work_agent.adapters.observability.context import new_trace_id
+from work_agent.adapters.llm.agent_factory import DEFAULT_INSTRUCTIONS, build_agent
+from work_agent.adapters.llm.batch import BatchSubmitter
+from work_agent.adapters.llm.runner_factory import build_openai_client, build_runner
+from work_agent.adapters.observability.context import (
+    generate_trace_id,
+    reset_trace_id,
+    set_trace_id,
+)
 from work_agent.adapters.observability.tracing import configure_tracing
 from work_agent.adapters.tools._registry import ToolRegistry
 from work_agent.config import Config
 from work_agent.services.agent_service import AgentService
+from work_agent.utils.event_loop import BackgroundEventLoop
+
+T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+class _Lazy(Generic[T]):
+    """惰性依赖：首次访问时在容器锁内构建并缓存到实例 __dict__
+
+    与 functools.cached_property 相同，缓存后实例属性直接命中、不再经过描述符；
+    额外使用容器锁保证并发首次访问时只构建一次。
+    """
+
+    def __init__(self, factory: Callable[["Container"], T]) -> None:
+        self.factory = factory
+        self.__doc__ = factory.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, container: None, owner: type | None = None) -> "_Lazy[T]": ...
+
+    @overload
+    def __get__(self, container: "Container", owner: type | None = None) -> T: ...
+
+    def __get__(self, container: "Container | None", owner: type | None = None) -> "_Lazy[T] | T":
+        if container is None:
+            return self
+        with container._lock:
+            if self.name not in container.__dict__:
+                container.__dict__[self.name] = self.factory(container)
+            value: T = container.__dict__[self.name]
+            return value
+
+
 class Container:
-    """依赖容器（持有所有依赖）"""
+    """依赖容器（持有所有依赖）
 
-    config: Config
-    logger: logging.Logger
-    tool_registry: ToolRegistry
-    tools: list[Any]
-    agent: Any
-    runner: Any
-    agent_service: AgentService
-    weather_service: WeatherService | None
-    _resources: list[Any]  # 需要关闭的资源
+    配置、工具与事件循环在构建时创建；Runner、Agent、Weather 等较重的依赖
+    在首次访问时才构建，未用到它们的命令（如 list-tools）不承担初始化成本。
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        tool_registry: ToolRegistry,
+        tools: tuple[Any, ...],
+        loop: BackgroundEventLoop,
+    ) -> None:
+        """
+        初始化依赖容器
+
+        Args:
+            config: 配置对象
+            tool_registry: 工具注册表
+            tools: 已加载的工具（构建后不可变，可安全地并发遍历）
+            loop: 常驻事件循环
+        """
+        self.config = config
+        self.logger = logger
+        self.tool_registry = tool_registry
+        self.tools = tools
+        self.tool_names = tuple(getattr(tool, "name", "unknown") for tool in tools)
+        self.tool_count = len(tools)
+        self.loop = loop
+        self._resources: list[Any] = []  # 需要关闭的资源（按构建顺序）
+        self._lock = threading.RLock()
+
+    def _track(self, resource: T) -> T:
+        """登记需要在 shutdown_container 中关闭的资源"""
+        self._resources.append(resource)
+        return resource
+
+    @_Lazy
+    def runner(self) -> Any:
+        """Runner（进程内唯一，注入 Agent 复用）"""
+        runner = build_runner(self.config)
+        if hasattr(runner, "close"):
+            self._track(runner)
+        return runner
+
+    @_Lazy
+    def openai_client(self) -> Any:
+        """openai 后端共享的连接池客户端（其他后端为 None）"""
+        if self.config.agent_backend != "openai":
+            return None
+        return self._track(build_openai_client(self.config))
+
+    @_Lazy
+    def agent(self) -> Any:
+        """Agent 实例"""
+        agent = build_agent(
+            self.config,
+            self.tools,
+            openai_client=self.openai_client,
+            runner=self.runner,
+            loop=self.loop,
+        )
+        return self._track(agent)
+
+    @_Lazy
+    def agent_service(self) -> AgentService:
+        """Agent 服务"""
+        return AgentService(
+            agent=self.agent,
+            runner=self.runner,
+            config=self.config,
+            loop=self.loop,
+        )
+
+    @_Lazy
+    def weather_service(self) -> WeatherService | None:
+        """Weather 服务（未配置 WEATHER_API_KEY 时为 None）"""
+        if not self.config.weather_api_key:
+            return None
+        weather_api = self._track(
+            WeatherApiClient(
+                base_url=self.config.weather_api_base_url,
+                api_key=self.config.weather_api_key,
+                timeout=self.config.weather_api_timeout,
+                cache_ttl=self.config.weather_cache_ttl,
+                cache_maxsize=self.config.weather_cache_maxsize,
+            )
+        )
+        logger.info("Weather service initialized")
+        return WeatherService(weather_api)
 
 
 def build_container(config: Config) -> Container:
     """
     构建依赖容器
 
+    只加载工具并启动事件循环；Agent、Runner、Weather 等依赖在首次访问时构建。
+
     Args:
         config: 配置对象
 
     Returns:
         Container: 依赖容器
     """
-    logger.info("Building dependency container", extra={"trace_id": new_trace_id()})
+    # 构建过程中的日志共享同一个 trace_id（由日志过滤器从上下文读取）
+    token = set_trace_id(generate_trace_id())
+    try:
+        logger.info("Building dependency container")
 
-    # 1. 配置 tracing
-    configure_tracing(enabled=config.enable_tracing)
+        # 1. 配置 tracing
+        configure_tracing(enabled=config.enable_tracing)
 
-    # 2. 加载 tools
-    tool_registry = ToolRegistry()
-    tools = tool_registry.load_tools()
-    logger.info(f"Loaded {len(tools)} tools")
+        # 2. 加载 tools
+        tool_registry = ToolRegistry()
+        tools = tuple(tool_registry.load_tools())
+        logger.info("Loaded %d tools", len(tools))
 
-    # 3. 构建 Agent
-    agent = build_agent(config, tools)
+        # 3. 构建常驻事件循环（多次同步调用间复用连接池，也用于执行异步工具）
+        loop = BackgroundEventLoop(use_uvloop=config.use_uvloop)
 
-    # 4. 构建 Runner
-    runner = build_runner(config)
+        logger.info("Container built successfully")
+    finally:
+        reset_trace_id(token)
 
-    # 5. 构建 Weather Service
-    weather_service = None
-    if config.weather_api_key:
-        weather_api = WeatherApiClient(
-            base_url=config.weather_api_base_url,
-            api_key=config.weather_api_key,
-            timeout=config.weather_api_timeout,
-        )
-        weather_service = WeatherService(weather_api)
-        logger.info("Weather service initialized")
-
-    # 6. 构建 Services
-    agent_service = AgentService(
-        agent=agent,
-        runner=runner,
-        config=config,
-    )
-
-    # 7. 记录需要关闭的资源
-    resources: list[Any] = []
-    if hasattr(runner, "close"):
-        resources.append(runner)
-
-    logger.info("Container built successfully")
-
-    return Container(
-        config=config,
-        logger=logger,
-        tool_registry=tool_registry,
-        tools=tools,
-        agent=agent,
-        runner=runner,
-        agent_service=agent_service,
-        weather_service=weather_service,
-        _resources=resources,
-    )
+    return Container(config=config, tool_registry=tool_registry, tools=tools, loop=loop)
 
 
 def shutdown_container(container: Container) -> None:
     """
     关闭容器并释放资源
 
+    按构建顺序逆序逐个关闭（如先关闭 Agent，再关闭其共享的 OpenAI 客户端）：
+    后构建的资源可能依赖先构建的资源，不能并发关闭。
+
     Args:
         container: 依赖容器
     """
     logger.info("Shutting down container")
 
-    for resource in container._resources:
+    for resource in reversed(container._resources):
         try:
-            if hasattr(resource, "close"):
-                resource.close()
+            if hasattr(resource, "aclose"):
+                # 异步资源绑定在常驻循环上，需在同一循环中关闭
+                container.loop.run(resource.aclose())
+            elif hasattr(resource, "close"):
+                result = resource.close()
+                if inspect.isawaitable(result):
+                    # 如 AsyncOpenAI.close()
+                    container.loop.run(_await(result))
             elif hasattr(resource, "shutdown"):
                 resource.shutdown()
         except Exception as e:
-            logger.error(f"Error closing resource: {e}", exc_info=True)
+            logger.error("Error closing resource: %s", e, exc_info=True)
 
+    container.loop.close()
     logger.info("Container shutdown complete")
 
 
+async def _await(awaitable: Any) -> Any:
+    """将 close() 返回的任意 awaitable 包装为协程，交由常驻循环执行"""
+    return await awaitable
+
+
+def build_batch_submitter(config: Config) -> BatchSubmitter:
+    """
+    构建 Batch 任务提交器（离线批处理，不参与交互式运行路径）
+
+    Args:
+        config: 配置对象
+
+    Returns:
+        BatchSubmitter: 使用 OpenAI 兼容配置的提交器
+    """
+    return BatchSubmitter(
+        model=config.agent_model,
+        instructions=DEFAULT_INSTRUCTIONS,
+        api_key=config.openai_api_key,
+        api_base=config.openai_api_base,
+        timeout=config.agent_timeout,
+    )
+
+
 # 全局容器实例
 _global_container: Container | None = None
 
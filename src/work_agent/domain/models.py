@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentRequest:
     """Agent 请求"""
 
@@ -12,7 +12,7 @@ class AgentRequest:
     session_id: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentResponse:
     """Agent 响应"""
 
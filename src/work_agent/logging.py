@@ -2,70 +2,131 @@
 
 import logging
 import sys
+from typing import Literal
 
-LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
+from work_agent.adapters.observability.context import get_trace_id
+from work_agent.utils import fast_json
+
+LogFormat = Literal["text", "json"]
+
+LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s%(structured_suffix)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
-class StructuredFormatter(logging.Formatter):
-    """结构化日志格式化器（简化版，可扩展为 JSON）"""
+class TraceContextFilter(logging.Filter):
+    """从上下文变量读取 trace_id 并附加到日志记录
 
-    def format(self, record: logging.LogRecord) -> str:
-        # 基础格式化
-        base = super().format(record)
+    调用方无需在每次日志调用时传入 extra={"trace_id": ...}；显式传入的值优先。
+    """
 
-        # 追加结构化字段
-        extras = []
-        if hasattr(record, "trace_id"):
-            extras.append(f"trace_id={record.trace_id}")
-        if hasattr(record, "tool_name"):
-            extras.append(f"tool={record.tool_name}")
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.__dict__.setdefault("trace_id", get_trace_id())
+        return True
 
-        if extras:
-            return f"{base} | {' '.join(extras)}"
-        return base
 
+class StructuredFilter(logging.Filter):
+    """结构化字段过滤器（简化版，可扩展为 JSON）
 
-def configure_logging(level: str = "INFO") -> None:
+    在 handler 入口为每条记录预先拼好 structured_suffix，格式化时只需一次
+    % 替换，无需在 Formatter 中逐条探测字段。
     """
-    配置全局日志（只调用一次）
 
-    Args:
-        level: 日志级别（DEBUG/INFO/WARNING/ERROR）
+    def filter(self, record: logging.LogRecord) -> bool:
+        parts = []
+        trace_id = getattr(record, "trace_id", None)
+        if trace_id:
+            parts.append(f"trace_id={trace_id}")
+        tool_name = getattr(record, "tool_name", None)
+        if tool_name:
+            parts.append(f"tool={tool_name}")
+
+        record.structured_suffix = f" | {' '.join(parts)}" if parts else ""
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """JSON 行格式化器（每条记录一行 JSON，便于日志平台采集）
+
+    时间戳直接输出 record.created（Unix 秒），不做 asctime 格式化；
+    安装 orjson 时由其在 C 层完成序列化。
     """
-    # 设置根日志级别
-    numeric_level = getattr(logging, level.upper(), logging.INFO)
-    root_logger = logging.getLogger()
-    root_logger.setLevel(numeric_level)
 
-    # 清除现有 handlers（防止重复）
-    root_logger.handlers.clear()
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, object] = {
+            "ts": record.created,
+            "level": record.levelname,
+            "name": record.name,
+            "msg": record.getMessage(),
+        }
+        trace_id = getattr(record, "trace_id", None)
+        if trace_id:
+            entry["trace_id"] = trace_id
+        tool_name = getattr(record, "tool_name", None)
+        if tool_name:
+            entry["tool"] = tool_name
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return fast_json.dumps(entry, default=str).decode()
+
+
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# configure_logging 安装的 handler 名称，用于识别是否已配置
+_HANDLER_NAME = "work_agent.console"
+
+_TRACE_FILTER = TraceContextFilter()
+_STRUCTURED_FILTER = StructuredFilter()
+_TEXT_FORMATTER = logging.Formatter(fmt=LOG_FORMAT, datefmt=DATE_FORMAT)
+_JSON_FORMATTER = JsonFormatter()
+
+
+def configure_logging(level: str = "INFO", fmt: LogFormat = "text") -> None:
+    """
+    配置全局日志（幂等：重复调用只调整级别与格式，不会重建 handler）
 
-    # 创建控制台 handler
-    console_handler = logging.StreamHandler(sys.stderr)
-    console_handler.setLevel(numeric_level)
+    Args:
+        level: 日志级别（DEBUG/INFO/WARNING/ERROR/CRITICAL）
+        fmt: 输出格式（text：人类可读；json：每行一条 JSON）
+    """
+    numeric_level = _LEVELS.get(level.upper(), logging.INFO)
+    formatter = _JSON_FORMATTER if fmt == "json" else _TEXT_FORMATTER
+    root_logger = logging.getLogger()
 
-    # 设置格式化器
-    formatter = StructuredFormatter(fmt=LOG_FORMAT, datefmt=DATE_FORMAT)
-    console_handler.setFormatter(formatter)
+    console_handler = next((h for h in root_logger.handlers if h.get_name() == _HANDLER_NAME), None)
+    if console_handler is None:
+        # 清除现有 handlers（防止重复）
+        root_logger.handlers.clear()
 
-    # 添加到根 logger
-    root_logger.addHandler(console_handler)
+        # 创建控制台 handler（过滤器与格式化器无状态，所有调用共享同一实例）
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.set_name(_HANDLER_NAME)
+        console_handler.addFilter(_TRACE_FILTER)
 
-    # 调整第三方库日志级别
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("httpcore").setLevel(logging.WARNING)
-    logging.getLogger("openai").setLevel(logging.WARNING)
+        # 添加到根 logger
+        root_logger.addHandler(console_handler)
 
+        # 调整第三方库日志级别
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        logging.getLogger("httpcore").setLevel(logging.WARNING)
+        logging.getLogger("openai").setLevel(logging.WARNING)
+    elif root_logger.level == numeric_level and console_handler.formatter is formatter:
+        return
 
-def get_logger(name: str) -> logging.Logger:
-    """
-    获取 logger 实例
+    # 设置格式化器（文本格式的结构化字段由过滤器预先拼接，JSON 格式直接读取字段）
+    console_handler.setFormatter(formatter)
+    if formatter is _TEXT_FORMATTER:
+        console_handler.addFilter(_STRUCTURED_FILTER)
+    else:
+        console_handler.removeFilter(_STRUCTURED_FILTER)
 
-    Args:
-        name: logger 名称（通常使用 __name__）
+    # 设置根日志级别（handler 保持 NOTSET：记录已经过根 logger 级别过滤）
+    root_logger.setLevel(numeric_level)
 
-    Returns:
-        Logger 实例
-    """
-    return logging.getLogger(name)
+    # 仅在 DEBUG 下打印日志系统自身的异常（格式化失败等），其他级别静默丢弃
+    logging.raiseExceptions = numeric_level <= logging.DEBUG
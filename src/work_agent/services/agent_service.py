@@ -2,11 +2,20 @@
 
 import asyncio
 import logging
-from typing import Any
-
-from work_agent.adapters.observability.context import new_trace_id
+import sys
+from collections.abc import Callable, Coroutine, Iterator
+from typing import Any, TypeVar
+
+from work_agent.adapters.observability.context import (
+    generate_trace_id,
+    reset_trace_id,
+    set_trace_id,
+)
 from work_agent.config import Config
 from work_agent.domain.errors import AgentExecutionError
+from work_agent.utils.event_loop import BackgroundEventLoop
+
+T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +23,13 @@ logger = logging.getLogger(__name__)
 class AgentService:
     """Agent 服务（用例编排）"""
 
-    def __init__(self, agent: Any, runner: Any, config: Config):
+    def __init__(
+        self,
+        agent: Any,
+        runner: Any,
+        config: Config,
+        loop: BackgroundEventLoop | None = None,
+    ):
         """
         初始化 Agent 服务
 
@@ -22,10 +37,41 @@ class AgentService:
             agent: Agent 实例（注入）
             runner: Runner 实例（注入）
             config: 配置对象（注入）
+            loop: 常驻事件循环（注入，可选）；未提供时每次调用使用 asyncio.run
         """
         self.agent = agent
         self.runner = runner
         self.config = config
+        self.loop = loop
+        # 预先绑定热路径上的方法，每次请求少一次属性查找（agent 在构建后不再替换）
+        self._agent_run: Callable[[str], Coroutine[Any, Any, str]] = agent.run
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """在常驻事件循环（若有）中同步执行协程"""
+        if self.loop is not None:
+            return self.loop.run(coro)
+        return asyncio.run(coro)
+
+    async def _arun(self, coro: Coroutine[Any, Any, T]) -> T:
+        """在调用方事件循环中等待协程（若有常驻循环则交由其执行）"""
+        if self.loop is not None:
+            return await self.loop.run_async(coro)
+        return await coro
+
+    def warmup(self) -> None:
+        """
+        预热 Agent 后端连接（失败不影响启动）
+
+        需要注入常驻事件循环，否则预热建立的连接会随临时事件循环一起关闭。
+        """
+        if self.loop is None:
+            logger.debug("Skipping agent warmup: no persistent event loop")
+            return
+
+        try:
+            self._run(self.agent.warmup())
+        except Exception as e:
+            logger.warning("Agent warmup failed: %s", e)
 
     def run_once(self, user_input: str, trace_id: str | None = None) -> str:
         """
@@ -41,32 +87,70 @@ class AgentService:
         Raises:
             AgentExecutionError: 执行失败
         """
-        trace_id = trace_id or new_trace_id()
+        trace_id = trace_id or generate_trace_id()
+        # trace_id 写入上下文，由日志过滤器附加到每条记录；结束时恢复
+        token = set_trace_id(trace_id)
+        try:
+            logger.info("Running agent with input: %.50s...", user_input)
 
-        logger.info(
-            f"Running agent with input: {user_input[:50]}...",
-            extra={"trace_id": trace_id},
-        )
+            try:
+                # 执行 Agent (agent.run 是 async 方法)
+                # BaseAgent.run() 直接返回字符串结果
+                result_content = self._run(_with_trace_id(self._agent_run(user_input), trace_id))
+            except Exception as e:
+                self._log_failure(e)
+                raise AgentExecutionError(f"Agent execution failed: {e}") from e
+
+            self._log_success(result_content)
+            return result_content
+        finally:
+            reset_trace_id(token)
+
+    async def arun_once(self, user_input: str, trace_id: str | None = None) -> str:
+        """
+        单次运行 Agent（异步版本，供 API 等已有事件循环的调用方使用）
+
+        Args:
+            user_input: 用户输入
+            trace_id: 可选的 trace_id（用于外部传入）
+
+        Returns:
+            Agent 响应内容
 
+        Raises:
+            AgentExecutionError: 执行失败
+        """
+        trace_id = trace_id or generate_trace_id()
+        token = set_trace_id(trace_id)
         try:
-            # 执行 Agent (agent.run 是 async 方法)
-            # BaseAgent.run() 直接返回字符串结果
-            result_content = asyncio.run(self.agent.run(user_input))
+            logger.info("Running agent with input: %.50s...", user_input)
 
-            logger.info(
-                "Agent completed successfully",
-                extra={"trace_id": trace_id, "response_length": len(result_content)},
-            )
+            try:
+                result_content = await self._arun(
+                    _with_trace_id(self._agent_run(user_input), trace_id)
+                )
+            except Exception as e:
+                self._log_failure(e)
+                raise AgentExecutionError(f"Agent execution failed: {e}") from e
 
+            self._log_success(result_content)
             return result_content
+        finally:
+            reset_trace_id(token)
+
+    @staticmethod
+    def _log_success(result_content: str) -> None:
+        # extra 字典与 len() 无法惰性求值，级别不满足时直接跳过
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info(
+            "Agent completed successfully",
+            extra={"response_length": len(result_content)},
+        )
 
-        except Exception as e:
-            logger.error(
-                f"Agent execution failed: {e}",
-                exc_info=True,
-                extra={"trace_id": trace_id},
-            )
-            raise AgentExecutionError(f"Agent execution failed: {e}") from e
+    @staticmethod
+    def _log_failure(error: Exception) -> None:
+        logger.error("Agent execution failed: %s", error, exc_info=True)
 
     def repl(self) -> None:
         """
@@ -74,13 +158,17 @@ class AgentService:
 
         注意：此方法包含 I/O 仅用于 CLI 场景，API 模式不应调用
         """
-        trace_id = new_trace_id()
-        logger.info("Starting REPL mode", extra={"trace_id": trace_id})
+        trace_id = generate_trace_id()
+        token = set_trace_id(trace_id)
+        logger.info("Starting REPL mode")
 
+        inputs = _read_inputs()
         while True:
             try:
                 # I/O 在 service 层是例外（仅限 CLI REPL 场景）
-                user_input = input("\nYou: ").strip()
+                user_input = next(inputs, None)
+                if user_input is None:
+                    break
 
                 if user_input.lower() in ("quit", "exit", "q"):
                     break
@@ -97,35 +185,36 @@ class AgentService:
             except KeyboardInterrupt:
                 break
             except Exception as e:
-                logger.error(f"REPL error: {e}", exc_info=True, extra={"trace_id": trace_id})
+                logger.error("REPL error: %s", e, exc_info=True)
                 print(f"\nError: {e}")
 
-        logger.info("REPL mode ended", extra={"trace_id": trace_id})
+        logger.info("REPL mode ended")
+        reset_trace_id(token)
 
-    def _extract_response_content(self, response: Any) -> str:
-        """
-        提取响应内容（适配不同 SDK 版本）
 
-        Args:
-            response: Agent ��应对象
+def _read_inputs() -> Iterator[str]:
+    """逐行读取 REPL 输入（已去除首尾空白），输入结束（EOF）时停止
 
-        Returns:
-            响应内容字符串
-        """
-        # 尝试多种提取方式（兼容不同 SDK 版本）
-        if isinstance(response, str):
-            return response
+    交互终端使用 input() 显示提示符；管道/重定向输入直接迭代 sys.stdin，
+    走缓冲读取，批量粘贴或脚本输入时无需逐行等待提示。
+    """
+    if not sys.stdin.isatty():
+        for line in sys.stdin:
+            yield line.strip()
+        return
 
-        if hasattr(response, "content"):
-            return str(response.content)
+    while True:
+        try:
+            yield input("\nYou: ").strip()
+        except EOFError:
+            return
 
-        if hasattr(response, "output"):
-            return str(response.output)
 
-        if hasattr(response, "messages") and response.messages:
-            last_message = response.messages[-1]
-            if hasattr(last_message, "content"):
-                return str(last_message.content)
+async def _with_trace_id(coro: Coroutine[Any, Any, T], trace_id: str) -> T:
+    """在协程所在的任务上下文中设置 trace_id
 
-        # Fallback
-        return str(response)
+    协程可能被提交到常驻事件循环执行，调用方线程的上下文变量不会随之传递；
+    在任务内部设置后，Agent 与工具的日志同样带有 trace_id。
+    """
+    set_trace_id(trace_id)
+    return await coro
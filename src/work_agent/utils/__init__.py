@@ -4,22 +4,28 @@ from work_agent.utils.api_client import (
     ApiClient,
     ApiClientConfig,
     ApiClientError,
+    ApiClientPool,
     ApiResponse,
     ConnectionError,
     ContentType,
     HttpError,
     HttpMethod,
+    RequestSpec,
     TimeoutError,
 )
+from work_agent.utils.sse import SSEParser
 
 __all__ = [
     "ApiClient",
     "ApiClientConfig",
     "ApiClientError",
+    "ApiClientPool",
     "ApiResponse",
     "ConnectionError",
     "ContentType",
     "HttpError",
     "HttpMethod",
+    "RequestSpec",
+    "SSEParser",
     "TimeoutError",
 ]
@@ -5,11 +5,25 @@
 """
 
 import asyncio
+import base64
+import builtins
+import importlib.util
+import random
+import ssl
+import threading
+import urllib.error
+import urllib.request
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from http import HTTPStatus
-from typing import Any, TypeVar
-from urllib.parse import urlencode, urljoin
+from typing import Any, Literal, TypeVar
+from urllib.parse import quote_plus, urlencode, urljoin
+
+from work_agent.utils.fast_json import dumps as _json_dumps
+from work_agent.utils.fast_json import loads as _json_loads
 
 try:
     import httpx
@@ -18,6 +32,9 @@ try:
 except ImportError:
     HTTPX_AVAILABLE = False
 
+# httpx 的 HTTP/2 支持依赖 h2；只检查是否已安装，不导入
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 try:
     import aiohttp
 
@@ -25,6 +42,20 @@ try:
 except ImportError:
     AIOHTTP_AVAILABLE = False
 
+ApiBackend = Literal["aiohttp", "httpx", "urllib"]
+
+# 按异常类型分类重试错误（本模块的 TimeoutError / ConnectionError 会遮蔽内置同名类型）
+_TIMEOUT_ERRORS: tuple[type[BaseException], ...] = (
+    (asyncio.TimeoutError, builtins.TimeoutError)
+    + ((httpx.TimeoutException,) if HTTPX_AVAILABLE else ())
+    + ((aiohttp.ServerTimeoutError,) if AIOHTTP_AVAILABLE else ())
+)
+_CONNECT_ERRORS: tuple[type[BaseException], ...] = (
+    (builtins.ConnectionError, urllib.error.URLError)
+    + ((httpx.ConnectError,) if HTTPX_AVAILABLE else ())
+    + ((aiohttp.ClientConnectionError,) if AIOHTTP_AVAILABLE else ())
+)
+
 
 class HttpMethod(str, Enum):
     """HTTP 请求方法"""
@@ -38,6 +69,12 @@ class HttpMethod(str, Enum):
     OPTIONS = "OPTIONS"
 
 
+_METHOD_CACHE: dict[str, HttpMethod] = {
+    **{m.value: m for m in HttpMethod},
+    **{m.value.lower(): m for m in HttpMethod},
+}
+
+
 class ContentType(str, Enum):
     """请求内容类型"""
 
@@ -48,14 +85,110 @@ class ContentType(str, Enum):
     XML = "application/xml"
 
 
-@dataclass
+def _resolve_backend(backend: ApiBackend | None) -> ApiBackend:
+    """确定实际使用的 HTTP 后端
+
+    Args:
+        backend: 指定的后端，None 表示按 aiohttp > httpx > urllib 自动选择
+
+    Returns:
+        实际使用的后端
+
+    Raises:
+        ApiClientError: 指定的后端未安装
+    """
+    if backend is None:
+        if AIOHTTP_AVAILABLE:
+            return "aiohttp"
+        return "httpx" if HTTPX_AVAILABLE else "urllib"
+    if (backend == "aiohttp" and not AIOHTTP_AVAILABLE) or (
+        backend == "httpx" and not HTTPX_AVAILABLE
+    ):
+        raise ApiClientError(f"HTTP 后端 {backend} 未安装: pip install {backend}")
+    return backend
+
+
+_URLLIB_MAX_WORKERS = 32  # urllib 备选方案线程池上限
+_SCALAR_TYPES = (str, int, float)
+
+
+def _is_plain_path(path: str) -> bool:
+    """路径是否可直接拼接到 base_url（不含 scheme 与 ./.. 相对段）"""
+    return ":" not in path and "/." not in "/" + path
+
+
+def _encode_query(pairs: list[tuple[Any, Any]]) -> str:
+    """编码查询参数；全部为 str/int/float 标量时跳过 urlencode 的 doseq 分支
+
+    Args:
+        pairs: 已过滤 None 的 (key, value) 列表
+
+    Returns:
+        查询字符串（与 urlencode(pairs, doseq=True) 结果一致）
+    """
+    if all(isinstance(k, str) and isinstance(v, _SCALAR_TYPES) for k, v in pairs):
+        return "&".join(f"{quote_plus(k)}={quote_plus(str(v))}" for k, v in pairs)
+    return urlencode(pairs, doseq=True)
+
+
+@lru_cache(maxsize=512)
+def _join_url(base: str, path: str) -> str:
+    """urljoin 的缓存版本（同一客户端通常反复访问少量端点）"""
+    return urljoin(base, path)
+
+
+def _parse_body(raw: bytes, encoding: str = "utf-8") -> tuple[Any, str]:
+    """解析响应体，只读取并解析一次原始 bytes
+
+    Args:
+        raw: 原始响应字节
+        encoding: 非 JSON 响应的文本编码
+
+    Returns:
+        (body, raw_text)：JSON 响应的 raw_text 为空（由 ApiResponse 懒解码），否则为解码后的文本
+    """
+    try:
+        return _json_loads(raw), ""
+    except ValueError:
+        text = raw.decode(encoding, errors="replace")
+        return text, text
+
+
+_STATUS_CACHE: dict[int, HTTPStatus] = {int(status): status for status in HTTPStatus}
+
+
+@dataclass(slots=True, init=False)
 class ApiResponse:
-    """API 响应封装"""
+    """API 响应封装
+
+    JSON 响应只保留一份原始 bytes，``raw_text`` / ``text()`` 首次访问时才解码。
+    """
 
     status_code: int
     headers: dict[str, str]
     body: Any
-    raw_text: str = ""
+    _text: str | None = field(default=None, repr=False, compare=False)
+    _raw: bytes = field(default=b"", repr=False, compare=False)
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: dict[str, str],
+        body: Any,
+        raw_text: str = "",
+        raw: bytes = b"",
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+        # 已有文本时不再保留原始 bytes，避免同一响应体存两份
+        self._text = raw_text if raw_text or not raw else None
+        self._raw = b"" if self._text is not None else raw
+
+    @property
+    def raw_text(self) -> str:
+        """原始响应文本"""
+        return self.text()
 
     @property
     def ok(self) -> bool:
@@ -64,22 +197,37 @@ class ApiResponse:
 
     @property
     def status(self) -> HTTPStatus | None:
-        """获取 HTTP 状态枚举"""
-        try:
-            return HTTPStatus(self.status_code)
-        except ValueError:
-            return None
+        """获取 HTTP 状态枚举（未知状态码返回 None）"""
+        return _STATUS_CACHE.get(self.status_code)
 
     def json(self) -> Any:
         """获取 JSON 响应体"""
         return self.body if isinstance(self.body, (dict, list)) else None
 
     def text(self) -> str:
-        """获取文本响应体"""
-        return self.raw_text
+        """获取文本响应体（首次调用时从原始 bytes 解码并缓存）"""
+        if self._text is None:
+            self._text = self._raw.decode("utf-8", errors="replace")
+            self._raw = b""
+        return self._text
+
+
+@dataclass(slots=True)
+class RequestSpec:
+    """单个请求的描述（用于 ApiClient.gather 批量并发发送）"""
 
+    method: HttpMethod | str
+    path: str
+    params: dict[str, Any] | None = None
+    headers: dict[str, str] | None = None
+    json: Any = None
+    data: dict[str, Any] | None = None
+    files: dict[str, Any] | None = None
+    raise_for_status: bool = False
+    content: bytes | None = None
 
-@dataclass
+
+@dataclass(slots=True)
 class ApiClientConfig:
     """API 客户端配置"""
 
@@ -89,6 +237,12 @@ class ApiClientConfig:
     retry_count: int = 0
     retry_delay: float = 1.0
     verify_ssl: bool = True
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 60.0
+    http2: bool = True  # httpx 后端启用 HTTP/2（需安装 h2）
+    dns_cache_ttl: int = 300  # aiohttp DNS 缓存时间（秒）
+    backend: ApiBackend | None = None  # None 表示自动选择：aiohttp > httpx > urllib
 
 
 class ApiClientError(Exception):
@@ -122,11 +276,59 @@ class HttpError(ApiClientError):
 T = TypeVar("T")
 
 
+def _classify_error(error: Exception, url: str) -> ApiClientError:
+    """按异常类型把底层 HTTP 库的异常转换为 ApiClientError 子类
+
+    Args:
+        error: 底层异常
+        url: 请求 URL
+
+    Returns:
+        TimeoutError / ConnectionError / ApiClientError
+    """
+    # 超时需先于连接错误判断：部分超时类型（如 aiohttp）同时是连接错误的子类
+    if isinstance(error, _TIMEOUT_ERRORS) or isinstance(
+        getattr(error, "reason", None), builtins.TimeoutError
+    ):
+        return TimeoutError(f"请求超时: {url}")
+    if isinstance(error, _CONNECT_ERRORS):
+        return ConnectionError(f"连接失败: {url} - {error}")
+    return ApiClientError(f"请求失败: {url} - {error}")
+
+
+def _status_error(
+    status_code: int, headers: dict[str, str], raw: bytes, encoding: str = "utf-8"
+) -> HttpError:
+    """根据非 2xx 响应构建 HttpError
+
+    Args:
+        status_code: HTTP 状态码
+        headers: 响应头
+        raw: 原始响应体
+        encoding: 非 JSON 响应的文本编码
+
+    Returns:
+        HttpError 实例
+    """
+    body, raw_text = _parse_body(raw, encoding)
+    response = ApiResponse(
+        status_code=status_code, headers=headers, body=body, raw_text=raw_text, raw=raw
+    )
+    return HttpError(f"HTTP {status_code}: {response.text()[:200]}", status_code, response)
+
+
 class ApiClient:
     """通用 HTTP API 客户端
 
     支持同步和异步请求，支持多种请求格式。
 
+    httpx / aiohttp 后端会复用一个持久化的客户端（连接池 + HTTP keep-alive），
+    避免每次请求重新进行 TCP/TLS 握手。使用完毕后应调用 ``aclose()`` 释放连接，
+    或使用 ``async with ApiClient(...) as client:``。
+
+    未指定 ``backend`` 时优先使用 aiohttp：高并发下 httpx AsyncClient 的单请求开销
+    明显更高（openai-python 也因此提供了 aiohttp 后端），其次 httpx，最后回退到 urllib。
+
     使用示例:
         # 基础用法
         client = ApiClient(base_url="https://api.example.com")
@@ -148,6 +350,9 @@ class ApiClient:
 
         # 自定义请求头
         response = await client.get("/protected", headers={"Authorization": "Bearer token"})
+
+        # 并发发送多个请求
+        responses = await client.gather([RequestSpec("GET", "/users/1"), RequestSpec("GET", "/users/2")])
     """
 
     def __init__(
@@ -158,6 +363,9 @@ class ApiClient:
         retry_count: int = 0,
         retry_delay: float = 1.0,
         verify_ssl: bool = True,
+        backend: ApiBackend | None = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
     ) -> None:
         """初始化 API 客户端
 
@@ -166,8 +374,14 @@ class ApiClient:
             timeout: 请求超时时间（秒）
             headers: 默认请求头
             retry_count: 失败重试次数
-            retry_delay: 重试间隔（秒）
+            retry_delay: 重试基础间隔（秒），按指数退避递增
             verify_ssl: 是否验证 SSL 证书
+            backend: HTTP 后端（aiohttp / httpx / urllib），None 表示自动选择
+            max_connections: 连接池最大连接数（urllib 后端为线程池上限，最多 32）
+            max_keepalive_connections: 最大 keep-alive 连接数（aiohttp 后端为单主机连接上限）
+
+        Raises:
+            ApiClientError: 指定的后端未安装
         """
         self.config = ApiClientConfig(
             base_url=base_url.rstrip("/") if base_url else "",
@@ -176,8 +390,23 @@ class ApiClient:
             retry_count=retry_count,
             retry_delay=retry_delay,
             verify_ssl=verify_ssl,
+            backend=backend,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
         )
+        self._backend = _resolve_backend(backend)
+        self._base_with_slash = self.config.base_url + "/"
         self._session: Any = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+        self._aiohttp_session: Any = None
+        self._aiohttp_loop: asyncio.AbstractEventLoop | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        # urllib 不校验证书时使用的 SSL 上下文，只创建一次（create_default_context 开销较大）
+        self._urllib_ssl_context: ssl.SSLContext | None = None
+        if not verify_ssl:
+            self._urllib_ssl_context = ssl.create_default_context()
+            self._urllib_ssl_context.check_hostname = False
+            self._urllib_ssl_context.verify_mode = ssl.CERT_NONE
 
     def _build_url(self, path: str, params: dict[str, Any] | None = None) -> str:
         """构建完整 URL
@@ -189,16 +418,19 @@ class ApiClient:
         Returns:
             完整 URL
         """
-        if self.config.base_url:
-            url = urljoin(self.config.base_url + "/", path.lstrip("/"))
-        else:
+        if not self.config.base_url:
             url = path
+        elif _is_plain_path(path):
+            # 常见情况：普通相对路径，直接拼接，无需 urljoin
+            url = self._base_with_slash + path.lstrip("/")
+        else:
+            url = _join_url(self._base_with_slash, path.lstrip("/"))
 
         if params:
             # 过滤 None 值并编码参数
-            filtered_params = {k: v for k, v in params.items() if v is not None}
-            if filtered_params:
-                query_string = urlencode(filtered_params, doseq=True)
+            pairs = [(k, v) for k, v in params.items() if v is not None]
+            if pairs:
+                query_string = _encode_query(pairs)
                 separator = "&" if "?" in url else "?"
                 url = f"{url}{separator}{query_string}"
 
@@ -211,12 +443,115 @@ class ApiClient:
             headers: 自定义请求头
 
         Returns:
-            合并后的请求头
+            合并后的请求头；未传自定义请求头时直接返回默认请求头（调用方只读，不得修改）
         """
-        merged = dict(self.config.default_headers)
-        if headers:
-            merged.update(headers)
-        return merged
+        if not headers:
+            return self.config.default_headers
+        return {**self.config.default_headers, **headers}
+
+    def _get_httpx_client(self) -> Any:
+        """获取持久化的 httpx AsyncClient（惰性创建）
+
+        连接池绑定在创建它的事件循环上，当前事件循环变化时（如多次 asyncio.run）
+        会重新创建客户端。
+
+        Returns:
+            httpx.AsyncClient 实例
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.is_closed or self._session_loop is not loop:
+            self._session = httpx.AsyncClient(
+                timeout=self.config.timeout,
+                verify=self.config.verify_ssl,
+                # HTTP/2 在单个 TCP+TLS 连接上多路复用并发请求
+                http2=self.config.http2 and H2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_keepalive_connections,
+                    keepalive_expiry=self.config.keepalive_expiry,
+                ),
+            )
+            self._session_loop = loop
+        return self._session
+
+    def _get_aiohttp_session(self) -> Any:
+        """获取持久化的 aiohttp ClientSession（惰性创建）
+
+        与 httpx 客户端相同，会话绑定在创建它的事件循环上，事件循环变化时重新创建。
+
+        Returns:
+            aiohttp.ClientSession 实例
+        """
+        loop = asyncio.get_running_loop()
+        session = self._aiohttp_session
+        if session is None or session.closed or self._aiohttp_loop is not loop:
+            self._aiohttp_session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
+                connector=aiohttp.TCPConnector(
+                    ssl=None if self.config.verify_ssl else False,
+                    limit=self.config.max_connections,
+                    limit_per_host=self.config.max_keepalive_connections,
+                    ttl_dns_cache=self.config.dns_cache_ttl,
+                    keepalive_timeout=self.config.keepalive_expiry,
+                ),
+            )
+            self._aiohttp_loop = loop
+        return self._aiohttp_session
+
+    def _retry_backoff(self, attempt: int) -> float:
+        """计算第 attempt 次失败后的重试等待时间（指数退避 + 随机抖动，避免重试风暴）
+
+        Args:
+            attempt: 已失败的尝试序号（从 0 开始）
+
+        Returns:
+            等待时间（秒）
+        """
+        delay = self.config.retry_delay
+        return delay * (2.0**attempt) + random.uniform(0, delay * 0.1)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """获取 urllib 备选方案专用的线程池（惰性创建）
+
+        不占用事件循环的默认 executor，避免并发请求挤占其他 run_in_executor 调用方。
+
+        Returns:
+            ThreadPoolExecutor 实例
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(_URLLIB_MAX_WORKERS, self.config.max_connections),
+                thread_name_prefix="apiclient-urllib",
+            )
+        return self._executor
+
+    async def aclose(self) -> None:
+        """关闭持久化连接池，释放底层连接"""
+        running_loop = asyncio.get_running_loop()
+
+        session, loop = self._session, self._session_loop
+        self._session = None
+        self._session_loop = None
+        # 连接只能在创建它的事件循环中关闭，事件循环已结束时直接丢弃
+        if session is not None and not session.is_closed and loop is running_loop:
+            await session.aclose()
+
+        aiohttp_session, loop = self._aiohttp_session, self._aiohttp_loop
+        self._aiohttp_session = None
+        self._aiohttp_loop = None
+        if aiohttp_session is not None and not aiohttp_session.closed and loop is running_loop:
+            await aiohttp_session.close()
+
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            # 不阻塞事件循环：已提交的请求在后台线程中自然结束
+            executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "ApiClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
 
     async def _request_with_httpx(
         self,
@@ -226,34 +561,35 @@ class ApiClient:
         json: Any = None,
         data: dict[str, Any] | None = None,
         files: dict[str, Any] | None = None,
+        content: bytes | None = None,
     ) -> ApiResponse:
-        """使用 httpx 发送请求"""
-        import httpx
-
-        async with httpx.AsyncClient(
-            timeout=self.config.timeout,
-            verify=self.config.verify_ssl,
-        ) as client:
-            response = await client.request(
-                method=method.value,
-                url=url,
-                headers=headers,
-                json=json,
-                data=data,
-                files=files,
-            )
-
-            try:
-                body = response.json()
-            except Exception:
-                body = response.text
+        """使用 httpx 发送请求（复用持久化连接池）"""
+        client = self._get_httpx_client()
+        response = await client.request(
+            method=method.value,
+            url=url,
+            headers=headers,
+            content=content,
+            json=json,
+            data=data,
+            files=files,
+        )
 
-            return ApiResponse(
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                body=body,
-                raw_text=response.text,
-            )
+        # 只保留一份原始 bytes 并解析一次；文本仅在非 JSON 响应或调用 text() 时解码
+        raw_bytes = response.content
+        try:
+            body = _json_loads(raw_bytes)
+            raw_text = ""
+        except ValueError:
+            body = raw_text = response.text
+
+        return ApiResponse(
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            body=body,
+            raw_text=raw_text,
+            raw=raw_bytes,
+        )
 
     async def _request_with_aiohttp(
         self,
@@ -263,50 +599,47 @@ class ApiClient:
         json: Any = None,
         data: dict[str, Any] | None = None,
         files: dict[str, Any] | None = None,
+        content: bytes | None = None,
     ) -> ApiResponse:
-        """使用 aiohttp 发送请求"""
-        import aiohttp
-
-        timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-        connector = aiohttp.TCPConnector(ssl=self.config.verify_ssl)
-
-        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
-            # 处理文件上传
-            form_data = None
-            if files:
-                form_data = aiohttp.FormData()
-                if data:
-                    for key, value in data.items():
-                        form_data.add_field(key, str(value))
-                for key, file_info in files.items():
-                    if isinstance(file_info, tuple):
-                        filename, content = file_info[0], file_info[1]
-                        content_type = file_info[2] if len(file_info) > 2 else "application/octet-stream"
-                        form_data.add_field(key, content, filename=filename, content_type=content_type)
-                    else:
-                        form_data.add_field(key, file_info)
-
-            async with session.request(
-                method=method.value,
-                url=url,
-                headers=headers,
-                json=json,
-                data=form_data if files else data,
-            ) as response:
-                raw_text = await response.text()
-                try:
-                    import json as json_module
+        """使用 aiohttp 发送请求（复用持久化会话）"""
+        session = self._get_aiohttp_session()
+
+        # 处理文件上传
+        form_data = None
+        if files:
+            form_data = aiohttp.FormData()
+            if data:
+                for key, value in data.items():
+                    form_data.add_field(key, str(value))
+            for key, file_info in files.items():
+                if isinstance(file_info, tuple):
+                    filename, file_content = file_info[0], file_info[1]
+                    content_type = (
+                        file_info[2] if len(file_info) > 2 else "application/octet-stream"
+                    )
+                    form_data.add_field(
+                        key, file_content, filename=filename, content_type=content_type
+                    )
+                else:
+                    form_data.add_field(key, file_info)
 
-                    body = json_module.loads(raw_text)
-                except Exception:
-                    body = raw_text
+        async with session.request(
+            method=method.value,
+            url=url,
+            headers=headers,
+            json=json,
+            data=content if content is not None else form_data if files else data,
+        ) as response:
+            raw = await response.read()
+            body, raw_text = _parse_body(raw, response.charset or "utf-8")
 
-                return ApiResponse(
-                    status_code=response.status,
-                    headers=dict(response.headers),
-                    body=body,
-                    raw_text=raw_text,
-                )
+            return ApiResponse(
+                status_code=response.status,
+                headers=dict(response.headers),
+                body=body,
+                raw_text=raw_text,
+                raw=raw,
+            )
 
     async def _request_with_urllib(
         self,
@@ -315,70 +648,76 @@ class ApiClient:
         headers: dict[str, str],
         json_data: Any = None,
         data: dict[str, Any] | None = None,
+        content: bytes | None = None,
     ) -> ApiResponse:
         """使用 urllib 发送请求（无外部依赖备选方案）"""
-        import json as json_module
-        import ssl
-        import urllib.request
-
-        # 准备请求数据
-        body_bytes: bytes | None = None
-        if json_data is not None:
-            body_bytes = json_module.dumps(json_data).encode("utf-8")
-            headers["Content-Type"] = ContentType.JSON.value
-        elif data:
-            body_bytes = urlencode(data).encode("utf-8")
-            headers["Content-Type"] = ContentType.FORM.value
-
-        request = urllib.request.Request(
-            url=url,
-            data=body_bytes,
-            headers=headers,
-            method=method.value,
-        )
-
-        # SSL 上下文
-        ssl_context = None
-        if not self.config.verify_ssl:
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
 
         def do_request() -> ApiResponse:
             try:
-                with urllib.request.urlopen(
-                    request,
-                    timeout=self.config.timeout,
-                    context=ssl_context,
-                ) as response:
-                    raw_text = response.read().decode("utf-8")
-                    try:
-                        body = json_module.loads(raw_text)
-                    except Exception:
-                        body = raw_text
+                with self._urlopen(method, url, headers, json_data, data, content) as response:
+                    raw = response.read()
+                    body, raw_text = _parse_body(raw)
 
                     return ApiResponse(
                         status_code=response.status,
                         headers=dict(response.headers),
                         body=body,
                         raw_text=raw_text,
+                        raw=raw,
                     )
             except urllib.error.HTTPError as e:
-                raw_text = e.read().decode("utf-8") if e.fp else ""
-                try:
-                    body = json_module.loads(raw_text)
-                except Exception:
-                    body = raw_text
+                raw = e.read() if e.fp else b""
+                body, raw_text = _parse_body(raw)
                 return ApiResponse(
                     status_code=e.code,
                     headers=dict(e.headers) if e.headers else {},
                     body=body,
                     raw_text=raw_text,
+                    raw=raw,
                 )
 
         # 在线程池中运行同步请求
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, do_request)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), do_request)
+
+    def _urlopen(
+        self,
+        method: HttpMethod,
+        url: str,
+        headers: dict[str, str],
+        json_data: Any = None,
+        data: dict[str, Any] | None = None,
+        content: bytes | None = None,
+    ) -> Any:
+        """构建并发送 urllib 请求（同步阻塞，需在线程池中调用）
+
+        Returns:
+            已打开的 http.client.HTTPResponse，调用方负责关闭
+
+        Raises:
+            urllib.error.HTTPError: 非 2xx 响应
+        """
+        # 准备请求数据
+        body_bytes: bytes | None = None
+        if content is not None:
+            body_bytes = content
+        elif json_data is not None:
+            body_bytes = _json_dumps(json_data)
+            headers = {**headers, "Content-Type": ContentType.JSON.value}
+        elif data:
+            body_bytes = urlencode(data).encode("utf-8")
+            headers = {**headers, "Content-Type": ContentType.FORM.value}
+
+        request = urllib.request.Request(
+            url=url,
+            data=body_bytes,
+            headers=headers,
+            method=method.value,
+        )
+
+        return urllib.request.urlopen(
+            request, timeout=self.config.timeout, context=self._urllib_ssl_context
+        )
 
     async def request(
         self,
@@ -390,6 +729,7 @@ class ApiClient:
         data: dict[str, Any] | None = None,
         files: dict[str, Any] | None = None,
         raise_for_status: bool = False,
+        content: bytes | None = None,
     ) -> ApiResponse:
         """发送 HTTP 请求
 
@@ -402,6 +742,8 @@ class ApiClient:
             data: 表单数据
             files: 上传文件
             raise_for_status: 是否在非 2xx 响应时抛出异常
+            content: 原始请求体字节（如预先序列化的 JSON），优先于 json / data；
+                Content-Type 需由调用方在 headers 中指定
 
         Returns:
             ApiResponse 响应对象
@@ -411,8 +753,8 @@ class ApiClient:
             TimeoutError: 请求超时
             HttpError: HTTP 错误响应（当 raise_for_status=True）
         """
-        if isinstance(method, str):
-            method = HttpMethod(method.upper())
+        # HttpMethod 本身也是 str，大小写写法与枚举成员都命中缓存；其余写法回退到构造
+        method = _METHOD_CACHE.get(method) or HttpMethod(method.upper())
 
         url = self._build_url(path, params)
         merged_headers = self._merge_headers(headers)
@@ -422,28 +764,28 @@ class ApiClient:
 
         for attempt in range(attempts):
             try:
-                # 选择可用的 HTTP 库
-                if HTTPX_AVAILABLE:
-                    response = await self._request_with_httpx(
-                        method, url, merged_headers, json, data, files
-                    )
-                elif AIOHTTP_AVAILABLE:
+                # 使用初始化时确定的 HTTP 后端
+                if self._backend == "aiohttp":
                     response = await self._request_with_aiohttp(
-                        method, url, merged_headers, json, data, files
+                        method, url, merged_headers, json, data, files, content
+                    )
+                elif self._backend == "httpx":
+                    response = await self._request_with_httpx(
+                        method, url, merged_headers, json, data, files, content
                     )
                 else:
                     # 使用内置 urllib（不支持文件上传）
                     if files:
                         raise ApiClientError(
-                            "文件上传需要安装 httpx 或 aiohttp: pip install httpx"
+                            "文件上传需要 aiohttp 或 httpx 后端: pip install aiohttp"
                         )
                     response = await self._request_with_urllib(
-                        method, url, merged_headers, json, data
+                        method, url, merged_headers, json, data, content
                     )
 
                 if raise_for_status and not response.ok:
                     raise HttpError(
-                        f"HTTP {response.status_code}: {response.raw_text[:200]}",
+                        f"HTTP {response.status_code}: {response.text()[:200]}",
                         response.status_code,
                         response,
                     )
@@ -452,18 +794,10 @@ class ApiClient:
 
             except (HttpError, ApiClientError):
                 raise
-            except asyncio.TimeoutError as e:
-                last_error = TimeoutError(f"请求超时: {url}")
-                if attempt < attempts - 1:
-                    await asyncio.sleep(self.config.retry_delay)
             except Exception as e:
-                error_msg = str(e)
-                if "connect" in error_msg.lower() or "connection" in error_msg.lower():
-                    last_error = ConnectionError(f"连接失败: {url} - {error_msg}")
-                else:
-                    last_error = ApiClientError(f"请求失败: {url} - {error_msg}")
+                last_error = _classify_error(e, url)
                 if attempt < attempts - 1:
-                    await asyncio.sleep(self.config.retry_delay)
+                    await asyncio.sleep(self._retry_backoff(attempt))
 
         if last_error:
             raise last_error
@@ -504,6 +838,7 @@ class ApiClient:
         data: dict[str, Any] | None = None,
         files: dict[str, Any] | None = None,
         raise_for_status: bool = False,
+        content: bytes | None = None,
     ) -> ApiResponse:
         """发送 POST 请求
 
@@ -515,6 +850,7 @@ class ApiClient:
             data: 表单数据
             files: 上传文件
             raise_for_status: 是否在非 2xx 响应时抛出异常
+            content: 原始请求体字节（优先于 json / data）
 
         Returns:
             ApiResponse 响应对象
@@ -528,6 +864,7 @@ class ApiClient:
             data=data,
             files=files,
             raise_for_status=raise_for_status,
+            content=content,
         )
 
     async def put(
@@ -652,6 +989,138 @@ class ApiClient:
             raise_for_status=raise_for_status,
         )
 
+    async def stream(
+        self,
+        method: HttpMethod | str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        json: Any = None,
+        data: dict[str, Any] | None = None,
+        chunk_size: int = 65536,
+        content: bytes | None = None,
+    ) -> AsyncIterator[bytes]:
+        """流式读取响应体，逐块返回而不在内存中缓存完整响应（适用于 SSE / 大文件下载）
+
+        不做重试；非 2xx 响应直接抛出 HttpError。
+
+        Args:
+            method: HTTP 方法
+            path: 请求路径
+            params: URL 查询参数
+            headers: 请求头
+            json: JSON 请求体
+            data: 表单数据
+            chunk_size: 单块最大字节数
+            content: 原始请求体字节（优先于 json / data）
+
+        Yields:
+            响应体字节块
+
+        Raises:
+            ConnectionError: 连接失败
+            TimeoutError: 请求超时
+            HttpError: 非 2xx 响应
+        """
+        method = _METHOD_CACHE.get(method) or HttpMethod(method.upper())
+        url = self._build_url(path, params)
+        merged_headers = self._merge_headers(headers)
+
+        try:
+            if self._backend == "aiohttp":
+                session = self._get_aiohttp_session()
+                async with session.request(
+                    method.value,
+                    url,
+                    headers=merged_headers,
+                    json=json,
+                    data=content if content is not None else data,
+                ) as response:
+                    if not 200 <= response.status < 300:
+                        raise _status_error(
+                            response.status,
+                            dict(response.headers),
+                            await response.read(),
+                            response.charset or "utf-8",
+                        )
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        yield chunk
+            elif self._backend == "httpx":
+                client = self._get_httpx_client()
+                async with client.stream(
+                    method.value,
+                    url,
+                    headers=merged_headers,
+                    content=content,
+                    json=json,
+                    data=data,
+                ) as response:
+                    if not 200 <= response.status_code < 300:
+                        raise _status_error(
+                            response.status_code, dict(response.headers), await response.aread()
+                        )
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        yield chunk
+            else:
+                loop = asyncio.get_running_loop()
+                executor = self._get_executor()
+                try:
+                    response = await loop.run_in_executor(
+                        executor, self._urlopen, method, url, merged_headers, json, data, content
+                    )
+                except urllib.error.HTTPError as e:
+                    raw = b""
+                    if e.fp:
+                        raw = e.read()
+                        e.close()
+                    raise _status_error(e.code, dict(e.headers) if e.headers else {}, raw) from None
+                with response:
+                    # read1 返回当前已到达的数据，SSE 等场景无需等待凑满 chunk_size
+                    while chunk := await loop.run_in_executor(executor, response.read1, chunk_size):
+                        yield chunk
+        except (HttpError, ApiClientError):
+            raise
+        except Exception as e:
+            raise _classify_error(e, url) from e
+
+    async def gather(self, specs: list[RequestSpec], *, limit: int = 20) -> list[ApiResponse]:
+        """并发发送一组请求，复用同一个持久化连接池
+
+        Args:
+            specs: 请求描述列表
+            limit: 同时进行的请求上限（<=0 表示不限制）
+
+        Returns:
+            与 specs 顺序一致的响应列表
+
+        Raises:
+            ApiClientError: 任一请求失败时抛出第一个异常
+        """
+        if limit <= 0:
+            return list(await asyncio.gather(*(self._send(spec) for spec in specs)))
+
+        semaphore = asyncio.Semaphore(limit)
+
+        async def bounded(spec: RequestSpec) -> ApiResponse:
+            async with semaphore:
+                return await self._send(spec)
+
+        return list(await asyncio.gather(*(bounded(spec) for spec in specs)))
+
+    async def _send(self, spec: RequestSpec) -> ApiResponse:
+        """按 RequestSpec 发送单个请求"""
+        return await self.request(
+            spec.method,
+            spec.path,
+            params=spec.params,
+            headers=spec.headers,
+            json=spec.json,
+            data=spec.data,
+            files=spec.files,
+            raise_for_status=spec.raise_for_status,
+            content=spec.content,
+        )
+
     def set_header(self, key: str, value: str) -> None:
         """设置默认请求头
 
@@ -676,7 +1145,61 @@ class ApiClient:
             username: 用户名
             password: 密码
         """
-        import base64
-
         credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
         self.set_header("Authorization", f"Basic {credentials}")
+
+
+class ApiClientPool:
+    """按 base_url（及构造参数）复用 ApiClient 的客户端池
+
+    访问同一主机的调用方共享一个 ApiClient，从而共享同一个连接池。池本身由调用方
+    持有（如 Container），使用完毕后调用 ``aclose()`` 统一释放所有客户端。
+
+    注意：同一主机的客户端是共享的，``set_header`` 等修改默认请求头的操作会影响
+    所有使用者；需要独立认证信息时请传入不同的 ``headers``。
+
+    使用示例:
+        async with ApiClientPool() as pool:
+            client = pool.for_host("https://api.example.com", timeout=10.0)
+            response = await client.get("/users")
+    """
+
+    def __init__(self) -> None:
+        """初始化空的客户端池"""
+        self._clients: dict[tuple[Any, ...], ApiClient] = {}
+        self._lock = threading.Lock()
+
+    def for_host(self, base_url: str, **kwargs: Any) -> ApiClient:
+        """获取（或创建）指定主机的共享客户端
+
+        Args:
+            base_url: 基础 URL
+            **kwargs: 传给 ApiClient 的其余构造参数
+
+        Returns:
+            相同 base_url 与参数对应的同一个 ApiClient 实例
+        """
+        headers = kwargs.get("headers")
+        key = (
+            base_url.rstrip("/"),
+            tuple(sorted((k, v) for k, v in kwargs.items() if k != "headers")),
+            tuple(sorted(headers.items())) if headers else (),
+        )
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = ApiClient(base_url=base_url, **kwargs)
+            return client
+
+    async def aclose(self) -> None:
+        """关闭池中所有客户端并清空池"""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        await asyncio.gather(*(client.aclose() for client in clients))
+
+    async def __aenter__(self) -> "ApiClientPool":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
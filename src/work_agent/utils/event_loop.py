@@ -0,0 +1,123 @@
+"""后台事件循环 - 在同步调用方（CLI / REPL）中复用同一个 asyncio 事件循环"""
+
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+T = TypeVar("T")
+
+
+def new_event_loop(use_uvloop: bool = False) -> asyncio.AbstractEventLoop:
+    """创建事件循环，可选使用 uvloop（未安装时回退到标准 asyncio 循环）
+
+    不修改全局事件循环策略；需要让 asyncio.run() 也使用 uvloop 的调用方，
+    可自行执行 asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())。
+
+    Args:
+        use_uvloop: 是否优先使用 uvloop
+
+    Returns:
+        新的事件循环
+    """
+    if use_uvloop and UVLOOP_AVAILABLE:
+        loop: asyncio.AbstractEventLoop = uvloop.new_event_loop()
+        return loop
+    return asyncio.new_event_loop()
+
+
+class BackgroundEventLoop:
+    """运行在守护线程中的常驻事件循环
+
+    asyncio.run() 每次调用都会新建并关闭事件循环，绑定在旧循环上的连接池
+    （httpx / OpenAI SDK 客户端）随之失效。通过本类把所有协程提交到同一个
+    常驻循环，连接、TLS 会话等状态可以在多次调用之间复用。
+    """
+
+    def __init__(self, name: str = "work-agent-loop", use_uvloop: bool = False) -> None:
+        """初始化并启动后台事件循环
+
+        Args:
+            name: 后台线程名称
+            use_uvloop: 是否使用 uvloop（需安装 speedups 可选依赖）
+        """
+        self._loop = new_event_loop(use_uvloop)
+        self._thread = threading.Thread(target=self._run_forever, name=name, daemon=True)
+        self._thread.start()
+
+    def _run_forever(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """底层事件循环"""
+        return self._loop
+
+    @property
+    def is_running(self) -> bool:
+        """后台循环是否在运行"""
+        return self._thread.is_alive() and not self._loop.is_closed()
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """在后台循环中执行协程并阻塞等待结果
+
+        Args:
+            coro: 协程对象
+            timeout: 等待超时时间（秒），None 表示不限
+
+        Returns:
+            协程的返回值
+
+        Raises:
+            RuntimeError: 后台循环已关闭
+            TimeoutError: 等待超时
+        """
+        if not self.is_running:
+            coro.close()
+            raise RuntimeError("Background event loop is closed")
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    async def run_async(self, coro: Coroutine[Any, Any, T]) -> T:
+        """在后台循环中执行协程，并在调用方所在的事件循环中等待结果（不阻塞调用方循环）
+
+        用于 FastAPI 等自带事件循环的场景：连接池仍然绑定在后台循环上，调用方
+        只需 await 返回的结果。
+
+        Args:
+            coro: 协程对象
+
+        Returns:
+            协程的返回值
+
+        Raises:
+            RuntimeError: 后台循环已关闭
+        """
+        if not self.is_running:
+            coro.close()
+            raise RuntimeError("Background event loop is closed")
+        if asyncio.get_running_loop() is self._loop:
+            return await coro
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        return await asyncio.wrap_future(future)
+
+    def close(self) -> None:
+        """停止后台循环并释放资源（可重复调用）"""
+        if self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
@@ -0,0 +1,47 @@
+"""JSON 解析 - 优先使用 orjson（可选依赖），未安装时回退到标准库 json"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(data: bytes | str) -> Any:
+    """解析 JSON（orjson 可直接解析 bytes，免去 str 解码）
+
+    Args:
+        data: JSON 字节串或字符串
+
+    Returns:
+        解析后的对象
+
+    Raises:
+        ValueError: 内容不是合法 JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, default: Callable[[Any], Any] | None = None) -> bytes:
+    """序列化为紧凑的 UTF-8 JSON 字节串（非 ASCII 字符不转义）
+
+    Args:
+        obj: 待序列化对象
+        default: 无法序列化的对象的转换函数（可选）
+
+    Returns:
+        JSON 字节串
+
+    Raises:
+        TypeError: 对象无法序列化
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=default)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=default).encode()
@@ -0,0 +1,97 @@
+"""增量 SSE（Server-Sent Events）解析器
+
+按字节块增量解析 ``text/event-stream``：只扫描新到达的数据，事件完整（遇到空行）
+即返回，不需要先缓存整个响应体再 ``split``。可直接配合 ``ApiClient.stream()`` 使用。
+"""
+
+SSEEvent = tuple[str, bytes]  # (event 名称, data 原始字节)
+
+
+class SSEParser:
+    """增量 SSE 解析器
+
+    - data 保留为 bytes，调用方可直接交给 JSON 解析器，免去 str 解码
+    - 多行 data 按规范以 ``\\n`` 拼接；注释行（以 ``:`` 开头）、id / retry 字段被忽略
+    - 行尾支持 ``\\n`` 与 ``\\r\\n``
+
+    使用示例:
+        parser = SSEParser()
+        async for chunk in client.stream("POST", url, json=payload):
+            for event, data in parser.feed(chunk):
+                ...
+        for event, data in parser.flush():
+            ...
+    """
+
+    def __init__(self) -> None:
+        """初始化解析器"""
+        self._buffer = bytearray()
+        self._event = ""
+        self._data: list[bytes] = []
+
+    def feed(self, chunk: bytes) -> list[SSEEvent]:
+        """写入一块数据，返回其中已完整的事件
+
+        Args:
+            chunk: 响应体字节块（可在任意位置截断）
+
+        Returns:
+            已完整的 (event, data) 列表，未设置 event 字段时名称为 "message"
+        """
+        buffer = self._buffer
+        buffer += chunk
+        events: list[SSEEvent] = []
+        start = 0
+        # 通过 memoryview 切片，每行只在取出内容时拷贝一次；释放视图后才能裁剪缓冲区
+        with memoryview(buffer) as view:
+            while (end := buffer.find(b"\n", start)) != -1:
+                line_end = end - 1 if end > start and buffer[end - 1] == 0x0D else end
+                if start == line_end:
+                    # 空行：分发当前事件
+                    if self._data:
+                        events.append((self._event or "message", b"\n".join(self._data)))
+                        self._data = []
+                    self._event = ""
+                elif buffer.startswith(b"data:", start):
+                    # 快速路径：最常见的 data 行直接切出 value，不经过 partition
+                    value_start = start + 5
+                    if value_start < line_end and buffer[value_start] == 0x20:
+                        value_start += 1
+                    self._data.append(bytes(view[value_start:line_end]))
+                else:
+                    self._process_line(bytes(view[start:line_end]), events)
+                start = end + 1
+        del buffer[:start]
+        return events
+
+    def flush(self) -> list[SSEEvent]:
+        """在数据流结束时调用，返回缓冲区中剩余的事件（末尾缺少空行时）
+
+        Returns:
+            剩余的 (event, data) 列表
+        """
+        events: list[SSEEvent] = []
+        if self._buffer:
+            self._process_line(bytes(self._buffer).rstrip(b"\r"), events)
+            self._buffer.clear()
+        self._process_line(b"", events)
+        return events
+
+    def _process_line(self, line: bytes, events: list[SSEEvent]) -> None:
+        """处理单行：空行分发事件，其余按 field: value 记录"""
+        if not line:
+            if self._data:
+                events.append((self._event or "message", b"\n".join(self._data)))
+            self._event = ""
+            self._data = []
+            return
+        if line[0] == 0x3A:  # ":" 注释行
+            return
+
+        field, _, value = line.partition(b":")
+        if value[:1] == b" ":
+            value = value[1:]
+        if field == b"data":
+            self._data.append(value)
+        elif field == b"event":
+            self._event = value.decode("utf-8", errors="replace")
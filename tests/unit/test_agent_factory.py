@@ -0,0 +1,38 @@
+"""Agent 工厂单元测试"""
+
+from work_agent.adapters.llm.agent_factory import DEFAULT_INSTRUCTIONS, build_agent
+from work_agent.config import Config
+
+
+def _config(**kwargs) -> Config:
+    return Config(_env_file=None, openai_api_key="sk-test", **kwargs)  # type: ignore[call-arg]
+
+
+def test_build_agent_uses_default_instructions():
+    """测试未配置指令文件时使用内置默认指令"""
+    agent = build_agent(_config(), tools=[])
+
+    assert agent.instructions is DEFAULT_INSTRUCTIONS
+
+
+def test_build_agent_loads_instructions_file_and_extra(tmp_path):
+    """测试从文件加载指令并追加额外指令，相同输入复用同一字符串"""
+    path = tmp_path / "instructions.md"
+    path.write_text("你是测试助理。", encoding="utf-8")
+    config = _config(agent_instructions_file=str(path))
+
+    first = build_agent(config, tools=[], instructions_extra="只回答是或否。")
+    second = build_agent(config, tools=[], instructions_extra="只回答是或否。")
+
+    assert first.instructions == "你是测试助理。\n只回答是或否。"
+    assert first.instructions is second.instructions
+
+
+def test_build_agent_applies_max_concurrency():
+    """测试按配置设置 LLM 调用并发上限，<=0 表示不限制"""
+    limited = build_agent(_config(agent_max_concurrency=2), tools=[])
+    unlimited = build_agent(_config(agent_max_concurrency=0), tools=[])
+
+    assert limited._semaphore is not None
+    assert limited._semaphore._value == 2
+    assert unlimited._semaphore is None
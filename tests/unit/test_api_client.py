@@ -0,0 +1,256 @@
+"""通用 API 客户端单元测试（使用本地 HTTP 服务，不访问外网）"""
+
+import json
+import socket
+import threading
+from collections.abc import Iterator
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlencode
+
+import pytest
+
+from work_agent.utils.api_client import (
+    AIOHTTP_AVAILABLE,
+    HTTPX_AVAILABLE,
+    ApiClient,
+    ApiClientError,
+    ApiClientPool,
+    ApiResponse,
+    HttpError,
+    HttpMethod,
+    RequestSpec,
+    _encode_query,
+)
+from work_agent.utils.api_client import ConnectionError as ApiConnectionError
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """回显请求信息的测试处理器"""
+
+    def _reply(self, status: int, payload: object) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path.startswith("/missing"):
+            self._reply(404, {"error": "not found"})
+            return
+        self._reply(200, {"path": self.path, "auth": self.headers.get("Authorization")})
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length", 0))
+        self._reply(200, {"received": json.loads(self.rfile.read(length) or b"null")})
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def base_url() -> Iterator[str]:
+    """启动本地 HTTP 服务并返回其地址"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_get_parses_json_and_sends_default_headers(base_url):
+    """测试 GET 请求解析 JSON 并携带默认请求头"""
+    async with ApiClient(base_url=base_url) as client:
+        client.set_bearer_token("token-1")
+        response = await client.get("/items", params={"page": 1, "q": None})
+
+    assert response.ok
+    assert response.json() == {"path": "/items?page=1", "auth": "Bearer token-1"}
+
+
+@pytest.mark.asyncio
+async def test_post_json_and_error_status(base_url):
+    """测试 POST JSON 请求体与非 2xx 响应"""
+    async with ApiClient(base_url=base_url) as client:
+        posted = await client.post("/echo", json={"city": "北京"})
+        missing = await client.get("/missing")
+
+    assert posted.json() == {"received": {"city": "北京"}}
+    assert missing.status_code == 404
+    assert not missing.ok
+    assert missing.json() == {"error": "not found"}
+    assert missing.text() == '{"error": "not found"}'
+
+
+def test_response_text_decodes_bytes_lazily():
+    """测试 JSON 响应保留原始 bytes，raw_text / text() 始终返回解码后的 str"""
+    response = ApiResponse(status_code=200, headers={}, body={"a": 1}, raw=b'{"a": "\xe5\x8c\x97"}')
+
+    assert response.raw_text == '{"a": "北"}'
+    assert response.text() == '{"a": "北"}'
+    assert ApiResponse(status_code=200, headers={}, body="ok", raw_text="ok").raw_text == "ok"
+
+
+def test_build_url_fast_path_and_join_fallback():
+    """测试普通路径直接拼接，含 scheme / 相对段的路径仍走 urljoin"""
+    client = ApiClient(base_url="https://api.example.com/v1/")
+
+    assert client._build_url("/data/2.5/weather") == "https://api.example.com/v1/data/2.5/weather"
+    assert client._build_url("../v2/items") == "https://api.example.com/v2/items"
+    assert client._build_url("https://other.example.com/x") == "https://other.example.com/x"
+    assert (
+        client._build_url("/items?a=1", {"b": 2, "c": None})
+        == "https://api.example.com/v1/items?a=1&b=2"
+    )
+
+
+@pytest.mark.asyncio
+async def test_default_headers_not_mutated_by_requests(base_url):
+    """测试复用默认请求头时，发送 JSON 请求不会污染默认请求头"""
+    async with ApiClient(base_url=base_url, headers={"X-Test": "1"}) as client:
+        assert client._merge_headers() is client.config.default_headers
+        await client.post("/echo", json={"a": 1})
+
+    assert client.config.default_headers == {"X-Test": "1"}
+
+
+@pytest.mark.asyncio
+async def test_urllib_requests_use_dedicated_executor(base_url):
+    """测试 urllib 备选方案使用客户端自有线程池，并在 aclose 时释放"""
+    client = ApiClient(base_url=base_url, backend="urllib")
+    await client.get("/items")
+    executor = client._executor
+
+    assert executor is not None
+    await client.aclose()
+    assert client._executor is None
+    assert executor._shutdown
+
+
+def test_backend_auto_selection_and_missing_backend():
+    """测试自动选择后端优先 aiohttp，指定未安装的后端时报错"""
+    expected = "aiohttp" if AIOHTTP_AVAILABLE else "httpx" if HTTPX_AVAILABLE else "urllib"
+    assert ApiClient()._backend == expected
+
+    for backend, available in (("aiohttp", AIOHTTP_AVAILABLE), ("httpx", HTTPX_AVAILABLE)):
+        if not available:
+            with pytest.raises(ApiClientError):
+                ApiClient(backend=backend)
+
+
+def test_retry_backoff_is_exponential_with_jitter():
+    """测试重试等待时间按指数增长并带有上限为 10% 的随机抖动"""
+    client = ApiClient(retry_delay=1.0)
+
+    for attempt in range(4):
+        assert 2**attempt <= client._retry_backoff(attempt) <= 2**attempt + 0.1
+
+
+@pytest.mark.asyncio
+async def test_connection_refused_classified_as_connection_error():
+    """测试连接被拒绝时按异常类型归类为 ConnectionError"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    async with ApiClient(
+        base_url=f"http://127.0.0.1:{port}", retry_count=1, retry_delay=0
+    ) as client:
+        with pytest.raises(ApiConnectionError):
+            await client.get("/items")
+
+
+@pytest.mark.asyncio
+async def test_gather_preserves_order(base_url):
+    """测试 gather 并发发送请求并按输入顺序返回响应"""
+    specs = [RequestSpec("GET", f"/items/{i}") for i in range(5)]
+    specs.append(RequestSpec("POST", "/echo", json={"n": 5}))
+
+    async with ApiClient(base_url=base_url) as client:
+        responses = await client.gather(specs, limit=2)
+
+    assert [r.json()["path"] for r in responses[:5]] == [f"/items/{i}" for i in range(5)]
+    assert responses[5].json() == {"received": {"n": 5}}
+
+
+@pytest.mark.asyncio
+async def test_post_sends_preserialized_content(base_url):
+    """测试 content 原样作为请求体发送（stream 同样支持）"""
+    body = b'{"n": 1}'
+    headers = {"Content-Type": "application/json"}
+    async with ApiClient(base_url=base_url) as client:
+        response = await client.post("/echo", headers=headers, content=body)
+        streamed = b"".join(
+            [chunk async for chunk in client.stream("POST", "/echo", headers=headers, content=body)]
+        )
+
+    assert response.json() == {"received": {"n": 1}}
+    assert json.loads(streamed) == {"received": {"n": 1}}
+
+
+def test_response_status_lookup():
+    """测试 status 返回 HTTPStatus 枚举，未知状态码返回 None"""
+    assert ApiResponse(status_code=404, headers={}, body=None).status is HTTPStatus.NOT_FOUND
+    assert ApiResponse(status_code=599, headers={}, body=None).status is None
+
+
+def test_response_and_config_use_slots():
+    """测试 ApiResponse / ApiClientConfig 使用 __slots__，实例不再携带 __dict__"""
+    assert not hasattr(ApiResponse(status_code=200, headers={}, body=None), "__dict__")
+    assert not hasattr(ApiClient().config, "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_request_accepts_any_method_spelling(base_url):
+    """测试 method 支持枚举、大小写及混合写法"""
+    async with ApiClient(base_url=base_url) as client:
+        for method in (HttpMethod.GET, "GET", "get", "Get"):
+            assert (await client.request(method, "/items")).ok
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_chunks_and_raises_on_error_status(base_url):
+    """测试 stream 逐块返回响应体，非 2xx 响应抛出 HttpError"""
+    async with ApiClient(base_url=base_url) as client:
+        chunks = [chunk async for chunk in client.stream("GET", "/items", chunk_size=8)]
+
+        with pytest.raises(HttpError) as exc_info:
+            async for _ in client.stream("GET", "/missing"):
+                pass
+
+    assert all(len(chunk) <= 8 for chunk in chunks)
+    assert json.loads(b"".join(chunks)) == {"path": "/items", "auth": None}
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.response.json() == {"error": "not found"}
+
+
+@pytest.mark.parametrize(
+    "pairs",
+    [
+        [("q", "北京 天气"), ("page", 1), ("ratio", 0.5), ("flag", True)],
+        [("ids", [1, 2]), ("q", "a&b")],
+        [("raw", b"x y")],
+    ],
+)
+def test_encode_query_matches_urlencode(pairs):
+    """测试查询参数快速路径与 urlencode(doseq=True) 结果一致"""
+    assert _encode_query(pairs) == urlencode(pairs, doseq=True)
+
+
+@pytest.mark.asyncio
+async def test_client_pool_reuses_client_per_host(base_url):
+    """测试 ApiClientPool 对相同主机与参数复用同一个客户端，aclose 后清空"""
+    async with ApiClientPool() as pool:
+        client = pool.for_host(base_url, timeout=5.0, headers={"X-A": "1"})
+
+        assert pool.for_host(base_url + "/", timeout=5.0, headers={"X-A": "1"}) is client
+        assert pool.for_host(base_url, timeout=5.0) is not client
+        assert (await client.get("/items")).ok
+
+    assert pool.for_host(base_url, timeout=5.0, headers={"X-A": "1"}) is not client
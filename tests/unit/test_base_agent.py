@@ -0,0 +1,57 @@
+"""BaseAgent 单元测试"""
+
+import asyncio
+from typing import Any
+
+from work_agent.adapters.llm.base_agent import BaseAgent
+
+
+class _EchoAgent(BaseAgent):
+    """记录并发峰值的测试 Agent"""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def run(self, user_input: str, **kwargs) -> str:
+        async with self._concurrency_gate():
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.01)
+            self.active -= 1
+        return user_input.upper()
+
+    def add_tool(self, tool: Any) -> None:
+        pass
+
+
+def test_run_batch_preserves_order_and_limits_concurrency():
+    """测试批量运行保持输入顺序并遵守批次并发上限"""
+    agent = _EchoAgent()
+
+    result = asyncio.run(agent.run_batch(["a", "b", "c", "d", "e"], max_concurrency=2))
+
+    assert result == ["A", "B", "C", "D", "E"]
+    assert agent.peak == 2
+
+
+def test_run_batch_uses_agent_concurrency_gate():
+    """测试并发闸门小于批次上限时由闸门限流"""
+    agent = _EchoAgent()
+    agent.set_max_concurrency(1)
+
+    result = asyncio.run(agent.run_batch(["a", "b", "c"]))
+
+    assert result == ["A", "B", "C"]
+    assert agent.peak == 1
+
+
+def test_run_batch_limit_applies_below_agent_gate():
+    """测试批次上限小于并发闸门时，批次上限仍然生效"""
+    agent = _EchoAgent()
+    agent.set_max_concurrency(8)
+
+    result = asyncio.run(agent.run_batch(["a", "b", "c", "d", "e"], max_concurrency=2))
+
+    assert result == ["A", "B", "C", "D", "E"]
+    assert agent.peak == 2
@@ -0,0 +1,47 @@
+"""配置加载单元测试"""
+
+import sys
+
+import pytest
+
+from work_agent.config import Config, load_config
+
+
+@pytest.fixture
+def fresh_config(monkeypatch, tmp_path):
+    """隔离 .env，只从测试设置的环境变量读取配置"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("AGENT_BACKEND", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+
+
+def test_load_config_reads_current_environment(fresh_config, monkeypatch):
+    """测试每次调用都重新读取环境变量（不缓存为进程级单例）"""
+    first = load_config()
+    monkeypatch.setenv("AGENT_MODEL", "changed-model")
+
+    second = load_config()
+
+    assert second is not first
+    assert second.agent_model == "changed-model"
+
+
+def test_load_config_placeholder_key_exits(fresh_config, monkeypatch, capsys):
+    """测试占位 API Key 时一次性输出错误信息并退出"""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-your-api-key-here")
+
+    with pytest.raises(SystemExit) as exc_info:
+        load_config()
+
+    assert exc_info.value.code == 1
+    assert capsys.readouterr().err.startswith("Error: OPENAI_API_KEY not found")
+
+
+def test_config_interns_branch_fields():
+    """测试分支判断字段被驻留，与字面量为同一对象"""
+    config = Config(  # type: ignore[call-arg]
+        _env_file=None, agent_backend="".join(["q", "wen"]), session_backend="sqlite"
+    )
+
+    assert config.agent_backend is sys.intern("qwen")
+    assert config.session_backend is sys.intern("sqlite")
@@ -0,0 +1,74 @@
+"""依赖容器单元测试"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from work_agent.config import Config
+from work_agent.container import build_container, shutdown_container
+
+
+def _config(**kwargs) -> Config:
+    return Config(_env_file=None, openai_api_key="sk-test", **kwargs)  # type: ignore[call-arg]
+
+
+def test_container_builds_heavy_dependencies_lazily():
+    """测试 Agent 等依赖在首次访问时才构建，且只构建一次"""
+    container = build_container(_config())
+
+    try:
+        assert "agent" not in vars(container)
+        assert container.tool_count == len(container.tool_names)
+
+        service = container.agent_service
+
+        assert "agent" in vars(container)
+        assert container.agent_service is service
+        assert service.agent is container.agent
+    finally:
+        shutdown_container(container)
+
+    assert not container.loop.is_running
+
+
+def test_weather_service_disabled_without_api_key():
+    """测试未配置 WEATHER_API_KEY 时 Weather 服务为 None 且不登记资源"""
+    container = build_container(_config(weather_api_key=""))
+
+    try:
+        assert container.weather_service is None
+        assert container._resources == []
+    finally:
+        shutdown_container(container)
+
+
+def test_shutdown_closes_sync_and_async_resources():
+    """测试关闭时同时处理异步与同步资源，单个失败不影响其他资源"""
+    container = build_container(_config())
+    async_resource = MagicMock(spec=["aclose"])
+    async_resource.aclose = AsyncMock(side_effect=RuntimeError("boom"))
+    sync_resource = MagicMock(spec=["close"])
+    container._resources.extend([async_resource, sync_resource])
+
+    shutdown_container(container)
+
+    async_resource.aclose.assert_awaited_once()
+    sync_resource.close.assert_called_once()
+    assert not container.loop.is_running
+
+
+def test_shutdown_closes_in_reverse_order_and_awaits_close_results():
+    """测试按构建顺序逆序关闭，同步 close() 返回的 awaitable 会被等待"""
+    container = build_container(_config())
+    order: list[str] = []
+
+    async def _closed(name: str) -> None:
+        order.append(name)
+
+    client = MagicMock(spec=["close"])
+    client.close = lambda: _closed("client")
+    agent = MagicMock(spec=["aclose"])
+    agent.aclose = lambda: _closed("agent")
+    container._resources.extend([client, agent])
+
+    shutdown_container(container)
+
+    assert order == ["agent", "client"]
@@ -40,3 +40,12 @@ def test_agent_response_immutability():
 
     with pytest.raises(AttributeError):  # frozen dataclass
         response.content = "new content"  # type: ignore
+
+
+def test_domain_models_use_slots():
+    """测试领域模型使用 slots（实例不携带 __dict__）"""
+    request = AgentRequest(user_input="test", trace_id="trace")
+    response = AgentResponse(content="test", trace_id="trace")
+
+    assert not hasattr(request, "__dict__")
+    assert not hasattr(response, "__dict__")
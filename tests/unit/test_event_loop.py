@@ -0,0 +1,57 @@
+"""后台事件循环单元测试"""
+
+import asyncio
+
+import pytest
+
+from work_agent.utils.event_loop import UVLOOP_AVAILABLE, BackgroundEventLoop
+
+
+def test_run_reuses_same_loop():
+    """测试多次 run 在同一个事件循环中执行"""
+    background = BackgroundEventLoop()
+
+    async def current_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    try:
+        first = background.run(current_loop())
+        second = background.run(current_loop())
+        assert first is second is background.loop
+    finally:
+        background.close()
+
+
+def test_run_propagates_exceptions():
+    """测试协程异常传递给调用方"""
+    background = BackgroundEventLoop()
+
+    async def boom() -> None:
+        raise ValueError("boom")
+
+    try:
+        with pytest.raises(ValueError):
+            background.run(boom())
+    finally:
+        background.close()
+
+
+def test_run_after_close_raises():
+    """测试关闭后提交协程报错，close 可重复调用"""
+    background = BackgroundEventLoop()
+    background.close()
+    background.close()
+
+    with pytest.raises(RuntimeError):
+        background.run(asyncio.sleep(0))
+
+
+def test_use_uvloop_falls_back_when_unavailable():
+    """测试请求 uvloop 时按可用性选择循环实现，未安装时回退到标准循环"""
+    background = BackgroundEventLoop(use_uvloop=True)
+
+    try:
+        assert background.run(asyncio.sleep(0, result="ok")) == "ok"
+        assert type(background.loop).__module__.startswith("uvloop") is UVLOOP_AVAILABLE
+    finally:
+        background.close()
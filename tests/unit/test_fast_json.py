@@ -0,0 +1,38 @@
+"""fast_json 单元测试"""
+
+import pytest
+
+from work_agent.utils import fast_json
+
+
+@pytest.mark.parametrize(
+    "data", ['{"city": "北京", "days": 3}', '{"city": "北京", "days": 3}'.encode()]
+)
+def test_loads_accepts_str_and_bytes(data):
+    """测试 str 与 bytes 解析结果一致"""
+    assert fast_json.loads(data) == {"city": "北京", "days": 3}
+
+
+def test_loads_without_orjson(monkeypatch):
+    """测试未安装 orjson 时回退到标准库"""
+    monkeypatch.setattr(fast_json, "ORJSON_AVAILABLE", False)
+
+    assert fast_json.loads(b"[1, 2]") == [1, 2]
+
+
+def test_loads_invalid_raises_value_error():
+    """测试非法 JSON 抛出 ValueError"""
+    with pytest.raises(ValueError):
+        fast_json.loads("{not json")
+
+
+@pytest.mark.parametrize("orjson_available", [True, False])
+def test_dumps_compact_utf8(monkeypatch, orjson_available):
+    """测试序列化为紧凑的 UTF-8 字节串，两种实现结果一致"""
+    if orjson_available and not fast_json.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(fast_json, "ORJSON_AVAILABLE", orjson_available)
+
+    assert (
+        fast_json.dumps({"city": "北京", "days": [1, 2]}) == '{"city":"北京","days":[1,2]}'.encode()
+    )
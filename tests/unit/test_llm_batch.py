@@ -0,0 +1,55 @@
+"""Batch API 适配器单元测试（不发起真实网络请求）"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from work_agent.adapters.llm.batch import BATCH_ENDPOINT, BatchSubmitter, build_batch_requests
+
+
+def test_build_batch_requests():
+    """测试每个输入生成一条带序号 custom_id 的请求"""
+    lines = build_batch_requests(["a", "b"], model="qwen-plus", instructions="sys")
+
+    assert [line["custom_id"] for line in lines] == ["request-0", "request-1"]
+    assert lines[1]["url"] == BATCH_ENDPOINT
+    assert lines[1]["body"]["messages"] == [
+        {"role": "system", "content": "sys"},
+        {"role": "user", "content": "b"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_submit_uploads_jsonl_and_creates_batch():
+    """测试提交流程：上传 JSONL 文件后创建 batch 任务"""
+    submitter = BatchSubmitter(model="gpt-4o", instructions="sys", api_key="test-key")
+    submitter.client.files.create = AsyncMock(return_value=SimpleNamespace(id="file-1"))
+    submitter.client.batches.create = AsyncMock(return_value=SimpleNamespace(id="batch-1"))
+
+    batch_id = await submitter.submit(["你好", "现在几点了？"])
+
+    assert batch_id == "batch-1"
+    _, payload = submitter.client.files.create.call_args.kwargs["file"]
+    assert [
+        json.loads(line)["body"]["messages"][1]["content"] for line in payload.splitlines()
+    ] == [
+        "你好",
+        "现在几点了？",
+    ]
+    submitter.client.batches.create.assert_awaited_once_with(
+        input_file_id="file-1", endpoint=BATCH_ENDPOINT, completion_window="24h"
+    )
+    assert {json.loads(line)["url"] for line in payload.splitlines()} == {submitter.endpoint}
+    await submitter.aclose()
+
+
+@pytest.mark.asyncio
+async def test_submit_rejects_empty_prompts():
+    """测试空输入直接报错"""
+    submitter = BatchSubmitter(model="gpt-4o", instructions="sys", api_key="test-key")
+
+    with pytest.raises(ValueError):
+        await submitter.submit([])
+    await submitter.aclose()
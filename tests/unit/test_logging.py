@@ -0,0 +1,130 @@
+"""日志配置单元测试"""
+
+import json
+import logging
+
+import pytest
+
+from work_agent.adapters.observability.context import reset_trace_id, set_trace_id
+from work_agent.logging import (
+    LOG_FORMAT,
+    JsonFormatter,
+    StructuredFilter,
+    TraceContextFilter,
+    configure_logging,
+)
+
+
+def _format(**extra) -> str:
+    record = logging.LogRecord("work_agent.test", logging.INFO, __file__, 1, "hello", None, None)
+    for key, value in extra.items():
+        setattr(record, key, value)
+    assert StructuredFilter().filter(record)
+    return logging.Formatter("%(message)s%(structured_suffix)s").format(record)
+
+
+@pytest.mark.parametrize(
+    ("extra", "expected"),
+    [
+        ({}, "hello"),
+        ({"trace_id": "req_1"}, "hello | trace_id=req_1"),
+        ({"trace_id": "req_1", "tool_name": "echo"}, "hello | trace_id=req_1 tool=echo"),
+    ],
+)
+def test_structured_filter_builds_suffix(extra, expected):
+    """测试过滤器预先拼接结构化字段"""
+    assert _format(**extra) == expected
+
+
+def test_log_format_uses_structured_suffix():
+    """测试默认格式包含结构化字段占位"""
+    assert LOG_FORMAT.endswith("%(structured_suffix)s")
+
+
+@pytest.fixture
+def restore_logging():
+    """恢复全局日志状态，避免影响其他测试"""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    logging.raiseExceptions = True
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_configure_logging_filters_by_level_without_global_disable(restore_logging):
+    """测试低于配置级别的日志被过滤，显式设为 DEBUG 的 logger 不受影响"""
+    verbose = logging.getLogger("work_agent.test.verbose")
+    verbose.setLevel(logging.DEBUG)
+    try:
+        configure_logging("WARNING")
+
+        assert not logging.getLogger("work_agent.test").isEnabledFor(logging.INFO)
+        assert logging.getLogger("work_agent.test").isEnabledFor(logging.WARNING)
+        assert verbose.isEnabledFor(logging.DEBUG)
+    finally:
+        verbose.setLevel(logging.NOTSET)
+
+
+def test_configure_logging_is_idempotent(restore_logging):
+    """测试重复调用只调整级别，不重建 handler"""
+    configure_logging("INFO")
+    handler = logging.getLogger().handlers[0]
+
+    configure_logging("INFO")
+    configure_logging("error")
+
+    assert logging.getLogger().handlers == [handler]
+    assert logging.getLogger().level == logging.ERROR
+
+
+def test_json_formatter_emits_one_json_line():
+    """测试 JSON 格式化器输出单行 JSON 并携带结构化字段"""
+    record = logging.LogRecord(
+        "work_agent.test", logging.INFO, __file__, 1, "hi %s", ("北京",), None
+    )
+    record.trace_id = "req_1"
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["msg"] == "hi 北京"
+    assert entry["level"] == "INFO"
+    assert entry["trace_id"] == "req_1"
+    assert "tool" not in entry
+
+
+def test_configure_logging_switches_format(restore_logging):
+    """测试重复调用可切换输出格式"""
+    configure_logging("INFO", "json")
+    handler = logging.getLogger().handlers[0]
+    assert isinstance(handler.formatter, JsonFormatter)
+
+    configure_logging("INFO", "text")
+
+    assert logging.getLogger().handlers == [handler]
+    assert not isinstance(handler.formatter, JsonFormatter)
+
+
+def test_configure_logging_leaves_handler_level_unset(restore_logging):
+    """测试 handler 不重复设置级别，由根 logger 统一过滤"""
+    configure_logging("WARNING")
+
+    assert logging.getLogger().handlers[0].level == logging.NOTSET
+    assert logging.raiseExceptions is False
+
+
+def test_trace_context_filter_reads_context_and_keeps_explicit_value():
+    """测试从上下文附加 trace_id，显式 extra 优先"""
+    token = set_trace_id("req_ctx")
+    try:
+        implicit = logging.LogRecord("work_agent.test", logging.INFO, __file__, 1, "m", None, None)
+        explicit = logging.LogRecord("work_agent.test", logging.INFO, __file__, 1, "m", None, None)
+        explicit.trace_id = "req_explicit"
+
+        TraceContextFilter().filter(implicit)
+        TraceContextFilter().filter(explicit)
+    finally:
+        reset_trace_id(token)
+
+    assert implicit.trace_id == "req_ctx"
+    assert explicit.trace_id == "req_explicit"
@@ -1,11 +1,16 @@
 """Agent Service 单元测试"""
 
-from unittest.mock import MagicMock
+import asyncio
+import io
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from work_agent.adapters.observability.context import get_trace_id
 from work_agent.config import Config
+from work_agent.domain.errors import AgentExecutionError
 from work_agent.services.agent_service import AgentService
+from work_agent.utils.event_loop import BackgroundEventLoop
 
 
 @pytest.fixture
@@ -54,3 +59,82 @@ def test_run_once_with_custom_trace_id(mock_agent, mock_runner, mock_config):
 
     assert result is not None
     mock_runner.run.assert_called_once()
+
+
+def test_run_once_uses_injected_event_loop(mock_runner, mock_config):
+    """测试注入常驻事件循环时在该循环中执行 Agent"""
+    agent = MagicMock()
+    agent.run = AsyncMock(return_value="loop response")
+    agent.warmup = AsyncMock()
+    loop = BackgroundEventLoop()
+    service = AgentService(agent=agent, runner=mock_runner, config=mock_config, loop=loop)
+
+    try:
+        service.warmup()
+        assert service.run_once("test input") == "loop response"
+    finally:
+        loop.close()
+
+    agent.warmup.assert_awaited_once()
+    agent.run.assert_awaited_once_with("test input")
+
+
+def test_arun_once_awaits_agent(mock_runner, mock_config):
+    """测试异步运行直接 await Agent"""
+    agent = MagicMock()
+    agent.run = AsyncMock(return_value="async response")
+    service = AgentService(agent=agent, runner=mock_runner, config=mock_config)
+
+    assert asyncio.run(service.arun_once("test input")) == "async response"
+    agent.run.assert_awaited_once_with("test input")
+
+
+def test_arun_once_wraps_errors(mock_runner, mock_config):
+    """测试异步运行失败时抛出 AgentExecutionError"""
+    agent = MagicMock()
+    agent.run = AsyncMock(side_effect=RuntimeError("boom"))
+    loop = BackgroundEventLoop()
+    service = AgentService(agent=agent, runner=mock_runner, config=mock_config, loop=loop)
+
+    try:
+        with pytest.raises(AgentExecutionError):
+            asyncio.run(service.arun_once("test input"))
+    finally:
+        loop.close()
+
+
+def test_run_once_propagates_trace_id_to_agent_loop(mock_runner, mock_config):
+    """测试 trace_id 随协程传递到常驻循环，调用结束后上下文恢复"""
+    seen: list[str | None] = []
+
+    async def run(user_input: str) -> str:
+        seen.append(get_trace_id())
+        return "ok"
+
+    agent = MagicMock()
+    agent.run = run
+    loop = BackgroundEventLoop()
+    service = AgentService(agent=agent, runner=mock_runner, config=mock_config, loop=loop)
+
+    try:
+        service.run_once("test input", trace_id="req_loop")
+    finally:
+        loop.close()
+
+    assert seen == ["req_loop"]
+    assert get_trace_id() is None
+
+
+def test_repl_reads_piped_stdin(mock_runner, mock_config, monkeypatch, capsys):
+    """测试非交互输入时逐行读取 stdin，空行跳过，EOF 后退出"""
+    agent = MagicMock()
+    agent.run = AsyncMock(side_effect=lambda text: f"echo {text}")
+    monkeypatch.setattr("sys.stdin", io.StringIO("first\n\nsecond\n"))
+    service = AgentService(agent=agent, runner=mock_runner, config=mock_config)
+
+    service.repl()
+
+    out = capsys.readouterr().out
+    assert "Agent: echo first" in out
+    assert "Agent: echo second" in out
+    assert agent.run.await_count == 2
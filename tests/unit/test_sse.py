@@ -0,0 +1,50 @@
+"""增量 SSE 解析器单元测试"""
+
+from work_agent.utils.sse import SSEParser
+
+STREAM = (
+    b": keep-alive\n"
+    b'data: {"a": 1}\n\n'
+    b"event: update\r\n"
+    b"data: line1\r\n"
+    b"data: line2\r\n\r\n"
+    b"id: 7\n"
+    b"data:[DONE]\n\n"
+)
+
+
+def test_feed_whole_stream():
+    """测试一次写入完整数据流：注释被忽略，多行 data 拼接，event 名称生效"""
+    parser = SSEParser()
+
+    assert parser.feed(STREAM) == [
+        ("message", b'{"a": 1}'),
+        ("update", b"line1\nline2"),
+        ("message", b"[DONE]"),
+    ]
+    assert parser.flush() == []
+
+
+def test_feed_byte_by_byte_matches_whole_stream():
+    """测试在任意位置截断数据块时结果一致"""
+    parser = SSEParser()
+    events = []
+    for i in range(len(STREAM)):
+        events.extend(parser.feed(STREAM[i : i + 1]))
+
+    assert events == SSEParser().feed(STREAM)
+
+
+def test_flush_returns_trailing_event_without_blank_line():
+    """测试数据流末尾缺少空行时，flush 返回剩余事件"""
+    parser = SSEParser()
+
+    assert parser.feed(b"data: tail") == []
+    assert parser.flush() == [("message", b"tail")]
+
+
+def test_blank_line_resets_event_name():
+    """测试空行结束事件后 event 名称被重置（即使没有 data）"""
+    parser = SSEParser()
+
+    assert parser.feed(b"event: ping\n\ndata: x\n\n") == [("message", b"x")]
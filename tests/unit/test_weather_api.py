@@ -0,0 +1,136 @@
+"""Weather API 客户端单元测试（不发起真实网络请求）"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from work_agent.adapters.external.apis.weather_api import WeatherApiClient
+from work_agent.adapters.external.models.weather import WeatherFields
+from work_agent.utils.api_client import ApiClientError, ApiResponse
+
+PAYLOAD = {
+    "name": "Beijing",
+    "main": {"temp": 20.5, "feels_like": 19.0, "humidity": 40, "pressure": 1012},
+    "weather": [{"description": "晴"}],
+    "wind": {"speed": 2.1},
+}
+FIELDS = WeatherFields(
+    temp=20.5, feels_like=19.0, humidity=40, pressure=1012, description="晴", wind_speed=2.1
+)
+
+
+def _make_client(**kwargs) -> WeatherApiClient:
+    """构造 HTTP 层被 mock 的 WeatherApiClient"""
+    client = WeatherApiClient(base_url="https://weather.test", api_key="test-key", **kwargs)
+    client.client.get = AsyncMock(  # type: ignore[method-assign]
+        return_value=ApiResponse(status_code=200, headers={}, body=PAYLOAD)
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_get_weather_uses_cache_for_repeated_city():
+    """测试相同城市（忽略大小写与空白）命中缓存"""
+    client = _make_client()
+
+    first = await client.get_weather("Beijing")
+    second = await client.get_weather("  beijing ")
+
+    assert first == second == FIELDS
+    client.client.get.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_weather_cache_disabled():
+    """测试 cache_ttl=0 时每次都请求 API"""
+    client = _make_client(cache_ttl=0)
+
+    await client.get_weather("Beijing")
+    await client.get_weather("Beijing")
+
+    assert client.client.get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_weather_coalesces_concurrent_requests():
+    """测试并发的相同查询只发出一次 HTTP 请求"""
+    client = _make_client(cache_ttl=0)
+
+    results = await asyncio.gather(*(client.get_weather("Beijing") for _ in range(3)))
+
+    assert results == [FIELDS] * 3
+    client.client.get.assert_awaited_once()
+    assert client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_health_check_uses_head():
+    """测试健康检查使用 HEAD 请求，2xx/3xx 与 405（不支持 HEAD）视为可用"""
+    client = _make_client()
+    client.client.head = AsyncMock(  # type: ignore[method-assign]
+        return_value=ApiResponse(status_code=405, headers={}, body="")
+    )
+    assert await client.health_check() is True
+
+    client.client.head.return_value = ApiResponse(status_code=204, headers={}, body="")
+    assert await client.health_check() is True
+
+    client.client.head.return_value = ApiResponse(status_code=503, headers={}, body="")
+    assert await client.health_check() is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code", [401, 403, 404])
+async def test_health_check_reports_client_errors_as_unhealthy(status_code):
+    """测试 API Key 无效/过期（401/403）或路径错误（404）时健康检查失败"""
+    client = _make_client()
+    client.client.head = AsyncMock(  # type: ignore[method-assign]
+        return_value=ApiResponse(status_code=status_code, headers={}, body="")
+    )
+    assert await client.health_check() is False
+
+
+@pytest.mark.asyncio
+async def test_get_weather_rejects_incomplete_payload():
+    """测试响应缺少必要字段时转换为 ApiClientError"""
+    client = _make_client()
+    client.client.get.return_value = ApiResponse(status_code=200, headers={}, body={"name": "X"})
+
+    with pytest.raises(ApiClientError):
+        await client.get_weather("Nowhere")
+
+
+@pytest.mark.asyncio
+async def test_get_weather_normalizes_city_suffix_for_cache():
+    """测试 "北京市" / "北京"、大小写与首尾空白不同的城市名共享缓存"""
+    client = _make_client()
+
+    await client.get_weather("北京市")
+    await client.get_weather("北京")
+    await client.get_weather("  Beijing ")
+    await client.get_weather("beijing")
+
+    assert client.client.get.await_count == 2
+    assert client.client.get.await_args_list[0].kwargs["params"]["q"] == "北京市"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        ("Mexico City", "Mexico"),
+        ("Kuwait City", "Kuwait"),
+        ("Panama City", "Panama"),
+        ("Felicity", "Feli"),
+    ],
+)
+async def test_get_weather_keeps_english_city_names_distinct(first, second):
+    """测试英文 "city" 不被当作后缀去除，不同地点不会共用缓存"""
+    client = _make_client()
+
+    await client.get_weather(first)
+    await client.get_weather(second)
+
+    assert client.client.get.await_count == 2
+    assert [c.kwargs["params"]["q"] for c in client.client.get.await_args_list] == [first, second]
@@ -0,0 +1,97 @@
+"""Weather Service 单元测试"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from work_agent.adapters.external.models.weather import WeatherFields
+from work_agent.adapters.external.services.weather_service import (
+    WeatherService,
+    WeatherServiceError,
+)
+from work_agent.utils.api_client import ApiClientError
+
+
+def _fields(temp: float = 20.0) -> WeatherFields:
+    """构造天气摘要字段"""
+    return WeatherFields(
+        temp=temp, feels_like=temp - 1, humidity=50, pressure=1013, description="晴", wind_speed=3.5
+    )
+
+
+@pytest.fixture
+def mock_api():
+    """Mock WeatherApiClient"""
+    api = MagicMock()
+    api.get_weather = AsyncMock(return_value=_fields())
+    return api
+
+
+@pytest.mark.asyncio
+async def test_get_weather_summary_success(mock_api):
+    """测试获取单个城市天气摘要"""
+    service = WeatherService(mock_api)
+
+    result = await service.get_weather_summary("Beijing")
+
+    assert "Beijing" in result
+    assert "20.0°C" in result
+    assert "风速: 3.5 m/s" in result
+    mock_api.get_weather.assert_awaited_once_with("Beijing")
+
+
+@pytest.mark.asyncio
+async def test_get_weather_summary_api_error(mock_api):
+    """测试 API 异常转换为领域异常"""
+    mock_api.get_weather.side_effect = ApiClientError("boom")
+    service = WeatherService(mock_api)
+
+    with pytest.raises(WeatherServiceError):
+        await service.get_weather_summary("Beijing")
+
+
+@pytest.mark.asyncio
+async def test_get_weather_summaries_bulk_keeps_order_and_isolates_errors(mock_api):
+    """测试批量查询保持顺序，单个城市失败不影响其他城市"""
+
+    async def fake_get_weather(city: str) -> WeatherFields:
+        if city == "Nowhere":
+            raise ApiClientError("city not found", status_code=404)
+        return _fields(temp=float(len(city)))
+
+    mock_api.get_weather.side_effect = fake_get_weather
+    service = WeatherService(mock_api)
+
+    results = await service.get_weather_summaries_bulk(["Tokyo", "Nowhere", "Paris"])
+
+    assert len(results) == 3
+    assert "Tokyo" in results[0]
+    assert results[1].startswith("❌ Nowhere")
+    assert "Paris" in results[2]
+    assert mock_api.get_weather.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_weather_summaries_bulk_limits_concurrency(mock_api):
+    """测试批量查询的并发数不超过 max_concurrency"""
+    active = 0
+    peak = 0
+
+    async def fake_get_weather(city: str) -> WeatherFields:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return _fields()
+
+    mock_api.get_weather.side_effect = fake_get_weather
+    service = WeatherService(mock_api)
+
+    results = await service.get_weather_summaries_bulk(
+        [f"city{i}" for i in range(6)], max_concurrency=2
+    )
+
+    assert len(results) == 6
+    assert peak == 2
@@ -10,17 +10,30 @@
     export TEST_API_MODEL=gpt-5
     python tests/unit/verify_api_agent_support.py
 
+    配置多个渠道时，各渠道的测试并发执行，共享同一个 ApiClient 连接池。
+
     # 方式 2: 从 test_chat.py 读取配置
     # 编辑脚本，取消注释相关代码段
 """
 
+import asyncio
+import itertools
 import json
 import logging
 import os
 import sys
+from collections.abc import AsyncGenerator, AsyncIterator, Iterator
+from contextlib import aclosing
 from pathlib import Path
 
-import requests
+# 添加项目路径
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from work_agent.utils.api_client import ApiClient, HttpError  # noqa: E402
+from work_agent.utils.fast_json import dumps as json_dumps  # noqa: E402
+from work_agent.utils.fast_json import loads as json_loads  # noqa: E402
+from work_agent.utils.sse import SSEParser  # noqa: E402
 
 # 直接定义测试配置（从 test_chat.py 提取）
 # ⚠️ 安全提示: 不要在这里硬编码真实的 API key！
@@ -57,93 +70,235 @@ CHANNELS = [
 # 过滤掉空配置
 CHANNELS = [ch for ch in CHANNELS if ch["api_url"] and ch["api_key"]]
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s"
-)
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# 报告分隔线；_SECTION 带前置空行，作为一条日志输出，并发渠道的日志不会把空行与分隔线拆开
+_BANNER = "=" * 60
+_SECTION = "\n" + _BANNER
+
+# 请求中不变的部分只构建一次，各渠道、各次调用共享（只读，不要修改）
+_HEADERS_TEMPLATE = {"Content-Type": "application/json"}
+
+# 测试 2 使用的工具定义
+_WEATHER_TOOLS = (
+    {
+        "type": "function",
+        "function": {
+            "name": "get_weather",
+            "description": "获取指定城市的天气信息",
+            "parameters": {
+                "type": "object",
+                "properties": {"city": {"type": "string", "description": "城市名称，如北京、上海"}},
+                "required": ["city"],
+            },
+        },
+    },
+)
+
+# 测试 3 使用的工具定义
+_TIME_TOOLS = (
+    {
+        "type": "function",
+        "function": {
+            "name": "get_time",
+            "description": "获取当前时间",
+            "parameters": {"type": "object", "properties": {}},
+        },
+    },
+)
+
+# 各测试的请求体模板（不含 model）
+_BASE_PAYLOAD_CHAT = {
+    "messages": [{"role": "user", "content": "你好，请简单回复"}],
+    "stream": False,
+}
+_BASE_PAYLOAD_FC = {
+    "messages": [{"role": "user", "content": "北京现在的天气怎么样？"}],
+    "tools": _WEATHER_TOOLS,
+    "tool_choice": "auto",
+    "stream": False,
+}
+_BASE_PAYLOAD_STREAM_FC = {
+    "messages": [{"role": "user", "content": "现在几点了？"}],
+    "tools": _TIME_TOOLS,
+    "stream": True,
+}
+
+# 测试 1 读取响应体的上限，防止异常端点返回超大响应占满内存
+_MAX_RESPONSE_BYTES = 1_048_576
+
+# 模板只序列化一次；各渠道仅序列化 model 并拼接到对象开头（model 为首个键，结果与
+# 重新序列化完整 dict 等价），请求体直接以 bytes 发送
+_BODY_CHAT = json_dumps(_BASE_PAYLOAD_CHAT)
+_BODY_FC = json_dumps(_BASE_PAYLOAD_FC)
+_BODY_STREAM_FC = json_dumps(_BASE_PAYLOAD_STREAM_FC)
+
+
+def build_body(template: bytes, model: str) -> bytes:
+    """在预序列化的请求体模板中填入 model
 
-def test_basic_chat(api_url: str, api_key: str, model: str) -> bool:
+    Args:
+        template: json_dumps 得到的请求体模板（JSON 对象，不含 model）
+        model: 模型名称
+
+    Returns:
+        bytes: 完整请求体
+    """
+    return b'{"model":' + json_dumps(model) + b"," + template[1:]
+
+
+async def test_basic_chat(client: ApiClient, api_url: str, api_key: str, model: str) -> bool:
     """测试基础对话功能
 
     Returns:
         bool: 是否支持基础对话
     """
-    logger.info("=" * 60)
+    logger.info(_BANNER)
     logger.info("测试 1: 基础对话功能")
-    logger.info("=" * 60)
+    logger.info(_BANNER)
 
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
+    headers = {**_HEADERS_TEMPLATE, "Authorization": f"Bearer {api_key}"}
 
-    payload = {
-        "model": model,
-        "messages": [
-            {"role": "user", "content": "你好，请简单回复"}
-        ],
-        "stream": False,
-    }
+    body = build_body(_BODY_CHAT, model)
 
     try:
-        response = requests.post(api_url, headers=headers, json=payload, timeout=30)
-
-        if response.status_code != 200:
-            logger.error(f"❌ HTTP 状态码: {response.status_code}")
-            logger.error(f"响应: {response.text}")
+        chunks = client.stream("POST", api_url, headers=headers, content=body)
+        raw = await read_capped(chunks, _MAX_RESPONSE_BYTES)
+        if raw is None:
+            logger.warning("⚠️  响应体超过 %d 字节，已中止读取", _MAX_RESPONSE_BYTES)
             return False
 
         # 尝试解析 JSON
         try:
-            data = response.json()
+            data = json_loads(raw)
+        except ValueError:
+            data = None
+        if isinstance(data, dict):
             content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-            logger.info(f"✅ 基础对话成功")
-            logger.info(f"响应: {content[:100]}...")
+            logger.info("✅ 基础对话成功")
+            logger.info("响应: %.100s...", content)
             return True
-        except json.JSONDecodeError:
+        else:
             # 可能是 SSE 格式，尝试解析流式响应
             logger.info("检测到流式响应格式，尝试解析...")
-            content = parse_sse_response(response.text)
+            content = parse_sse_response(raw)
             if content:
-                logger.info(f"✅ 基础对话成功 (流式)")
-                logger.info(f"响应: {content[:100]}...")
+                logger.info("✅ 基础对话成功 (流式)")
+                logger.info("响应: %.100s...", content)
                 return True
             else:
                 logger.error("❌ 无法解析响应")
                 return False
 
+    except HttpError as e:
+        logger.error("❌ HTTP 状态码: %s", e.status_code)
+        logger.error("响应: %s", e.response.text())
+        return False
     except Exception as e:
-        logger.error(f"❌ 请求失败: {e}")
+        logger.error("❌ 请求失败: %s", e)
         return False
 
 
-def parse_sse_response(text: str) -> str:
+async def read_capped(chunks: AsyncGenerator[bytes, None], limit: int) -> bytes | None:
+    """读取流式响应体，超过上限时立即停止并关闭连接
+
+    Args:
+        chunks: ApiClient.stream() 返回的字节块生成器
+        limit: 允许的最大字节数
+
+    Returns:
+        bytes | None: 完整响应体，超过上限时为 None
+    """
+    buffer = bytearray()
+    async with aclosing(chunks) as stream:
+        async for chunk in stream:
+            buffer += chunk
+            if len(buffer) > limit:
+                return None
+    return bytes(buffer)
+
+
+def iter_sse_data(body: bytes) -> Iterator[bytes]:
+    """增量解析 SSE 响应体，逐个返回事件的 data，遇到 [DONE] 停止
+
+    Args:
+        body: SSE 格式响应体
+
+    Yields:
+        bytes: 单个事件的 data
+    """
+    parser = SSEParser()
+    for _, data in itertools.chain(parser.feed(body), parser.flush()):
+        if data == b"[DONE]":
+            return
+        yield data
+
+
+_CONTENT_KEY = b'"content":"'
+
+
+def _scan_delta_content(data: bytes) -> str | None:
+    """不构建 JSON 对象，直接在字节中扫描出 ``"content":"..."`` 的值
+
+    仅处理最常见的紧凑格式、且只出现一次 content 的事件；含 tool_calls、
+    content 为 null、带空格等其余情况返回 None，由调用方回退到完整 JSON 解析。
+
+    Args:
+        data: 单个 SSE 事件的 data
+
+    Returns:
+        str | None: content 文本，无法走快速路径时为 None
+    """
+    start = data.find(_CONTENT_KEY)
+    if start == -1 or b'"tool_calls"' in data:
+        return None
+    start += len(_CONTENT_KEY)
+    end = data.find(b'"', start)
+    # 跳过被反斜杠转义的引号：引号前连续反斜杠为奇数个时说明被转义
+    while end != -1:
+        backslashes = 0
+        while data[end - 1 - backslashes] == 0x5C:
+            backslashes += 1
+        if not backslashes % 2:
+            break
+        end = data.find(b'"', end + 1)
+    if end == -1 or data.find(_CONTENT_KEY, end) != -1:
+        return None
+    if data.find(b"\\", start, end) == -1:
+        return data[start:end].decode("utf-8", errors="replace")
+    # 含转义序列时只解析这一个字符串字面量
+    try:
+        return json_loads(data[start - 1 : end + 1])
+    except ValueError:
+        return None
+
+
+def parse_sse_response(body: bytes) -> str:
     """解析 SSE 格式的响应
 
     Args:
-        text: SSE 格式文本
+        body: SSE 格式响应体
 
     Returns:
         str: 提取的内容
     """
-    content = ""
-    for line in text.split('\n'):
-        if line.startswith('data: '):
-            data_str = line[6:]
-            if data_str == "[DONE]":
-                break
-            try:
-                data = json.loads(data_str)
-                delta = data.get("choices", [{}])[0].get("delta", {})
-                content += delta.get("content", "")
-            except json.JSONDecodeError:
-                continue
-    return content
+    content_parts: list[str] = []
+    for data_str in iter_sse_data(body):
+        content = _scan_delta_content(data_str)
+        if content is not None:
+            content_parts.append(content)
+            continue
+        try:
+            data = json_loads(data_str)
+            delta = data.get("choices", [{}])[0].get("delta", {})
+            content_parts.append(delta.get("content") or "")
+        except ValueError:  # orjson / json 的解析错误均为 ValueError 子类
+            continue
+    return "".join(content_parts)
 
 
-def test_function_calling(api_url: str, api_key: str, model: str) -> dict:
+async def test_function_calling(client: ApiClient, api_url: str, api_key: str, model: str) -> dict:
     """测试 function calling 功能
 
     Returns:
@@ -154,70 +309,35 @@ def test_function_calling(api_url: str, api_key: str, model: str) -> dict:
                 "details": str
             }
     """
-    logger.info("")
-    logger.info("=" * 60)
+    logger.info(_SECTION)
     logger.info("测试 2: Function Calling 支持")
-    logger.info("=" * 60)
+    logger.info(_BANNER)
 
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
+    headers = {**_HEADERS_TEMPLATE, "Authorization": f"Bearer {api_key}"}
 
-    # 定义一个简单的工具
-    tools = [
-        {
-            "type": "function",
-            "function": {
-                "name": "get_weather",
-                "description": "获取指定城市的天气信息",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "city": {
-                            "type": "string",
-                            "description": "城市名称，如北京、上海"
-                        }
-                    },
-                    "required": ["city"]
-                }
-            }
-        }
-    ]
-
-    payload = {
-        "model": model,
-        "messages": [
-            {"role": "user", "content": "北京现在的天气怎么样？"}
-        ],
-        "tools": tools,
-        "tool_choice": "auto",
-        "stream": False,
-    }
+    body = build_body(_BODY_FC, model)
 
-    result = {
-        "supported": False,
-        "format": None,
-        "details": ""
-    }
+    result = {"supported": False, "format": None, "details": ""}
 
     try:
         logger.info("发送 function calling 请求...")
-        response = requests.post(api_url, headers=headers, json=payload, timeout=30)
-
-        if response.status_code != 200:
-            result["details"] = f"HTTP {response.status_code}: {response.text[:200]}"
-            logger.warning(f"❌ HTTP 状态码: {response.status_code}")
-            logger.warning(f"可能不支持 function calling")
+        chunks = client.stream("POST", api_url, headers=headers, content=body)
+        raw, data = await read_until_tool_call(chunks, _MAX_RESPONSE_BYTES)
+        if raw is None:
+            result["details"] = f"响应体超过 {_MAX_RESPONSE_BYTES} 字节"
+            logger.warning("⚠️  响应体超过 %d 字节，已中止读取", _MAX_RESPONSE_BYTES)
             return result
 
-        # 尝试解析 JSON 或 SSE
-        try:
-            data = response.json()
-        except json.JSONDecodeError:
+        # 尝试解析 JSON 或 SSE（SSE 中已检测到工具调用时 data 已就绪）
+        if data is None:
+            try:
+                data = json_loads(raw)
+            except ValueError:
+                data = None
+        if not isinstance(data, dict):
             # 尝试解析 SSE 格式
             logger.info("检测到流式响应，解析 SSE 格式...")
-            data = parse_sse_to_message(response.text)
+            data = parse_sse_to_message(raw)
             if not data:
                 result["details"] = "无法解析响应格式"
                 logger.error("❌ 无法解析 SSE 响应")
@@ -238,7 +358,7 @@ def test_function_calling(api_url: str, api_key: str, model: str) -> dict:
                 result["details"] = f"检测到 {len(tool_calls)} 个工具调用"
 
                 logger.info("✅ 支持 OpenAI 格式的 function calling")
-                logger.info(f"工具调用: {json.dumps(tool_calls, ensure_ascii=False, indent=2)}")
+                logger.info("工具调用: %s", json.dumps(tool_calls, ensure_ascii=False, indent=2))
                 return result
 
         # 检查是否有 function_call (旧格式)
@@ -254,48 +374,98 @@ def test_function_calling(api_url: str, api_key: str, model: str) -> dict:
         if content:
             result["details"] = f"未检测到工具调用，仅返回文本: {content[:100]}"
             logger.warning("⚠️  API 接受了 tools 参数但未返回工具调用")
-            logger.warning(f"响应内容: {content[:200]}")
+            logger.warning("响应内容: %.200s", content)
 
         return result
 
+    except HttpError as e:
+        result["details"] = f"HTTP {e.status_code}: {e.response.text()[:200]}"
+        logger.warning("❌ HTTP 状态码: %s", e.status_code)
+        logger.warning("可能不支持 function calling")
+        return result
     except Exception as e:
         result["details"] = f"请求异常: {str(e)}"
-        logger.error(f"❌ 测试失败: {e}")
+        logger.error("❌ 测试失败: %s", e)
         return result
 
 
-def parse_sse_to_message(text: str) -> dict:
+async def read_until_tool_call(
+    chunks: AsyncGenerator[bytes, None], limit: int
+) -> tuple[bytes | None, dict | None]:
+    """读取 function calling 响应；SSE 响应中一出现带函数名的 tool_calls 即停止读取并关闭连接
+
+    只用于判断是否支持 function calling：提前返回的工具调用是首个 delta 中的片段，
+    arguments 可能不完整。
+
+    Args:
+        chunks: ApiClient.stream() 返回的字节块生成器
+        limit: 允许的最大字节数
+
+    Returns:
+        tuple: (原始响应体, 提前检测到的响应)
+            - 检测到工具调用: (b"", {"choices": [{"message": {"tool_calls": [...]}}]})
+            - 读取完毕: (完整响应体, None)，由调用方按 JSON / SSE 解析
+            - 超过上限: (None, None)
+    """
+    buffer = bytearray()
+    parser: SSEParser | None = None
+    async with aclosing(chunks) as stream:
+        async for chunk in stream:
+            buffer += chunk
+            if len(buffer) > limit:
+                return None, None
+            if parser is None:
+                head = buffer.lstrip()[:1]
+                if head in (b"", b"{", b"["):
+                    # 普通 JSON 响应（或尚无法判断）：继续读取完整响应体
+                    continue
+                parser = SSEParser()
+                chunk = bytes(buffer)
+            for _, data_str in parser.feed(chunk):
+                if data_str == b"[DONE]":
+                    return bytes(buffer), None
+                try:
+                    delta = json_loads(data_str)["choices"][0].get("delta") or {}
+                except (ValueError, KeyError, IndexError, TypeError):
+                    continue
+                tool_calls = delta.get("tool_calls")
+                if tool_calls and (tool_calls[0].get("function") or {}).get("name"):
+                    return b"", {"choices": [{"message": {"tool_calls": tool_calls}}]}
+    return bytes(buffer), None
+
+
+def parse_sse_to_message(body: bytes) -> dict:
     """将 SSE 格式转换为消息格式
 
+    边解析边合并 delta；一旦工具调用完整（finish_reason 为 "tool_calls"）即返回，
+    不再解析之后的事件（如 usage 统计），因此返回的是到该时刻为止合并的消息。
+
     Args:
-        text: SSE 格式文本
+        body: SSE 格式响应体
 
     Returns:
         dict: 消息字典
     """
-    # 收集所有 delta
-    deltas = []
-    for line in text.split('\n'):
-        if line.startswith('data: '):
-            data_str = line[6:]
-            if data_str == "[DONE]":
-                break
-            try:
-                data = json.loads(data_str)
-                if "choices" in data and data["choices"]:
-                    delta = data["choices"][0].get("delta", {})
-                    deltas.append(delta)
-            except json.JSONDecodeError:
-                continue
-
-    # 合并 deltas
+    # 合并 deltas：片段先收集到列表，最后统一 join，避免字符串反复 += 的二次方开销
     merged = {"content": "", "role": "assistant"}
+    content_parts: list[str] = []
     tool_calls_parts = {}
+    name_parts: dict[int, list[str]] = {}
+    argument_parts: dict[int, list[str]] = {}
+
+    for data_str in iter_sse_data(body):
+        try:
+            data = json_loads(data_str)
+        except ValueError:  # orjson / json 的解析错误均为 ValueError 子类
+            continue
+        if not data.get("choices"):
+            continue
+        choice = data["choices"][0]
+        delta = choice.get("delta") or {}
 
-    for delta in deltas:
         # 合并 content
-        if "content" in delta:
-            merged["content"] += delta["content"]
+        if delta.get("content"):
+            content_parts.append(delta["content"])
 
         # 合并 role
         if "role" in delta:
@@ -309,8 +479,10 @@ def parse_sse_to_message(text: str) -> dict:
                     tool_calls_parts[idx] = {
                         "id": tc.get("id", ""),
                         "type": tc.get("type", "function"),
-                        "function": {"name": "", "arguments": ""}
+                        "function": {"name": "", "arguments": ""},
                     }
+                    name_parts[idx] = []
+                    argument_parts[idx] = []
 
                 if "id" in tc:
                     tool_calls_parts[idx]["id"] = tc["id"]
@@ -318,10 +490,19 @@ def parse_sse_to_message(text: str) -> dict:
                     tool_calls_parts[idx]["type"] = tc["type"]
                 if "function" in tc:
                     func = tc["function"]
-                    if "name" in func:
-                        tool_calls_parts[idx]["function"]["name"] += func["name"]
-                    if "arguments" in func:
-                        tool_calls_parts[idx]["function"]["arguments"] += func["arguments"]
+                    if func.get("name"):
+                        name_parts[idx].append(func["name"])
+                    if func.get("arguments"):
+                        argument_parts[idx].append(func["arguments"])
+
+        # 工具调用已完整，无需继续解析剩余事件
+        if tool_calls_parts and choice.get("finish_reason") == "tool_calls":
+            break
+
+    merged["content"] = "".join(content_parts)
+    for idx, tool_call in tool_calls_parts.items():
+        tool_call["function"]["name"] = "".join(name_parts[idx])
+        tool_call["function"]["arguments"] = "".join(argument_parts[idx])
 
     if tool_calls_parts:
         merged["tool_calls"] = [tool_calls_parts[i] for i in sorted(tool_calls_parts.keys())]
@@ -329,84 +510,79 @@ def parse_sse_to_message(text: str) -> dict:
     return {"choices": [{"message": merged}]} if merged else {}
 
 
-def test_streaming_function_calling(api_url: str, api_key: str, model: str) -> bool:
+async def test_streaming_function_calling(
+    client: ApiClient, api_url: str, api_key: str, model: str
+) -> bool:
     """测试流式 function calling
 
     Returns:
         bool: 是否支持流式 function calling
     """
-    logger.info("")
-    logger.info("=" * 60)
+    logger.info(_SECTION)
     logger.info("测试 3: 流式 Function Calling")
-    logger.info("=" * 60)
+    logger.info(_BANNER)
 
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
+    headers = {**_HEADERS_TEMPLATE, "Authorization": f"Bearer {api_key}"}
 
-    tools = [
-        {
-            "type": "function",
-            "function": {
-                "name": "get_time",
-                "description": "获取当前时间",
-                "parameters": {"type": "object", "properties": {}}
-            }
-        }
-    ]
-
-    payload = {
-        "model": model,
-        "messages": [
-            {"role": "user", "content": "现在几点了？"}
-        ],
-        "tools": tools,
-        "stream": True,
-    }
+    body = build_body(_BODY_STREAM_FC, model)
 
     try:
         logger.info("发送流式 function calling 请求...")
-        response = requests.post(api_url, headers=headers, json=payload, stream=True, timeout=30)
-
-        if response.status_code != 200:
-            logger.warning(f"❌ HTTP {response.status_code}")
-            return False
-
-        has_tool_call = False
-        for line in response.iter_lines():
-            if not line:
-                continue
-
-            line_str = line.decode("utf-8")
-            if line_str.startswith("data: "):
-                data_str = line_str[6:]
-                if data_str == "[DONE]":
-                    break
-
+        tool_call_chunks = 0
+        chunks = client.stream("POST", api_url, headers=headers, content=body, chunk_size=65536)
+        async with aclosing(aiter_sse_data(chunks)) as events:
+            async for data_str in events:
                 try:
-                    data = json.loads(data_str)
+                    data = json_loads(data_str)
                     delta = data.get("choices", [{}])[0].get("delta", {})
 
                     if "tool_calls" in delta:
-                        has_tool_call = True
-                        logger.info(f"检测到流式工具调用: {delta.get('tool_calls')}")
+                        # 每个 token 一条日志的开销远高于解析本身，只计数，明细仅在 DEBUG 级别输出
+                        tool_call_chunks += 1
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("流式工具调用片段: %s", delta["tool_calls"])
 
-                except json.JSONDecodeError:
+                except ValueError:  # orjson / json 的解析错误均为 ValueError 子类
                     continue
 
-        if has_tool_call:
+        if tool_call_chunks:
+            logger.info("检测到 %d 个 tool_calls 流式片段", tool_call_chunks)
             logger.info("✅ 支持流式 function calling")
             return True
         else:
             logger.warning("⚠️  未检测到流式工具调用")
             return False
 
+    except HttpError as e:
+        logger.warning("❌ HTTP %s", e.status_code)
+        return False
     except Exception as e:
-        logger.error(f"❌ 测试失败: {e}")
+        logger.error("❌ 测试失败: %s", e)
         return False
 
 
+async def aiter_sse_data(chunks: AsyncGenerator[bytes, None]) -> AsyncIterator[bytes]:
+    """边接收边解析流式 SSE 响应，逐个返回事件的 data，遇到 [DONE] 停止并关闭连接
+
+    Args:
+        chunks: 响应体字节块（如 ApiClient.stream() 的返回值）
+
+    Yields:
+        bytes: 单个事件的 data
+    """
+    parser = SSEParser()
+    async with aclosing(chunks):
+        async for chunk in chunks:
+            for _, data in parser.feed(chunk):
+                if data == b"[DONE]":
+                    return
+                yield data
+        for _, data in parser.flush():
+            if data == b"[DONE]":
+                return
+            yield data
+
+
 def generate_report(channel_name: str, results: dict) -> None:
     """生成测试报告
 
@@ -414,43 +590,88 @@ def generate_report(channel_name: str, results: dict) -> None:
         channel_name: 渠道名称
         results: 测试结果
     """
-    logger.info("")
-    logger.info("=" * 60)
-    logger.info(f"测试报告: {channel_name}")
-    logger.info("=" * 60)
+    logger.info(_SECTION)
+    logger.info("测试报告: %s", channel_name)
+    logger.info(_BANNER)
 
-    logger.info(f"基础对话: {'✅ 支持' if results['basic_chat'] else '❌ 不支持'}")
+    logger.info("基础对话: %s", "✅ 支持" if results["basic_chat"] else "❌ 不支持")
 
-    fc_result = results['function_calling']
-    if fc_result['supported']:
-        logger.info(f"Function Calling: ✅ 支持 ({fc_result['format']})")
-        logger.info(f"  详情: {fc_result['details']}")
+    fc_result = results["function_calling"]
+    if fc_result["supported"]:
+        logger.info("Function Calling: ✅ 支持 (%s)", fc_result["format"])
+        logger.info("  详情: %s", fc_result["details"])
     else:
-        logger.info(f"Function Calling: ❌ 不支持")
-        logger.info(f"  详情: {fc_result['details']}")
+        logger.info("Function Calling: ❌ 不支持")
+        logger.info("  详情: %s", fc_result["details"])
 
-    logger.info(f"流式 Function Calling: {'✅ 支持' if results['streaming_fc'] else '⚠️  未检测到'}")
+    logger.info(
+        "流式 Function Calling: %s", "✅ 支持" if results["streaming_fc"] else "⚠️  未检测到"
+    )
 
     logger.info("")
     logger.info("Agent 兼容性评估:")
 
-    if results['basic_chat'] and fc_result['supported']:
+    if results["basic_chat"] and fc_result["supported"]:
         logger.info("✅ 该 API 可以用于 OpenAI Agents SDK")
         logger.info("建议配置:")
         logger.info("  OPENAI_API_BASE=<该 API 的 URL>")
         logger.info("  OPENAI_API_KEY=<该 API 的 Key>")
         logger.info("  AGENT_MODEL=<该 API 的模型名>")
-    elif results['basic_chat']:
+    elif results["basic_chat"]:
         logger.warning("⚠️  该 API 支持基础对话但不支持 function calling")
         logger.warning("无法用于需要工具调用的 Agent 场景")
         logger.warning("建议使用支持 function calling 的 API 或模型")
     else:
         logger.error("❌ 该 API 连基础对话都不支持")
 
-    logger.info("=" * 60)
+    logger.info(_BANNER)
 
 
-def main():
+async def run_channel(client: ApiClient, index: int, channel_cfg: dict) -> tuple[str, dict] | None:
+    """测试单个渠道
+
+    Args:
+        client: 共享的 API 客户端
+        index: 渠道序号（从 1 开始）
+        channel_cfg: 渠道配置
+
+    Returns:
+        (渠道名称, 测试结果)，配置不完整时返回 None
+    """
+    channel_name = channel_cfg.get("name", f"channel_{index}")
+    api_url = channel_cfg.get("api_url")
+    api_key = channel_cfg.get("api_key")
+    model = channel_cfg.get("model", "gpt-5")
+
+    logger.info(_SECTION)
+    logger.info("测试渠道 %d/%d: %s", index, len(CHANNELS), channel_name)
+    logger.info("API URL: %s", api_url)
+    logger.info("Model: %s", model)
+    logger.info(_BANNER)
+
+    if not api_url or not api_key:
+        logger.error("❌ 缺少 API URL 或 API Key，跳过")
+        return None
+
+    # 三项测试互不依赖，并发执行：单个渠道的耗时取决于最慢的一项
+    basic, fc, sfc = await asyncio.gather(
+        test_basic_chat(client, api_url, api_key, model),
+        test_function_calling(client, api_url, api_key, model),
+        test_streaming_function_calling(client, api_url, api_key, model),
+        return_exceptions=True,
+    )
+    if isinstance(fc, BaseException):
+        fc = {"supported": False, "format": None, "details": f"请求异常: {fc}"}
+
+    results = {
+        "basic_chat": basic is True,
+        "function_calling": fc,
+        "streaming_fc": sfc is True,
+    }
+    return channel_name, results
+
+
+async def main():
     """主函数"""
     logger.info("🔍 API Agent 支持验证工具")
     logger.info("")
@@ -460,40 +681,22 @@ def main():
         logger.error("请检查 tests/unit/test_chat.py 中的 CHANNELS 配置")
         return
 
-    logger.info(f"找到 {len(CHANNELS)} 个渠道配置")
+    logger.info("找到 %d 个渠道配置", len(CHANNELS))
     logger.info("")
 
-    # 测试每个渠道
-    for i, channel_cfg in enumerate(CHANNELS, 1):
-        channel_name = channel_cfg.get("name", f"channel_{i}")
-        api_url = channel_cfg.get("api_url")
-        api_key = channel_cfg.get("api_key")
-        model = channel_cfg.get("model", "gpt-5")
-
-        logger.info(f"\n{'='*60}")
-        logger.info(f"测试渠道 {i}/{len(CHANNELS)}: {channel_name}")
-        logger.info(f"API URL: {api_url}")
-        logger.info(f"Model: {model}")
-        logger.info(f"{'='*60}")
-
-        if not api_url or not api_key:
-            logger.error("❌ 缺少 API URL 或 API Key，跳过")
-            continue
-
-        # 执行测试
-        results = {
-            "basic_chat": test_basic_chat(api_url, api_key, model),
-            "function_calling": test_function_calling(api_url, api_key, model),
-            "streaming_fc": False,
-        }
-
-        # 只有基础对话成功才测试流式
-        if results["basic_chat"] and results["function_calling"]["supported"]:
-            results["streaming_fc"] = test_streaming_function_calling(api_url, api_key, model)
+    # 并发测试所有渠道：总耗时取决于最慢的渠道，而不是各渠道耗时之和
+    # 所有渠道共享一个连接池：相同主机的请求复用 keep-alive 连接，免去重复的 TCP/TLS 握手；
+    # 总连接数放宽到 64，单主机仍限制为 16（aiohttp 的 limit_per_host），DNS 结果缓存 300 秒
+    async with ApiClient(timeout=30, max_connections=64, max_keepalive_connections=16) as client:
+        outcomes = await asyncio.gather(
+            *(run_channel(client, i, cfg) for i, cfg in enumerate(CHANNELS, 1))
+        )
 
-        # 生成报告
-        generate_report(channel_name, results)
+    # 按渠道顺序生成报告，避免并发日志交错
+    for outcome in outcomes:
+        if outcome is not None:
+            generate_report(*outcome)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -5,148 +5,217 @@
 1. 基础对话功能
 2. Function Calling 功能
 3. 与 DashScope 的集成
+
+测试 2、3 默认并发执行，设置 QWEN_VERIFY_SERIAL=1 可改为串行（基础对话失败时跳过测试 3）。
 """
 
+import io
 import os
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import TextIO
 
 # 添加项目路径
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
+# 报告分隔线
+_BANNER = "=" * 60
+_SECTION = "\n" + _BANNER
+
+# 测试 2、3 默认并发执行；部分 Qwen-Agent 版本非线程安全，可设置 QWEN_VERIFY_SERIAL=1 改为串行
+SERIAL = os.getenv("QWEN_VERIFY_SERIAL", "").lower() in ("1", "true", "yes")
+
+# Qwen-Agent 只导入一次，工具只注册一次；各测试只检查 QWEN_AVAILABLE
+try:
+    from qwen_agent.agents import Assistant
+    from qwen_agent.tools.base import BaseTool, register_tool
+
+    QWEN_AVAILABLE = True
+    QWEN_IMPORT_ERROR = ""
+except ImportError as e:
+    QWEN_AVAILABLE = False
+    QWEN_IMPORT_ERROR = str(e)
+
+if QWEN_AVAILABLE:
+
+    @register_tool("get_current_time")
+    class GetCurrentTime(BaseTool):
+        description = "获取当前时间"
+        parameters = []
+
+        def call(self, params: str, **kwargs) -> str:
+            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            return f"当前时间：{current_time}"
+
+
+@lru_cache(maxsize=4)
+def get_assistant(
+    model: str, system_message: str, function_list: tuple[str, ...] = ()
+) -> "Assistant":
+    """创建（并缓存）Assistant 实例，相同配置的测试复用同一个 Agent
+
+    Args:
+        model: 模型名称
+        system_message: 系统提示词
+        function_list: 工具名称列表
+
+    Returns:
+        Assistant 实例
+    """
+    return Assistant(
+        llm={"model": model},
+        system_message=system_message,
+        function_list=list(function_list) or None,
+    )
+
 
 def test_import():
     """测试 Qwen-Agent 是否能正常导入"""
-    print("=" * 60)
+    print(_BANNER)
     print("测试 1: 导入 Qwen-Agent")
-    print("=" * 60)
+    print(_BANNER)
 
-    try:
-        from qwen_agent.agents import Assistant
+    if QWEN_AVAILABLE:
         print("✅ 成功导入 qwen_agent.agents.Assistant")
         return True
-    except ImportError as e:
-        print(f"❌ 导入失败: {e}")
-        return False
+    print(f"❌ 导入失败: {QWEN_IMPORT_ERROR}")
+    return False
 
 
-def test_basic_conversation():
-    """测试基础对话功能"""
-    print("\n" + "=" * 60)
-    print("测试 2: 基础对话功能")
-    print("=" * 60)
+def test_basic_conversation(out: TextIO | None = None):
+    """测试基础对话功能
+
+    Args:
+        out: 输出流，None 表示标准输出
+    """
+    print(_SECTION, file=out)
+    print("测试 2: 基础对话功能", file=out)
+    print(_BANNER, file=out)
 
     # 检查 API Key
     api_key = os.getenv("DASHSCOPE_API_KEY")
     if not api_key:
-        print("❌ 未设置 DASHSCOPE_API_KEY 环境变量")
-        print("  请设置: export DASHSCOPE_API_KEY=sk-your-key")
+        print("❌ 未设置 DASHSCOPE_API_KEY 环境变量", file=out)
+        print("  请设置: export DASHSCOPE_API_KEY=sk-your-key", file=out)
         return False
 
-    print(f"API Key: {api_key[:10]}...{api_key[-4:]}")
+    print(f"API Key: {api_key[:10]}...{api_key[-4:]}", file=out)
 
     try:
-        from qwen_agent.agents import Assistant
-
         # 创建 Agent
-        bot = Assistant(
-            llm={'model': 'qwen-plus'},
-            system_message='你是一个有帮助的助手。请简洁回答问题。',
-        )
+        bot = get_assistant("qwen-plus", "你是一个有帮助的助手。请简洁回答问题。")
 
-        print("✅ Agent 创建成功")
+        print("✅ Agent 创建成功", file=out)
 
         # 测试对话
-        messages = [{'role': 'user', 'content': '你好，请简单介绍一下你自己'}]
+        messages = [{"role": "user", "content": "你好，请简单介绍一下你自己"}]
 
-        print("\n发送消息: 你好，请简单介绍一下你自己")
-        print("等待响应...")
+        print("\n发送消息: 你好，请简单介绍一下你自己", file=out)
+        print("等待响应...", file=out)
 
-        responses = []
-        for response in bot.run(messages):
-            responses.append(response)
-            print(f"收到响应: {response}")
+        # bot.run 每次增量都返回完整的累计响应，逐条打印会重复输出全部内容，只保留最后一条
+        responses = list(bot.run(messages))
+        print(f"收到 {len(responses)} 次增量响应", file=out)
 
         if responses:
             last_response = responses[-1]
-            print(f"\n✅ 对话成功")
-            print(f"最终响应: {last_response}")
+            print(f"\n✅ 对话成功", file=out)
+            print(f"最终响应: {last_response}", file=out)
             return True
         else:
-            print("❌ 未收到响应")
+            print("❌ 未收到响应", file=out)
             return False
 
     except Exception as e:
-        print(f"❌ 测试失败: {e}")
+        print(f"❌ 测试失败: {e}", file=out)
         import traceback
-        traceback.print_exc()
+
+        traceback.print_exc(file=out or sys.stdout)
         return False
 
 
-def test_function_calling():
-    """测试 Function Calling 功能"""
-    print("\n" + "=" * 60)
-    print("测试 3: Function Calling 功能")
-    print("=" * 60)
+def test_function_calling(out: TextIO | None = None):
+    """测试 Function Calling 功能
+
+    Args:
+        out: 输出流，None 表示标准输出
+    """
+    print(_SECTION, file=out)
+    print("测试 3: Function Calling 功能", file=out)
+    print(_BANNER, file=out)
 
     api_key = os.getenv("DASHSCOPE_API_KEY")
     if not api_key:
-        print("❌ 未设置 DASHSCOPE_API_KEY 环境变量")
+        print("❌ 未设置 DASHSCOPE_API_KEY 环境变量", file=out)
         return False
 
     try:
-        from qwen_agent.agents import Assistant
-        from qwen_agent.tools.base import BaseTool, register_tool
-
-        # 定义一个简单的工具
-        @register_tool('get_current_time')
-        class GetCurrentTime(BaseTool):
-            description = '获取当前时间'
-            parameters = []
-
-            def call(self, params: str, **kwargs) -> str:
-                from datetime import datetime
-                current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                return f"当前时间：{current_time}"
-
-        print("✅ 工具定义成功")
+        # 工具已在模块加载时注册
+        print("✅ 工具定义成功", file=out)
 
         # 创建带工具的 Agent
-        bot = Assistant(
-            llm={'model': 'qwen-plus'},
-            system_message='你是一个有帮助的助手。如果用户问时间，���调用 get_current_time 工具。',
-            function_list=['get_current_time'],
+        bot = get_assistant(
+            "qwen-plus",
+            "你是一个有帮助的助手。如果用户问时间，���调用 get_current_time 工具。",
+            ("get_current_time",),
         )
 
-        print("✅ Agent 创建成功（带工具）")
+        print("✅ Agent 创建成功（带工具）", file=out)
 
         # 测试工具调用
-        messages = [{'role': 'user', 'content': '现在几点了？'}]
+        messages = [{"role": "user", "content": "现在几点了？"}]
 
-        print("\n发送消息: 现在几点了？")
-        print("等待响应...")
+        print("\n发送消息: 现在几点了？", file=out)
+        print("等待响应...", file=out)
 
-        responses = []
-        for response in bot.run(messages):
-            responses.append(response)
-            print(f"收到响应: {response}")
+        responses = list(bot.run(messages))
 
         if responses:
-            print(f"\n✅ Function Calling 成功")
-            print(f"响应数量: {len(responses)}")
+            print(f"\n✅ Function Calling 成功", file=out)
+            print(f"响应数量: {len(responses)}", file=out)
+            print(f"最终响应: {responses[-1]}", file=out)
             return True
         else:
-            print("❌ 未收到响应")
+            print("❌ 未收到响应", file=out)
             return False
 
     except Exception as e:
-        print(f"❌ 测试失败: {e}")
+        print(f"❌ 测试失败: {e}", file=out)
         import traceback
-        traceback.print_exc()
+
+        traceback.print_exc(file=out or sys.stdout)
         return False
 
 
+def _captured(test: Callable[[TextIO | None], bool]) -> tuple[bool, str]:
+    """运行测试并把其输出写入独立缓冲区，并发执行时各测试的输出不会交错"""
+    out = io.StringIO()
+    return test(out), out.getvalue()
+
+
+def run_concurrently(*tests: Callable[[TextIO | None], bool]) -> list[bool]:
+    """在线程池中并发运行测试（bot.run 主要等待网络 IO），按传入顺序输出结果
+
+    Args:
+        tests: 测试函数（接收输出流参数 out）
+
+    Returns:
+        与 tests 顺序一致的测试结果
+    """
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [executor.submit(_captured, test) for test in tests]
+        outcomes = [future.result() for future in futures]
+
+    for _, output in outcomes:
+        print(output, end="")
+    return [passed for passed, _ in outcomes]
+
+
 def main():
     """运行所有测试"""
     print("🔍 Qwen-Agent 验证测试")
@@ -158,16 +227,21 @@ def main():
         "Function Calling": False,
     }
 
-    if results["导入测试"]:
+    if results["导入测试"] and SERIAL:
         results["基础对话"] = test_basic_conversation()
 
         if results["基础对话"]:
             results["Function Calling"] = test_function_calling()
+    elif results["导入测试"]:
+        # 两个测试只共享 API Key，互不依赖；并发执行时总耗时取决于较慢的一个
+        results["基础对话"], results["Function Calling"] = run_concurrently(
+            test_basic_conversation, test_function_calling
+        )
 
     # 打印总结
-    print("\n" + "=" * 60)
+    print(_SECTION)
     print("测试总结")
-    print("=" * 60)
+    print(_BANNER)
 
     for test_name, passed in results.items():
         status = "✅ 通过" if passed else "❌ 失败"
@@ -184,7 +258,7 @@ def main():
     else:
         print("\n⚠️  部分测试失败，请检查配置。")
 
-    print("=" * 60)
+    print(_BANNER)
 
     return all_passed
 